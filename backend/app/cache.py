@@ -0,0 +1,348 @@
+"""
+Application caches — pluggable key/value backends plus typed wrappers for
+monthly reports and authenticated principals.
+
+Backends store opaque strings so the in-process and Redis implementations
+behave identically (and cached dicts are never shared between requests).
+Select a backend with ``REPORT_CACHE_URL``:
+
+    memory://            bounded in-process LRU (default)
+    redis://host:6379/0  any Redis-protocol server (needs the ``redis`` package)
+"""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Optional
+from uuid import UUID
+
+from app.config import Settings, get_settings
+from app.repositories.budget_repository import BudgetSpend
+
+
+@dataclass
+class CacheStats:
+    """Counters used to tune cache size and TTL."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    # Hits on a report entry filled at an older data version (served as a miss).
+    stale: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class CacheBackend(ABC):
+    """Minimal string key/value interface every cache backend implements."""
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value or None (missing or expired)."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store *value* under *key* for at most *ttl_seconds*."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove *key* if present."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every key owned by this backend."""
+        pass
+
+
+class InMemoryLRUCache(CacheBackend):
+    """
+    Bounded, thread-safe LRU with per-entry expiry.
+
+    State is per process: with several workers each keeps its own copy, so
+    invalidation only reaches the worker that handled the write. Use the
+    Redis backend when running more than one worker.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.evictions += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            self.stats.sets += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache(CacheBackend):
+    """
+    Backend for any Redis-protocol server.
+
+    *client* only needs ``get``, ``set(key, value, ex=...)``, ``delete`` and
+    ``scan_iter``, so redis-py, valkey or a fake in tests all work. Keys are
+    namespaced with *prefix* so ``clear`` never touches foreign data.
+    Evictions happen server-side and are not visible here.
+    """
+
+    def __init__(self, client, prefix: str = "budget:"):
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return value.decode() if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self.client.set(self.prefix + key, value, ex=ttl_seconds)
+        self.stats.sets += 1
+
+    def delete(self, key: str) -> None:
+        if self.client.delete(self.prefix + key):
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+def build_cache_backend(url: str, max_entries: int) -> CacheBackend:
+    """Create a backend from a ``memory://`` or ``redis://`` URL."""
+    if url.startswith("memory://"):
+        return InMemoryLRUCache(max_entries=max_entries)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "REPORT_CACHE_URL uses Redis but the 'redis' package is not installed"
+            ) from e
+        return RedisCache(redis.Redis.from_url(url))
+    raise ValueError(f"Unsupported cache URL: {url}")
+
+
+class ReportCache:
+    """
+    Cache of monthly summary reports keyed by (user_id, month), plus the
+    budget-vs-spend figures behind ``/budgets/{month}/status``.
+
+    Writers must call ``invalidate`` after committing any change to a
+    user's incomes or expenses for that month, and ``invalidate_budget``
+    after changing the month's budget; the income, expense and budget
+    services do this for every write path they expose.
+
+    Invalidation alone is not enough: a read that started before a write
+    committed can store its result after the write invalidated the key.
+    Each entry therefore records the user's ``data_version`` read before it
+    was computed, and a lookup at any other version is a miss, so a fill
+    from before a write is never served after it.
+    """
+
+    _DECIMAL_FIELDS = ("total_income", "total_expenses", "net_balance")
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int = 300):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(user_id: UUID, month: str) -> str:
+        return f"report:{user_id}:{month}"
+
+    @staticmethod
+    def _budget_key(user_id: UUID, month: str) -> str:
+        return f"budget-status:{user_id}:{month}"
+
+    def _load(self, key: str, data_version: Optional[int]) -> Optional[Dict]:
+        raw = self.backend.get(key)
+        if raw is None:
+            return None
+        cached = json.loads(raw)
+        if cached.pop("data_version", None) != data_version:
+            self.backend.stats.stale += 1
+            return None
+        return cached
+
+    def _store(self, key: str, data_version: Optional[int], values: Dict) -> None:
+        self.backend.set(
+            key,
+            json.dumps({**values, "data_version": data_version}, default=str),
+            self.ttl_seconds,
+        )
+
+    def get_summary(
+        self, user_id: UUID, month: str, data_version: Optional[int] = None
+    ) -> Optional[Dict]:
+        """Return the summary cached at *data_version*, or None on a miss."""
+        summary = self._load(self._key(user_id, month), data_version)
+        if summary is None:
+            return None
+        for field in self._DECIMAL_FIELDS:
+            summary[field] = Decimal(summary[field])
+        summary["expenses_by_category"] = {
+            category: Decimal(total)
+            for category, total in summary["expenses_by_category"].items()
+        }
+        return summary
+
+    def set_summary(
+        self,
+        user_id: UUID,
+        month: str,
+        summary: Dict,
+        data_version: Optional[int] = None,
+    ) -> None:
+        """
+        Store a summary dict as produced by ReportService.
+
+        *data_version* must be the version read before the summary was
+        computed.
+        """
+        self._store(self._key(user_id, month), data_version, summary)
+
+    def get_budget_spend(
+        self, user_id: UUID, month: str, data_version: Optional[int] = None
+    ) -> Optional[BudgetSpend]:
+        """Return the budget figures cached at *data_version*, or None."""
+        cached = self._load(self._budget_key(user_id, month), data_version)
+        if cached is None:
+            return None
+        return BudgetSpend(
+            budget_id=UUID(cached["budget_id"]),
+            amount=Decimal(cached["amount"]),
+            spent=Decimal(cached["spent"]),
+        )
+
+    def set_budget_spend(
+        self,
+        user_id: UUID,
+        month: str,
+        spend: BudgetSpend,
+        data_version: Optional[int] = None,
+    ) -> None:
+        """Store the figures BudgetRepository.get_spend returned."""
+        self._store(self._budget_key(user_id, month), data_version, asdict(spend))
+
+    def invalidate(self, user_id: UUID, month: str) -> None:
+        """Drop the cached summary and budget spend for this user and month."""
+        self.backend.delete(self._key(user_id, month))
+        self.backend.delete(self._budget_key(user_id, month))
+
+    def invalidate_budget(self, user_id: UUID, month: str) -> None:
+        """Drop the cached budget spend only — the summary has no budget."""
+        self.backend.delete(self._budget_key(user_id, month))
+
+    def invalidate_date(self, user_id: UUID, value: date) -> None:
+        """Drop the cached summary for the month containing *value*."""
+        self.invalidate(user_id, value.strftime("%Y-%m"))
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of hit/miss/eviction counters."""
+        return self.backend.stats.as_dict()
+
+
+class PrincipalCache:
+    """
+    Short-lived record of user ids confirmed to exist, so that a verified
+    JWT does not cost a ``users`` SELECT on every authenticated request.
+
+    Always in-process: the TTL bounds how long a deleted user's still-valid
+    token keeps working on workers that did not perform the deletion.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def contains(self, user_id: UUID) -> bool:
+        """True if *user_id* was confirmed within the last TTL."""
+        return self.backend.get(str(user_id)) is not None
+
+    def remember(self, user_id: UUID) -> None:
+        """Record that *user_id* exists."""
+        self.backend.set(str(user_id), "1", self.ttl_seconds)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Forget *user_id* — call after deleting the user."""
+        self.backend.delete(str(user_id))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self.backend.stats.as_dict()
+
+
+def build_report_cache(settings: Settings) -> Optional[ReportCache]:
+    """Create the process-wide report cache, or None when disabled."""
+    if not settings.REPORT_CACHE_ENABLED:
+        return None
+    backend = build_cache_backend(
+        settings.REPORT_CACHE_URL, settings.REPORT_CACHE_MAX_ENTRIES
+    )
+    return ReportCache(backend, ttl_seconds=settings.REPORT_CACHE_TTL_SECONDS)
+
+
+def build_principal_cache(settings: Settings) -> Optional[PrincipalCache]:
+    """Create the process-wide principal cache, or None when TTL is 0."""
+    if settings.AUTH_USER_CACHE_TTL_SECONDS <= 0:
+        return None
+    return PrincipalCache(
+        InMemoryLRUCache(max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES),
+        ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    )
+
+
+# Shared instances used by the dependencies.
+report_cache = build_report_cache(get_settings())
+principal_cache = build_principal_cache(get_settings())
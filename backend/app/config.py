@@ -14,15 +14,101 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "postgresql://postgres:budget_pass@db:5432/budget_db"
 
+    # Serve budget/income/expense/report queries through an AsyncSession on
+    # the asyncpg driver so one worker can overlap in-flight queries.
+    # DATABASE_ASYNC_URL defaults to DATABASE_URL with the asyncpg driver.
+    DATABASE_ASYNC_ENABLED: bool = False
+    DATABASE_ASYNC_URL: str | None = None
+
+    # Connection pool, per worker process (and per engine: the async engine,
+    # when enabled, gets its own pool of the same size). python -m app.server
+    # checks WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW) against the
+    # server's max_connections minus DB_RESERVED_CONNECTIONS before starting.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_RESERVED_CONNECTIONS: int = 10
+
+    # Instrument pools, statements and requests: pool checkout wait and
+    # occupancy, per-statement latency, per-route phases. Statements at or
+    # above SLOW_QUERY_THRESHOLD_MS are logged (0 = off).
+    METRICS_ENABLED: bool = True
+    # /metrics (Prometheus text, not rate limited, hidden from the OpenAPI
+    # docs) is off until this is set; scrapers then send it as a bearer
+    # token. Counters are per process: single-worker deployments only.
+    METRICS_TOKEN: str = ""
+    SLOW_QUERY_THRESHOLD_MS: int = 500
+    # Send per-phase timings (db, pool, auth, serialize) in a Server-Timing
+    # response header. Off by default: it reveals server internals.
+    SERVER_TIMING_ENABLED: bool = False
+    # Render JSON with orjson (pip install orjson) and serve the expense
+    # listings straight from ORM rows, skipping response-model validation.
+    # Response bodies are unchanged.
+    FAST_JSON_ENABLED: bool = False
+    # Profile this fraction of live requests (0 = off) and aggregate per
+    # route; read results from /api/v1/admin/profiles. PROFILING_MODE is
+    # "cprofile" (exact, heavier) or "sampler" (stack sampling every
+    # PROFILING_SAMPLER_INTERVAL_MS).
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_MODE: str = "cprofile"
+    PROFILING_SAMPLER_INTERVAL_MS: int = 5
+    # Accounts allowed to use /api/v1/admin/* endpoints
+    ADMIN_EMAILS: list = []
+
+    # Production server (python -m app.server). Unset WEB_CONCURRENCY uses
+    # one worker per CPU core.
+    WEB_CONCURRENCY: int | None = None
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+
     # Set to True to initialize DB tables on startup (DEV ONLY)
     RUN_DB_INIT: bool = True
 
+    # Reports
+    # Serve /reports/summary from the monthly_rollups table. Writes always
+    # maintain rollups, and the add_monthly_rollups migration backfills
+    # them; disable to read the raw tables while repairing drift.
+    REPORT_ROLLUPS_ENABLED: bool = True
+    # Summary and budget-status cache keyed by (user, month); invalidated on
+    # income/expense/budget writes.
+    # memory:// is per-process — use redis://host:6379/0 with multiple workers
+    # (python -m app.server turns the memory:// cache off for several workers).
+    REPORT_CACHE_ENABLED: bool = True
+    REPORT_CACHE_URL: str = "memory://"
+    REPORT_CACHE_MAX_ENTRIES: int = 1024
+    REPORT_CACHE_TTL_SECONDS: int = 300
+    # Longest span (in months) one GET /reports/range call may cover
+    REPORT_RANGE_MAX_MONTHS: int = 24
+
+    # GET /expenses page size: default when ?limit is omitted, and hard cap
+    EXPENSE_PAGE_SIZE_DEFAULT: int = 50
+    EXPENSE_PAGE_SIZE_MAX: int = 200
+    # Recent expenses on GET /dashboard when ?recent is omitted (same cap)
+    DASHBOARD_RECENT_EXPENSES: int = 10
+
+    # Bulk import (/expenses/bulk, /incomes/bulk): rows and body bytes
+    # accepted per request
+    BULK_IMPORT_MAX_ROWS: int = 10000
+    BULK_IMPORT_MAX_BYTES: int = 8 * 1024 * 1024
+
+    # Exports: rows fetched per server-side cursor round trip (and per chunk)
+    EXPORT_BATCH_SIZE: int = 1000
+
     # Security
     # Development fallback exists; override in .env for all non-local deployments
     # Generate with: python -c "import secrets; print(secrets.token_hex(32))"
     SECRET_KEY: str = "dev-only-secret-change-before-any-deployment"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # How long get_current_user trusts that a token's user still exists
+    # without re-querying the users table. 0 disables the cache.
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10000
+    # bcrypt runs on a dedicated thread pool; requests beyond
+    # workers + queue depth are rejected with 503 instead of queueing.
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_DEPTH: int = 32
 
     # Rate limiting (all configurable via .env)
     RATE_LIMIT_ENABLED: bool = True
@@ -31,6 +117,27 @@ class Settings(BaseSettings):
     REGISTER_RATE_LIMIT: str = "3/minute"
     GLOBAL_RATE_LIMIT: str = "60/minute"
     REPORT_RATE_LIMIT: str = "10/minute"
+    EXPORT_RATE_LIMIT: str = "5/minute"
+    # Limits are keyed by the JWT subject on authenticated requests (client
+    # IP otherwise). On top of the per-route limits each caller has one
+    # budget shared by all API routes; a request spends its route's weight
+    # (route template relative to API_V1_PREFIX, default 1) from it.
+    USER_RATE_LIMIT: str = "300/minute"
+    RATE_LIMIT_ROUTE_COSTS: dict[str, int] = {
+        "/reports/summary": 5,
+        "/reports/range": 10,
+        "/dashboard": 5,
+        "/exports/transactions": 20,
+        "/expenses/bulk": 20,
+        "/incomes/bulk": 20,
+    }
+    # Where rate-limit counters live. memory:// is per-process, so N workers
+    # would allow N times each limit (python -m app.server refuses that);
+    # share counters across workers/containers with
+    # redis://host:6379/0 (needs the redis package) or postgresql:// (the app
+    # database; a full postgresql://... URL uses a separate database).
+    # fake://name is an in-process shared stand-in for tests.
+    RATE_LIMIT_STORAGE_URL: str = "memory://"
     LOGIN_LOCKOUT_MAX_ATTEMPTS: int = 5
     LOGIN_LOCKOUT_WINDOW_MINUTES: int = 15
 
@@ -3,6 +3,9 @@ from app.controllers.budget_controller import router as budget_router
 from app.controllers.income_controller import router as income_router
 from app.controllers.expense_controller import router as expense_router
 from app.controllers.report_controller import router as report_router
+from app.controllers.export_controller import router as export_router
+from app.controllers.admin_controller import router as admin_router
+from app.controllers.dashboard_controller import router as dashboard_router
 
 __all__ = [
     "auth_router",
@@ -10,4 +13,7 @@ __all__ = [
     "income_router",
     "expense_router",
     "report_router",
+    "export_router",
+    "admin_router",
+    "dashboard_router",
 ]
@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse, Response
+
+from app.schemas.error_schemas import ErrorResponse
+from app.schemas.auth_schemas import TokenData
+from app.dependencies import get_admin_user
+from app.profiling import profile_store
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+_ADMIN_RESPONSES = {
+    401: {"model": ErrorResponse, "description": "Unauthorized"},
+    403: {"model": ErrorResponse, "description": "Not an admin account"},
+}
+
+
+def _not_profiled(route: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"No profile data for route {route}",
+    )
+
+
+@router.get("/profiles", responses=_ADMIN_RESPONSES)
+async def list_profiles(admin: TokenData = Depends(get_admin_user)):
+    """
+    Routes with sampled profiles and how many requests each aggregates.
+
+    Data is per worker process and is collected only while
+    PROFILING_SAMPLE_RATE > 0.
+    """
+    return {"routes": profile_store.summary()}
+
+
+@router.get(
+    "/profiles/pstats",
+    response_class=PlainTextResponse,
+    responses={**_ADMIN_RESPONSES, 404: {"model": ErrorResponse}},
+)
+async def get_pstats(
+    route: str = Query(..., description="Route template, e.g. /api/v1/reports/summary"),
+    sort: str = Query(
+        "cumulative", pattern=r"^(cumulative|tottime|ncalls|time|calls)$"
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    binary: bool = Query(False, description="Marshalled stats for pstats/snakeviz"),
+    admin: TokenData = Depends(get_admin_user),
+):
+    """Aggregated cProfile statistics for one route (PROFILING_MODE=cprofile)."""
+    if binary:
+        dump = profile_store.pstats_dump(route)
+        if dump is None:
+            raise _not_profiled(route)
+        return Response(
+            dump,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": 'attachment; filename="profile.pstats"'},
+        )
+
+    text = profile_store.pstats_text(route, sort=sort, limit=limit)
+    if text is None:
+        raise _not_profiled(route)
+    return PlainTextResponse(text)
+
+
+@router.get(
+    "/profiles/collapsed",
+    response_class=PlainTextResponse,
+    responses={**_ADMIN_RESPONSES, 404: {"model": ErrorResponse}},
+)
+async def get_collapsed_stacks(
+    route: str = Query(..., description="Route template, e.g. /api/v1/reports/summary"),
+    admin: TokenData = Depends(get_admin_user),
+):
+    """Collapsed stacks for one route, ready for flamegraph.pl or speedscope."""
+    text = profile_store.collapsed(route)
+    if text is None:
+        raise _not_profiled(route)
+    return PlainTextResponse(text)
+
+
+@router.delete(
+    "/profiles",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses=_ADMIN_RESPONSES,
+)
+async def clear_profiles(admin: TokenData = Depends(get_admin_user)):
+    """Discard collected profiles, e.g. before measuring a change."""
+    profile_store.clear()
@@ -35,6 +35,7 @@ def _conditional_limit(limit_value: str):
         400: {"model": ErrorResponse, "description": "Validation error"},
         409: {"model": ErrorResponse, "description": "User already exists"},
         429: {"description": "Too many registration attempts"},
+        503: {"model": ErrorResponse, "description": "Password pool saturated"},
     },
 )
 @_conditional_limit(settings.REGISTER_RATE_LIMIT)
@@ -47,10 +48,15 @@ async def register(
     Register a new user.
 
     Rate limited to 3 requests per minute per IP to prevent
-    registration spam and account enumeration.
+    registration spam and account enumeration. The lookup and insert run
+    in the threadpool and the bcrypt hash is awaited on the bounded
+    password pool, so neither blocks the event loop and no threadpool
+    thread waits on bcrypt; a saturated pool returns 503.
     """
-    user = auth_service.register_user(
-        email=body.email, password=body.password, full_name=body.full_name
+    user = await auth_service.register_user_async(
+        email=body.email,
+        password=body.password,
+        full_name=body.full_name,
     )
     return UserRegisterResponse(id=user.id, email=user.email, full_name=user.full_name)
 
@@ -63,6 +69,7 @@ async def register(
         200: {"description": "Login successful, returns JWT token"},
         401: {"model": ErrorResponse, "description": "Invalid credentials or locked out"},
         429: {"description": "Too many login attempts — back off and retry"},
+        503: {"model": ErrorResponse, "description": "Password pool saturated"},
     },
 )
 @_conditional_limit(settings.LOGIN_RATE_LIMIT)
@@ -78,8 +85,11 @@ async def login(
     Additionally, the service layer enforces a per-email lockout after
     5 consecutive failures within a 15-minute window (application-level).
     Both controls must be bypassed for a brute-force attack to succeed.
+
+    The queries run in the threadpool and the bcrypt check is awaited on
+    the bounded password pool; returns 503 when the pool is saturated.
     """
-    access_token = auth_service.login_user(
+    access_token = await auth_service.login_user_async(
         email=body.email, password=body.password
     )
     return UserLoginResponse(access_token=access_token, token_type="bearer")
\ No newline at end of file
@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, Header, Path, Response, status
+from typing import Optional
 from uuid import UUID
 from app.schemas.budget_schemas import (
     BudgetCreateRequest,
     BudgetUpdateRequest,
     BudgetResponse,
+    BudgetStatusResponse,
 )
 from app.schemas.error_schemas import ErrorResponse
 from app.schemas.auth_schemas import TokenData
 from app.services.budget_service import BudgetService
-from app.dependencies import get_budget_service, get_current_user
+from app.services.data_version_service import DataVersionService
+from app.services.async_service import resolve
+from app.dependencies import (
+    get_budget_service,
+    get_current_user,
+    get_data_version_service,
+)
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
 
 router = APIRouter(prefix="/budgets", tags=["Budgets"])
 
@@ -41,9 +51,9 @@ async def create_budget(
     Creates a budget for the specified month. Only one budget
     per user per month is allowed.
     """
-    budget = budget_service.create_budget(
+    budget = await resolve(budget_service.create_budget(
         user_id=current_user.user_id, month=request.month, amount=request.amount
-    )
+    ))
 
     return budget
 
@@ -54,26 +64,79 @@ async def create_budget(
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Budget retrieved successfully"},
+        304: {"description": "Unchanged since the ETag sent in If-None-Match"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
         403: {"model": ErrorResponse, "description": "Access forbidden"},
         404: {"model": ErrorResponse, "description": "Budget not found"},
     },
 )
 async def get_current_month_budget(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: TokenData = Depends(get_current_user),
     budget_service: BudgetService = Depends(get_budget_service),
+    version_service: DataVersionService = Depends(get_data_version_service),
 ):
     """
     Retrieve the current month's budget for the authenticated user.
 
 
     Returns the budget details. Users can only access their own budgets.
+    The response carries a weak ETag; sending it back in If-None-Match
+    yields an empty 304 until the user's data changes or the month rolls
+    over.
     """
-    budget = budget_service.get_current_month_budget(user_id=current_user.user_id)
+    version = await resolve(
+        version_service.get_data_version(current_user.user_id)
+    )
+    etag = make_etag(
+        "budget-current-month",
+        version,
+        datetime.now(timezone.utc).strftime("%Y-%m"),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    budget = await resolve(
+        budget_service.get_current_month_budget(user_id=current_user.user_id)
+    )
 
+    set_etag(response, etag)
     return budget
 
 
+@router.get(
+    "/{month}/status",
+    response_model=BudgetStatusResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Budget status computed successfully"},
+        400: {"model": ErrorResponse, "description": "Invalid month format"},
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        404: {"model": ErrorResponse, "description": "Budget not found"},
+    },
+)
+async def get_budget_status(
+    month: str = Path(
+        ..., description="Month in YYYY-MM format", pattern=r"^\d{4}-\d{2}$"
+    ),
+    current_user: TokenData = Depends(get_current_user),
+    budget_service: BudgetService = Depends(get_budget_service),
+):
+    """
+    Compare a month's budget with what has been spent so far.
+
+    Returns the budget amount, spent-to-date, remaining budget, daily
+    burn rate and projected month-end spend in one call, replacing a
+    budget lookup plus a report summary on the client.
+    """
+    budget_status = await resolve(budget_service.get_budget_status(
+        user_id=current_user.user_id, month=month
+    ))
+
+    return BudgetStatusResponse(**budget_status)
+
+
 @router.get(
     "/{budgetId}",
     response_model=BudgetResponse,
@@ -95,9 +158,9 @@ async def get_budget(
 
     Returns the budget details. Users can only access their own budgets.
     """
-    budget = budget_service.get_budget_by_id(
+    budget = await resolve(budget_service.get_budget_by_id(
         budget_id=budgetId, user_id=current_user.user_id
-    )
+    ))
 
     return budget
 
@@ -129,8 +192,8 @@ async def update_budget(
     Updates the amount for an existing budget. Users can only
     update their own budgets.
     """
-    budget = budget_service.update_budget_amount(
+    budget = await resolve(budget_service.update_budget_amount(
         budget_id=budgetId, user_id=current_user.user_id, new_amount=request.amount
-    )
+    ))
 
     return budget
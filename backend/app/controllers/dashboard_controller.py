@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from typing import Optional
+from app.schemas.budget_schemas import BudgetStatusResponse
+from app.schemas.dashboard_schemas import DashboardResponse
+from app.schemas.error_schemas import ErrorResponse
+from app.schemas.expense_schemas import ExpenseResponse
+from app.schemas.report_schemas import MonthlySummaryResponse
+from app.schemas.auth_schemas import TokenData
+from app.services.dashboard_service import DashboardService
+from app.services.data_version_service import DataVersionService
+from app.services.async_service import resolve
+from app.dependencies import (
+    get_current_user,
+    get_dashboard_service,
+    get_data_version_service,
+)
+from app.config import get_settings
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
+
+settings = get_settings()
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get(
+    "",
+    response_model=DashboardResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Dashboard assembled successfully"},
+        304: {"description": "Unchanged since the ETag sent in If-None-Match"},
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+    },
+)
+async def get_dashboard(
+    response: Response,
+    recent: Optional[int] = Query(
+        None,
+        ge=1,
+        description=f"Recent expenses to include (default "
+        f"{settings.DASHBOARD_RECENT_EXPENSES}, capped at "
+        f"{settings.EXPENSE_PAGE_SIZE_MAX})",
+    ),
+    if_none_match: Optional[str] = Header(None),
+    current_user: TokenData = Depends(get_current_user),
+    dashboard_service: DashboardService = Depends(get_dashboard_service),
+    version_service: DataVersionService = Depends(get_data_version_service),
+):
+    """
+    Everything the home screen needs, in one round trip.
+
+    Returns the current month's budget status, summary (with category
+    totals) and most recent expenses. Responses carry a weak ETag built
+    from the caller's data version and today's date; send it back in
+    If-None-Match to get an empty 304, answered with a single primary-key
+    lookup, until a budget, income or expense write changes it.
+    """
+    recent_limit = min(
+        recent or settings.DASHBOARD_RECENT_EXPENSES, settings.EXPENSE_PAGE_SIZE_MAX
+    )
+
+    version = await resolve(
+        version_service.get_data_version(current_user.user_id)
+    )
+    etag = make_etag(
+        "dashboard", version, datetime.now(timezone.utc).date(), recent_limit
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    dashboard = await resolve(dashboard_service.get_dashboard(
+        user_id=current_user.user_id, recent_limit=recent_limit
+    ))
+
+    set_etag(response, etag)
+    budget = dashboard["budget"]
+    return DashboardResponse(
+        month=dashboard["month"],
+        budget=BudgetStatusResponse(**budget) if budget is not None else None,
+        summary=MonthlySummaryResponse(
+            **dashboard["summary"], generated_at=dashboard["generated_at"]
+        ),
+        recent_expenses=[
+            ExpenseResponse.model_validate(item)
+            for item in dashboard["recent_expenses"]
+        ],
+        generated_at=dashboard["generated_at"],
+    )
@@ -1,13 +1,36 @@
-from fastapi import APIRouter, Depends, status
-from typing import List
-from app.schemas.expense_schemas import ExpenseCreateRequest, ExpenseResponse
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from typing import List, Optional
+from app.schemas.expense_schemas import (
+    ExpenseCreateRequest,
+    ExpensePageResponse,
+    ExpenseResponse,
+)
+from app.schemas.bulk_schemas import BulkImportResponse
 from app.schemas.error_schemas import ErrorResponse
 from app.schemas.auth_schemas import TokenData
 from app.services.expense_service import ExpenseService
-from app.dependencies import get_expense_service, get_current_user
+from app.services.data_version_service import DataVersionService
+from app.services.async_service import resolve
+from app.dependencies import (
+    get_current_user,
+    get_data_version_service,
+    get_expense_service,
+)
+from app.config import get_settings
+from app.utils.bulk_import import bulk_openapi_body, parse_bulk_rows
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
+from app.responses import ResponseSerializer, trusted_response
+
+settings = get_settings()
 
 router = APIRouter(prefix="/expenses", tags=["Expenses"])
 
+# FAST_JSON_ENABLED: listings go straight from ORM rows to JSON.
+_EXPENSE_LIST = ResponseSerializer(List[ExpenseResponse])
+_EXPENSE_PAGE = ResponseSerializer(ExpensePageResponse)
+
 
 @router.post(
     "",
@@ -33,23 +56,141 @@ async def add_expense(
     Creates an expense record for the authenticated user with the
     specified amount, category, date, and optional note.
     """
-    expense = expense_service.add_expense(
+    expense = await resolve(expense_service.add_expense(
         user_id=current_user.user_id,
         amount=request.amount,
         category=request.category,
         expense_date=request.date,
         note=request.note,
-    )
+    ))
 
     return expense
 
 
+@router.get(
+    "",
+    response_model=ExpensePageResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Page of expenses, newest first"},
+        400: {
+            "model": ErrorResponse,
+            "description": "Invalid filter range or cursor",
+        },
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+    },
+)
+async def list_expenses(
+    date_from: Optional[date] = Query(
+        None, alias="from", description="Earliest expense date (inclusive)"
+    ),
+    date_to: Optional[date] = Query(
+        None, alias="to", description="Latest expense date (inclusive)"
+    ),
+    category: Optional[str] = Query(None, min_length=1, max_length=100),
+    min_amount: Optional[Decimal] = Query(None, ge=0),
+    max_amount: Optional[Decimal] = Query(None, ge=0),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        description=f"Page size (default {settings.EXPENSE_PAGE_SIZE_DEFAULT}, "
+        f"capped at {settings.EXPENSE_PAGE_SIZE_MAX})",
+    ),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    current_user: TokenData = Depends(get_current_user),
+    expense_service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    List the authenticated user's expenses, newest first.
+
+    Supports date-range, category and amount filters. Results are paged
+    with an opaque cursor: follow ``nextCursor`` until it is null.
+    Page sizes above EXPENSE_PAGE_SIZE_MAX are reduced to the cap.
+    """
+    page_size = min(
+        limit or settings.EXPENSE_PAGE_SIZE_DEFAULT, settings.EXPENSE_PAGE_SIZE_MAX
+    )
+    page = await resolve(expense_service.list_expenses(
+        user_id=current_user.user_id,
+        limit=page_size,
+        start_date=date_from,
+        end_date=date_to,
+        category=category,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        cursor=cursor,
+    ))
+
+    if settings.FAST_JSON_ENABLED:
+        return trusted_response(_EXPENSE_PAGE, page)
+    return ExpensePageResponse(
+        items=[ExpenseResponse.model_validate(item) for item in page["items"]],
+        next_cursor=page["next_cursor"],
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkImportResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=bulk_openapi_body(ExpenseCreateRequest),
+    responses={
+        200: {"description": "Valid rows imported; rejected rows listed"},
+        400: {
+            "model": ErrorResponse,
+            "description": "Unsupported body format or too many rows",
+        },
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+    },
+)
+async def add_expenses_bulk(
+    request: Request,
+    current_user: TokenData = Depends(get_current_user),
+    expense_service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    Import many expenses at once.
+
+    Accepts a JSON array, NDJSON (``application/x-ndjson``) or CSV with an
+    ``amount,category,date,note`` header. Every row is checked against the
+    same rules as ``POST /expenses``; valid rows are inserted in a single
+    transaction and invalid ones are returned with their row number.
+    """
+    rows, errors = await parse_bulk_rows(
+        request,
+        ExpenseCreateRequest,
+        settings.BULK_IMPORT_MAX_ROWS,
+        settings.BULK_IMPORT_MAX_BYTES,
+    )
+    result = await resolve(expense_service.add_expenses_bulk(
+        user_id=current_user.user_id,
+        rows=[
+            (
+                row,
+                {
+                    "amount": item.amount,
+                    "category": item.category,
+                    "expense_date": item.date,
+                    "note": item.note,
+                },
+            )
+            for row, item in rows
+        ],
+    ))
+
+    errors = sorted(errors + result["errors"], key=lambda e: e["row"])
+    return BulkImportResponse(
+        imported=result["imported"], failed=len(errors), errors=errors
+    )
+
+
 @router.get(
     "/current-month",
     response_model=List[ExpenseResponse],
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Expenses retrieved successfully"},
+        304: {"description": "Unchanged since the ETag sent in If-None-Match"},
         400: {
             "model": ErrorResponse,
             "description": "Validation error or invalid amount",
@@ -58,15 +199,36 @@ async def add_expense(
     },
 )
 async def get_current_month_expenses(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: TokenData = Depends(get_current_user),
     expense_service: ExpenseService = Depends(get_expense_service),
+    version_service: DataVersionService = Depends(get_data_version_service),
 ):
     """
     Retrieve current month's expenses for the authenticated user.
 
-    Returns a list of expense records for the current month.
+    Returns a list of expense records for the current month (UTC). The
+    response carries a weak ETag; sending it back in If-None-Match yields
+    an empty 304 until an expense, income or budget write or the month
+    rolls over.
     """
+    version = await resolve(
+        version_service.get_data_version(current_user.user_id)
+    )
+    etag = make_etag(
+        "expenses-current-month",
+        version,
+        datetime.now(timezone.utc).strftime("%Y-%m"),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
 
-    expenses = expense_service.get_current_month_expenses(user_id=current_user.user_id)
+    expenses = await resolve(
+        expense_service.get_current_month_expenses(user_id=current_user.user_id)
+    )
 
+    set_etag(response, etag)
+    if settings.FAST_JSON_ENABLED:
+        return trusted_response(_EXPENSE_LIST, expenses, response)
     return expenses
@@ -0,0 +1,72 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.schemas.error_schemas import ErrorResponse
+from app.schemas.auth_schemas import TokenData
+from app.services.export_service import ExportService
+from app.dependencies import get_export_service, get_current_user
+from app.config import get_settings
+from app.rate_limiter import limiter
+
+settings = get_settings()
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+def _conditional_limit(limit_value: str):
+    """Apply slowapi limit only when rate limiting is enabled."""
+    def _decorator(func):
+        if not settings.RATE_LIMIT_ENABLED:
+            return func
+        return limiter.limit(limit_value)(func)
+
+    return _decorator
+
+
+@router.get(
+    "/transactions",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Streamed export of incomes and expenses",
+            "content": {"text/csv": {}, "application/x-ndjson": {}},
+        },
+        400: {"model": ErrorResponse, "description": "Invalid format or date range"},
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        429: {"description": "Too many export requests"},
+    },
+)
+@_conditional_limit(settings.EXPORT_RATE_LIMIT)
+async def export_transactions(
+    request: Request,
+    date_from: Optional[date] = Query(
+        None, alias="from", description="Earliest transaction date (inclusive)"
+    ),
+    date_to: Optional[date] = Query(
+        None, alias="to", description="Latest transaction date (inclusive)"
+    ),
+    export_format: str = Query("csv", alias="format", description="csv or ndjson"),
+    current_user: TokenData = Depends(get_current_user),
+    export_service: ExportService = Depends(get_export_service),
+):
+    """
+    Download every income and expense in a date range, oldest first.
+
+    The body is streamed from a server-side cursor, so memory use does not
+    grow with the size of the export and the first bytes are sent before
+    the last rows have been read.
+    """
+    chunks = export_service.export_transactions(
+        user_id=current_user.user_id,
+        export_format=export_format,
+        start_date=date_from,
+        end_date=date_to,
+    )
+    filename = f"transactions.{export_format}"
+    return StreamingResponse(
+        chunks,
+        media_type=ExportService.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from app.schemas.income_schemas import IncomeCreateRequest, IncomeResponse
+from app.schemas.bulk_schemas import BulkImportResponse
 from app.schemas.error_schemas import ErrorResponse
 from app.schemas.auth_schemas import TokenData
 from app.services.income_service import IncomeService
+from app.services.async_service import resolve
 from app.dependencies import get_income_service, get_current_user
+from app.config import get_settings
+from app.utils.bulk_import import bulk_openapi_body, parse_bulk_rows
+
+settings = get_settings()
 
 router = APIRouter(prefix="/incomes", tags=["Income"])
 
@@ -32,11 +38,65 @@ async def add_income(
     Creates an income record for the authenticated user with the
     specified amount, source, and date.
     """
-    income = income_service.add_income(
+    income = await resolve(income_service.add_income(
         user_id=current_user.user_id,
         amount=request.amount,
         source=request.source,
         income_date=request.date,
-    )
+    ))
 
     return income
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkImportResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=bulk_openapi_body(IncomeCreateRequest),
+    responses={
+        200: {"description": "Valid rows imported; rejected rows listed"},
+        400: {
+            "model": ErrorResponse,
+            "description": "Unsupported body format or too many rows",
+        },
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+    },
+)
+async def add_incomes_bulk(
+    request: Request,
+    current_user: TokenData = Depends(get_current_user),
+    income_service: IncomeService = Depends(get_income_service),
+):
+    """
+    Import many income records at once.
+
+    Accepts a JSON array, NDJSON (``application/x-ndjson``) or CSV with an
+    ``amount,source,date`` header. Every row is checked against the same
+    rules as ``POST /incomes``; valid rows are inserted in a single
+    transaction and invalid ones are returned with their row number.
+    """
+    rows, errors = await parse_bulk_rows(
+        request,
+        IncomeCreateRequest,
+        settings.BULK_IMPORT_MAX_ROWS,
+        settings.BULK_IMPORT_MAX_BYTES,
+    )
+    result = await resolve(income_service.add_incomes_bulk(
+        user_id=current_user.user_id,
+        rows=[
+            (
+                row,
+                {
+                    "amount": item.amount,
+                    "source": item.source,
+                    "income_date": item.date,
+                },
+            )
+            for row, item in rows
+        ],
+    ))
+
+    errors = sorted(errors + result["errors"], key=lambda e: e["row"])
+    return BulkImportResponse(
+        imported=result["imported"], failed=len(errors), errors=errors
+    )
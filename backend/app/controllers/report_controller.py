@@ -1,12 +1,20 @@
-from fastapi import APIRouter, Depends, Request, status, Query
+from fastapi import APIRouter, Depends, Header, Request, Response, status, Query
+from typing import Optional
 
-from app.schemas.report_schemas import MonthlySummaryResponse
+from app.schemas.report_schemas import MonthlySummaryResponse, RangeSummaryResponse
 from app.schemas.error_schemas import ErrorResponse
 from app.schemas.auth_schemas import TokenData
 from app.services.report_service import ReportService
-from app.dependencies import get_report_service, get_current_user
+from app.services.data_version_service import DataVersionService
+from app.services.async_service import resolve
+from app.dependencies import (
+    get_current_user,
+    get_data_version_service,
+    get_report_service,
+)
 from app.config import get_settings
 from app.rate_limiter import limiter
+from app.utils.etag import etag_matches, make_etag, not_modified, set_etag
 
 settings = get_settings()
 router = APIRouter(prefix="/reports", tags=["Reports"])
@@ -28,6 +36,7 @@ def _conditional_limit(limit_value: str):
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Monthly summary generated successfully"},
+        304: {"description": "Unchanged since the ETag sent in If-None-Match"},
         400: {"model": ErrorResponse, "description": "Invalid month format"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
         429: {"description": "Too many report requests"},
@@ -36,28 +45,99 @@ def _conditional_limit(limit_value: str):
 @_conditional_limit(settings.REPORT_RATE_LIMIT)
 async def get_monthly_summary(
     request: Request,
+    response: Response,
     month: str = Query(
         ..., description="Month in YYYY-MM format", pattern=r"^\d{4}-\d{2}$"
     ),
+    if_none_match: Optional[str] = Header(None),
     current_user: TokenData = Depends(get_current_user),
     report_service: ReportService = Depends(get_report_service),
+    version_service: DataVersionService = Depends(get_data_version_service),
 ):
     """
     Generate monthly summary report.
 
     Rate limited to 10 requests per minute — tighter than the global
     60/min default because this endpoint aggregates all financial data
-    for a month and is the highest-value scraping target.
+    for a month and is the highest-value scraping target. Revalidations
+    count against the limit too.
+
+    The response carries a weak ETag; sending it back in If-None-Match
+    yields an empty 304 until an income or expense write changes the
+    user's data version.
     """
-    summary = report_service.get_monthly_summary(
-        user_id=current_user.user_id, month=month
+    version = await resolve(
+        version_service.get_data_version(current_user.user_id)
     )
+    etag = make_etag("report-summary", version, month)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    summary = await resolve(report_service.get_monthly_summary(
+        user_id=current_user.user_id, month=month
+    ))
 
+    set_etag(response, etag)
     return MonthlySummaryResponse(
         month=summary["month"],
         total_income=summary["total_income"],
         total_expenses=summary["total_expenses"],
         net_balance=summary["net_balance"],
         expenses_by_category=summary["expenses_by_category"],
-        generated_at=report_service.utc_now(),
-    )
\ No newline at end of file
+        generated_at=await resolve(report_service.utc_now()),
+    )
+
+
+@router.get(
+    "/range",
+    response_model=RangeSummaryResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Range summary generated successfully"},
+        400: {"model": ErrorResponse, "description": "Invalid month or range"},
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        429: {"description": "Too many report requests"},
+    },
+)
+@_conditional_limit(settings.REPORT_RATE_LIMIT)
+async def get_range_summary(
+    request: Request,
+    start_month: str = Query(
+        ...,
+        alias="from",
+        description="First month in YYYY-MM format",
+        pattern=r"^\d{4}-\d{2}$",
+    ),
+    end_month: str = Query(
+        ...,
+        alias="to",
+        description="Last month in YYYY-MM format (inclusive)",
+        pattern=r"^\d{4}-\d{2}$",
+    ),
+    current_user: TokenData = Depends(get_current_user),
+    report_service: ReportService = Depends(get_report_service),
+):
+    """
+    Generate per-month summaries for a span of months in one request.
+
+    Shares the report rate limit; a yearly chart costs one call here
+    instead of twelve to /reports/summary.
+    """
+    summary = await resolve(report_service.get_range_summary(
+        user_id=current_user.user_id, start_month=start_month, end_month=end_month
+    ))
+    generated_at = await resolve(report_service.utc_now())
+
+    return RangeSummaryResponse(
+        start_month=summary["start_month"],
+        end_month=summary["end_month"],
+        total_income=summary["total_income"],
+        total_expenses=summary["total_expenses"],
+        net_balance=summary["net_balance"],
+        expenses_by_category=summary["expenses_by_category"],
+        months=[
+            MonthlySummaryResponse(**month, generated_at=generated_at)
+            for month in summary["months"]
+        ],
+        generated_at=generated_at,
+    )
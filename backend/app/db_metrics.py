@@ -0,0 +1,138 @@
+"""
+SQLAlchemy instrumentation: pool checkout wait, pool occupancy, and
+per-statement latency keyed by a normalized statement fingerprint.
+
+Engines opt in by using one of the instrumented pool classes and calling
+``instrument_engine``; ``app/models/base.py`` does both when
+``METRICS_ENABLED`` is true. Statements slower than
+``SLOW_QUERY_THRESHOLD_MS`` are logged with their fingerprint.
+"""
+
+import logging
+import re
+import time
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.config import get_settings
+from app.metrics import record_phase, registry
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_MAX_LENGTH = 200
+
+POOL_CHECKOUT_SECONDS = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled connection (includes new connects).",
+    ("pool",),
+)
+POOL_CONNECTIONS = registry.gauge(
+    "db_pool_connections",
+    "Connections per pool by state (in_use, idle, overflow, size).",
+    ("pool", "state"),
+)
+STATEMENT_SECONDS = registry.histogram(
+    "db_statement_seconds",
+    "Statement execution latency by normalized statement fingerprint.",
+    ("pool", "fingerprint"),
+    max_series=500,
+)
+SLOW_STATEMENTS = registry.counter(
+    "db_slow_statements_total",
+    "Statements slower than SLOW_QUERY_THRESHOLD_MS.",
+    ("pool",),
+)
+
+_PARAM_RE = re.compile(
+    r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?|__\[POSTCOMPILE_\w+\]"
+)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_RE = re.compile(r"(VALUES\s*\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+", re.IGNORECASE)
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape: literals and bind parameters
+    become ``?``, IN-lists and multi-row VALUES collapse, whitespace is
+    normalized, and the result is capped at FINGERPRINT_MAX_LENGTH.
+    """
+    text = _STRING_RE.sub("?", statement)
+    text = _PARAM_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _LIST_RE.sub("(...)", text)
+    text = _VALUES_RE.sub(r"\1", text)
+    text = _SPACE_RE.sub(" ", text).strip()
+    return text[:FINGERPRINT_MAX_LENGTH]
+
+
+class _TimedCheckoutMixin:
+    """Times ``_do_get``: the wait for an idle connection or a new connect."""
+
+    metrics_label = "sync"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            POOL_CHECKOUT_SECONDS.observe(elapsed, self.metrics_label)
+            record_phase("pool", elapsed)
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+def _register_pool_gauges(engine: Engine, label: str) -> None:
+    # Read engine.pool at scrape time: dispose() swaps in a fresh pool.
+    POOL_CONNECTIONS.set_function(lambda: engine.pool.checkedout(), label, "in_use")
+    POOL_CONNECTIONS.set_function(lambda: engine.pool.checkedin(), label, "idle")
+    POOL_CONNECTIONS.set_function(
+        lambda: max(engine.pool.overflow(), 0), label, "overflow"
+    )
+    POOL_CONNECTIONS.set_function(lambda: engine.pool.size(), label, "size")
+
+
+def instrument_engine(engine: Engine, label: str) -> None:
+    """Attach statement timing and pool gauges to a (sync) engine."""
+    _register_pool_gauges(engine, label)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("metrics_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        shape = fingerprint(statement)
+        STATEMENT_SECONDS.observe(elapsed, label, shape)
+        record_phase("db", elapsed)
+
+        threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+        if threshold_ms and elapsed * 1000 >= threshold_ms:
+            SLOW_STATEMENTS.inc(1, label)
+            logger.warning(
+                "Slow query (%.1f ms) on %s pool: %s", elapsed * 1000, label, shape
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("metrics_query_start"):
+            conn.info["metrics_query_start"].pop()
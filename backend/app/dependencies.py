@@ -1,26 +1,40 @@
-from fastapi import Depends, HTTPException, status
+from typing import Callable, TypeVar
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from uuid import UUID
-from app.models.base import get_db
+from app.models.base import AsyncSessionLocal, SessionLocal, get_db
+from app.config import get_settings
+from app.cache import ReportCache, report_cache, principal_cache
 from app.repositories import (
     UserRepository,
     BudgetRepository,
     IncomeRepository,
     ExpenseRepository,
     LoginAttemptRepository,
+    ReportRepository,
+    MonthlyRollupRepository,
+    DataVersionRepository,
 )
 from app.services import (
     BudgetService,
     IncomeService,
     ExpenseService,
     ReportService,
+    ExportService,
+    DashboardService,
+    DataVersionService,
 )
 from app.services.auth_service import AuthService
-from app.utils.security import decode_access_token
+from app.services.async_service import AsyncService
+from app.utils.security import decode_access_token, password_pool
 from app.schemas.auth_schemas import TokenData
 
+settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
+S = TypeVar("S")
 
 
 # ── Repository dependencies ──────────────────────────────────────────────────
@@ -44,6 +58,36 @@ def get_login_attempt_repository(
     return LoginAttemptRepository(db)
 
 
+def get_report_repository(db: Session = Depends(get_db)) -> ReportRepository:
+    return ReportRepository(db)
+
+
+def get_monthly_rollup_repository(
+    db: Session = Depends(get_db),
+) -> MonthlyRollupRepository:
+    return MonthlyRollupRepository(db)
+
+
+def get_data_version_repository(
+    db: Session = Depends(get_db),
+) -> DataVersionRepository:
+    return DataVersionRepository(db)
+
+
+async def get_optional_async_db():
+    """An AsyncSession when DATABASE_ASYNC_ENABLED, otherwise None."""
+    if not settings.DATABASE_ASYNC_ENABLED:
+        yield None
+        return
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_report_cache() -> ReportCache | None:
+    """Process-wide report cache (None when REPORT_CACHE_ENABLED=false)."""
+    return report_cache
+
+
 # ── Service dependencies ─────────────────────────────────────────────────────
 
 def get_auth_service(
@@ -53,28 +97,112 @@ def get_auth_service(
     ),
 ) -> AuthService:
     """AuthService now receives LoginAttemptRepository for DB-backed lockout."""
-    return AuthService(user_repository, login_attempt_repository)
+    return AuthService(
+        user_repository, login_attempt_repository, principal_cache, password_pool
+    )
+
+
+# The data services below run on the sync Session, or, with
+# DATABASE_ASYNC_ENABLED, on an AsyncSession through AsyncService. Auth stays
+# synchronous: get_current_user is a plain def (run in the threadpool) and
+# login/register run in the threadpool with bcrypt on password_pool.
+
+def _on_session(
+    db: Session, async_db: AsyncSession | None, build: Callable[[Session], S]
+) -> S | AsyncService[S]:
+    """
+    Build a service on the request's session.
+
+    With DATABASE_ASYNC_ENABLED the service is wrapped in AsyncService and
+    each call runs on the AsyncSession; the unused sync Session never
+    checks out a connection. Controllers ``await resolve(...)`` either way.
+    """
+    if async_db is not None:
+        return AsyncService(async_db, build)
+    return build(db)
+
+
+def _budget_service(s: Session, cache: ReportCache | None) -> BudgetService:
+    return BudgetService(BudgetRepository(s), cache, DataVersionRepository(s))
+
 
 def get_budget_service(
-    budget_repository: BudgetRepository = Depends(get_budget_repository),
+    db: Session = Depends(get_db),
+    async_db: AsyncSession | None = Depends(get_optional_async_db),
+    cache: ReportCache | None = Depends(get_report_cache),
 ) -> BudgetService:
-    return BudgetService(budget_repository)
+    return _on_session(db, async_db, lambda s: _budget_service(s, cache))
 
 def get_income_service(
-    income_repository: IncomeRepository = Depends(get_income_repository),
+    db: Session = Depends(get_db),
+    async_db: AsyncSession | None = Depends(get_optional_async_db),
+    cache: ReportCache | None = Depends(get_report_cache),
 ) -> IncomeService:
-    return IncomeService(income_repository)
+    return _on_session(
+        db, async_db, lambda s: IncomeService(IncomeRepository(s), cache)
+    )
 
 def get_expense_service(
-    expense_repository: ExpenseRepository = Depends(get_expense_repository),
+    db: Session = Depends(get_db),
+    async_db: AsyncSession | None = Depends(get_optional_async_db),
+    cache: ReportCache | None = Depends(get_report_cache),
 ) -> ExpenseService:
-    return ExpenseService(expense_repository)
+    return _on_session(
+        db, async_db, lambda s: ExpenseService(ExpenseRepository(s), cache)
+    )
+
+
+def _report_service(s: Session, cache: ReportCache | None) -> ReportService:
+    return ReportService(
+        IncomeRepository(s),
+        ExpenseRepository(s),
+        ReportRepository(s),
+        MonthlyRollupRepository(s) if settings.REPORT_ROLLUPS_ENABLED else None,
+        cache,
+        max_range_months=settings.REPORT_RANGE_MAX_MONTHS,
+        data_version_repository=DataVersionRepository(s),
+    )
 
 def get_report_service(
-    income_repository: IncomeRepository = Depends(get_income_repository),
-    expense_repository: ExpenseRepository = Depends(get_expense_repository),
+    db: Session = Depends(get_db),
+    async_db: AsyncSession | None = Depends(get_optional_async_db),
+    cache: ReportCache | None = Depends(get_report_cache),
 ) -> ReportService:
-    return ReportService(income_repository, expense_repository)
+    return _on_session(db, async_db, lambda s: _report_service(s, cache))
+
+
+def get_dashboard_service(
+    db: Session = Depends(get_db),
+    async_db: AsyncSession | None = Depends(get_optional_async_db),
+    cache: ReportCache | None = Depends(get_report_cache),
+) -> DashboardService:
+    """
+    The composed services share one session; in async mode the whole
+    dashboard runs in a single run_sync.
+    """
+    return _on_session(
+        db,
+        async_db,
+        lambda s: DashboardService(
+            _budget_service(s, cache),
+            _report_service(s, cache),
+            ExpenseService(ExpenseRepository(s), cache),
+        ),
+    )
+
+
+def get_data_version_service(
+    db: Session = Depends(get_db),
+    async_db: AsyncSession | None = Depends(get_optional_async_db),
+) -> DataVersionService:
+    return _on_session(
+        db, async_db, lambda s: DataVersionService(DataVersionRepository(s))
+    )
+
+
+def get_export_service() -> ExportService:
+    """Exports outlive the request, so they get a session factory, not get_db."""
+    return ExportService(SessionLocal, batch_size=settings.EXPORT_BATCH_SIZE)
 
 
 # ── Auth dependency ──────────────────────────────────────────────────────────
@@ -82,14 +210,24 @@ def get_report_service(
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service),
+    request: Request = None,
 ) -> TokenData:
     """
     Validate JWT token and return current user data.
 
+    The user-exists check is skipped for ids confirmed within the last
+    AUTH_USER_CACHE_TTL_SECONDS, so most requests make no users query.
+    When the rate limiter already decoded this token for the request, its
+    payload is reused rather than verified again.
+
     Raises:
         HTTPException: If token is invalid or expired.
     """
-    payload = decode_access_token(token)
+    cached = getattr(request.state, "token_payload", None) if request else None
+    if cached is not None and cached[0] == token:
+        payload = cached[1]
+    else:
+        payload = decode_access_token(token)
 
     if payload is None:
         raise HTTPException(
@@ -109,13 +247,16 @@ def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        user = auth_service.get_user_by_id(user_id)
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        if principal_cache is None or not principal_cache.contains(user_id):
+            user = auth_service.get_user_by_id(user_id)
+            if user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            if principal_cache is not None:
+                principal_cache.remember(user_id)
 
         return TokenData(user_id=user_id, email=email)
 
@@ -124,4 +265,15 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token format",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
+
+
+def get_admin_user(current_user: TokenData = Depends(get_current_user)) -> TokenData:
+    """Allow only accounts listed in ADMIN_EMAILS (403 otherwise)."""
+    admins = {email.lower() for email in settings.ADMIN_EMAILS}
+    if current_user.email.lower() not in admins:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+    return current_user
@@ -1,8 +1,12 @@
 
 
-from fastapi import FastAPI, HTTPException, Request
+import secrets
+from typing import Optional
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from contextlib import asynccontextmanager
 from slowapi.errors import RateLimitExceeded
@@ -10,13 +14,17 @@ from slowapi.middleware import SlowAPIMiddleware
 
 from app.config import get_settings
 from app.models import init_db
-from app.rate_limiter import limiter
+from app.rate_limiter import enforce_user_budget, limiter
+from app.metrics import PROMETHEUS_CONTENT_TYPE, registry as metrics_registry
 from app.controllers import (
     auth_router,
     budget_router,
     income_router,
     expense_router,
     report_router,
+    export_router,
+    admin_router,
+    dashboard_router,
 )
 from app.middleware.error_handler import (
     rate_limit_exception_handler,
@@ -26,7 +34,12 @@ from app.middleware.error_handler import (
     sqlalchemy_error_handler,
     general_exception_handler,
     http_exception_handler,
+    password_pool_saturated_handler,
 )
+from app.middleware.timing import RequestTimingMiddleware
+from app.responses import json_response_class
+from app.profiling import ProfilingMiddleware
+from app.utils.security import PasswordPoolSaturated, password_pool
 
 settings = get_settings()
 
@@ -46,6 +59,7 @@ async def lifespan(_: FastAPI):
     """Initialize shared resources at app startup."""
     init_db()
     yield
+    password_pool.shutdown()
 
 
 app = FastAPI(
@@ -53,6 +67,10 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Cross-Platform Budgeting Application API",
     lifespan=lifespan,
+    default_response_class=json_response_class(settings.FAST_JSON_ENABLED),
+    dependencies=(
+        [Depends(enforce_user_budget)] if settings.RATE_LIMIT_ENABLED else []
+    ),
 )
 
 # ---------------------------------------------------------------------------
@@ -71,10 +89,24 @@ app.add_middleware(
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT"],
-    allow_headers=["Authorization", "Content-Type"],
-    expose_headers=[],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
+if settings.PROFILING_SAMPLE_RATE > 0:
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        mode=settings.PROFILING_MODE,
+        sampler_interval=settings.PROFILING_SAMPLER_INTERVAL_MS / 1000,
+    )
+
+# Added last so it wraps everything else, including rate limiting and CORS.
+if settings.METRICS_ENABLED:
+    app.add_middleware(
+        RequestTimingMiddleware, server_timing=settings.SERVER_TIMING_ENABLED
+    )
+
 # Exception handlers
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(ValueError, value_error_handler)
@@ -82,6 +114,7 @@ app.add_exception_handler(IntegrityError, integrity_error_handler)
 app.add_exception_handler(SQLAlchemyError, sqlalchemy_error_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 app.add_exception_handler(HTTPException, http_exception_handler)
+app.add_exception_handler(PasswordPoolSaturated, password_pool_saturated_handler)
 
 # Routers
 app.include_router(auth_router, prefix=settings.API_V1_PREFIX)
@@ -89,8 +122,9 @@ app.include_router(budget_router, prefix=settings.API_V1_PREFIX)
 app.include_router(income_router, prefix=settings.API_V1_PREFIX)
 app.include_router(expense_router, prefix=settings.API_V1_PREFIX)
 app.include_router(report_router, prefix=settings.API_V1_PREFIX)
-
-
+app.include_router(export_router, prefix=settings.API_V1_PREFIX)
+app.include_router(admin_router, prefix=settings.API_V1_PREFIX)
+app.include_router(dashboard_router, prefix=settings.API_V1_PREFIX)
 
 
 if settings.TEST_ENDPOINTS_ENABLED:
@@ -100,6 +134,7 @@ if settings.TEST_ENDPOINTS_ENABLED:
     async def ratelimit_test(request: Request):
         return {"message": "ok"}
 
+
 # Health check endpoint (must be after all routers and test endpoints)
 @app.get("/health", tags=["Health"])
 @limiter.exempt
@@ -111,6 +146,25 @@ async def health_check():
         "version": settings.APP_VERSION,
     }
 
+
+if settings.METRICS_ENABLED:
+    # Internal scrape target: 404 unless METRICS_TOKEN is set, then bearer
+    # auth. Counters are per process, so python -m app.server refuses to
+    # serve it from more than one worker.
+    @app.get("/metrics", include_in_schema=False)
+    @limiter.exempt
+    async def metrics(authorization: Optional[str] = Header(None)):
+        """Prometheus text-format metrics (Authorization: Bearer METRICS_TOKEN)."""
+        if not settings.METRICS_TOKEN:
+            raise HTTPException(status_code=404, detail="Not Found")
+        expected = f"Bearer {settings.METRICS_TOKEN}".encode()
+        if not secrets.compare_digest((authorization or "").encode(), expected):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+        return PlainTextResponse(
+            metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
+
+
 # Root endpoint (must be after all routers and test endpoints)
 @app.get("/", tags=["Root"])
 async def root():
@@ -119,4 +173,4 @@ async def root():
         "message": "Budgeting Application API",
         "version": settings.APP_VERSION,
         "docs": "/docs",
-    }
\ No newline at end of file
+    }
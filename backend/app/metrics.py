@@ -0,0 +1,276 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+A deliberately small registry (counters, callback gauges, histograms with
+labels) so ``/metrics`` needs no extra dependency. Values are per worker
+process: scrape each worker, or aggregate by instance in Prometheus.
+
+Label sets are capped per metric; once a metric has ``max_series`` series,
+new label combinations are folded into one series whose labels are all
+``"other"``, so an unbounded label (e.g. a SQL fingerprint) cannot grow
+memory without limit.
+"""
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Seconds; spans sub-millisecond queries up to slow report/export requests.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+OVERFLOW_LABEL = "other"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        max_series: int = 1000,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.max_series = max_series
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Tuple[str, ...], series: Dict) -> Tuple[str, ...]:
+        if labels in series or len(series) < self.max_series:
+            return labels
+        return (OVERFLOW_LABEL,) * len(self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Return the sample lines for every series."""
+        pass
+
+    def reset(self) -> None:
+        """Drop all recorded series (tests only)."""
+
+
+class Counter(_Metric):
+    """Monotonic counter, optionally labelled."""
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, *labels: str) -> None:
+        with self._lock:
+            key = self._key(labels, self._values)
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Gauge whose samples are read from callbacks at scrape time."""
+
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._callbacks: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def set_function(self, fn: Callable[[], float], *labels: str) -> None:
+        with self._lock:
+            self._callbacks[labels] = fn
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._callbacks.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} "
+            f"{_format_value(fn())}"
+            for labels, fn in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._callbacks.clear()
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram, optionally labelled."""
+
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            key = self._key(labels, self._series)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(labels, list(series)) for labels, series in self._series.items()]
+        lines = []
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{_format_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together for /metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (), **kwargs
+    ) -> Counter:
+        return self.register(Counter(name, help_text, labelnames, **kwargs))
+
+    def gauge(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (), **kwargs
+    ) -> Gauge:
+        return self.register(Gauge(name, help_text, labelnames, **kwargs))
+
+    def histogram(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (), **kwargs
+    ) -> Histogram:
+        return self.register(Histogram(name, help_text, labelnames, **kwargs))
+
+    def render(self) -> str:
+        """All metrics in Prometheus text format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear every recorded sample, keeping registrations (tests only)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            if not isinstance(metric, Gauge):
+                metric.reset()
+
+
+# Process-wide registry served at /metrics.
+registry = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RequestTimings:
+    """Seconds spent per phase (db, pool, auth, serialize) in one request."""
+
+    __slots__ = ("phases",)
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+# Set by RequestTimingMiddleware. Worker threads (run_in_threadpool) inherit
+# a copy of the context that still points at the same RequestTimings.
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Attribute *seconds* to *phase* of the current request, if any."""
+    timings = current_timings.get()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+
+@contextmanager
+def timed_phase(phase: str):
+    """Time the enclosed block as *phase* of the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - start)
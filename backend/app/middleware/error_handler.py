@@ -5,6 +5,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from datetime import datetime, timezone
 from slowapi.errors import RateLimitExceeded
 from app.schemas.error_schemas import ErrorCodes
+from app.utils.security import PasswordPoolSaturated
 import logging
 
 logger = logging.getLogger(__name__)
@@ -77,6 +78,8 @@ def _http_reason(status_code: int) -> str:
         return "Conflict"
     if status_code == 429:
         return "Too Many Requests"
+    if status_code == 503:
+        return "Service Unavailable"
     return "Internal Server Error"
 
 
@@ -230,3 +233,21 @@ async def rate_limit_exception_handler(request: Request, exc: RateLimitExceeded)
         message=message,
     )
     return JSONResponse(status_code=status.HTTP_429_TOO_MANY_REQUESTS, content=payload)
+
+
+async def password_pool_saturated_handler(
+    request: Request, exc: PasswordPoolSaturated
+):
+    """Shed load with 503 when the password hashing pool is full."""
+    payload = _week4_payload(
+        request=request,
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        error_code=ErrorCodes.SYS_BUSY,
+        message="Authentication is busy, please retry shortly",
+    )
+    logger.warning(f"Password pool saturated on {request.url.path}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=payload,
+        headers={"Retry-After": "1"},
+    )
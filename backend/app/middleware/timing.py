@@ -0,0 +1,97 @@
+"""
+Per-request latency instrumentation.
+
+RequestTimingMiddleware is plain ASGI (no BaseHTTPMiddleware task hop, and
+streaming responses pass through untouched). It records a latency
+histogram per (method, route template, status) and, per route, how much of
+that time went to each phase:
+
+    db         statement execution (app/db_metrics.py)
+    pool       waiting for a pooled connection (app/db_metrics.py)
+    auth       JWT verification and bcrypt work (app/utils/security.py)
+    serialize  rendering the JSON body (TimedJSONResponse)
+
+With SERVER_TIMING_ENABLED the same phases, plus the remainder as ``app``,
+are sent in a ``Server-Timing`` header, measured up to the response start.
+"""
+
+import time
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import RequestTimings, current_timings, registry, timed_phase
+
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds",
+    "Request latency by method, route template and status.",
+    ("method", "route", "status"),
+)
+REQUEST_PHASE_SECONDS = registry.histogram(
+    "http_request_phase_seconds",
+    "Time per request spent in db, pool, auth and serialize phases.",
+    ("route", "phase"),
+)
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse that attributes body rendering to the serialize phase."""
+
+    def render(self, content) -> bytes:
+        with timed_phase("serialize"):
+            return super().render(content)
+
+
+def server_timing_header(timings: RequestTimings, total: float) -> str:
+    """Format phases (seconds) as a Server-Timing value in milliseconds."""
+    entries = [
+        f"{phase};dur={seconds * 1000:.1f}"
+        for phase, seconds in sorted(timings.phases.items())
+    ]
+    other = max(total - sum(timings.phases.values()), 0.0)
+    entries.append(f"app;dur={other * 1000:.1f}")
+    entries.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(entries)
+
+
+class RequestTimingMiddleware:
+    def __init__(self, app: ASGIApp, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        server_timing_header(timings, time.perf_counter() - start),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_timings.reset(token)
+            # The router stores the matched route in the (shared) scope dict;
+            # the template keeps label cardinality bounded.
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            REQUEST_SECONDS.observe(elapsed, scope["method"], route, str(status_code))
+            for phase, seconds in timings.phases.items():
+                REQUEST_PHASE_SECONDS.observe(seconds, route, phase)
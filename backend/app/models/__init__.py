@@ -4,5 +4,18 @@ from app.models.budget import Budget
 from app.models.income import Income
 from app.models.expense import Expense
 from app.models.login_attempt import LoginAttempt
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.rate_limit_counter import RateLimitCounter
 
-__all__ = ["Base", "get_db", "init_db", "User", "Budget", "Income", "Expense", "LoginAttempt"]
\ No newline at end of file
+__all__ = [
+    "Base",
+    "get_db",
+    "init_db",
+    "User",
+    "Budget",
+    "Income",
+    "Expense",
+    "LoginAttempt",
+    "MonthlyRollup",
+    "RateLimitCounter",
+]
@@ -1,19 +1,73 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.config import get_settings
+from app.db_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
 
 settings = get_settings()
 
+# Pool sizing is per process; see app/server.py for the cross-worker budget.
+POOL_OPTIONS = dict(
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+)
+
 engine = create_engine(
-    settings.DATABASE_URL, pool_pre_ping=True, pool_size=10, max_overflow=20
+    settings.DATABASE_URL,
+    poolclass=InstrumentedQueuePool if settings.METRICS_ENABLED else QueuePool,
+    **POOL_OPTIONS,
 )
+if settings.METRICS_ENABLED:
+    instrument_engine(engine, "sync")
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+def async_database_url(url: str) -> str:
+    """Rewrite a psycopg2 DATABASE_URL to use the asyncpg driver."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed.render_as_string(hide_password=False)
+
+
+# Optional async engine (DATABASE_ASYNC_ENABLED). Created only when enabled so
+# the asyncpg driver is not required for the default synchronous setup.
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DATABASE_ASYNC_ENABLED:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(
+        settings.DATABASE_ASYNC_URL or async_database_url(settings.DATABASE_URL),
+        poolclass=(
+            InstrumentedAsyncQueuePool
+            if settings.METRICS_ENABLED
+            else AsyncAdaptedQueuePool
+        ),
+        **POOL_OPTIONS,
+    )
+    if settings.METRICS_ENABLED:
+        instrument_engine(async_engine.sync_engine, "async")
+    # expire_on_commit=False: results are serialized after the session's
+    # greenlet has returned, where an expired attribute could not lazy-load.
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
 def get_db():
     """Dependency for database session."""
     db = SessionLocal()
@@ -23,6 +77,12 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for an async database session (DATABASE_ASYNC_ENABLED)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """
     Initialize database tables (DEV ONLY).
@@ -0,0 +1,56 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Numeric,
+    ForeignKey,
+    CheckConstraint,
+    DateTime,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from app.models.base import Base
+
+
+class MonthlyRollup(Base):
+    """
+    Pre-computed monthly totals per user, read by the summary report.
+
+    One row per (user_id, month). Maintained incrementally by the income and
+    expense repositories inside the same transaction as the write that
+    changes the underlying rows, so the report never has to rescan the raw
+    ``incomes`` / ``expenses`` tables.
+
+    ``expenses_by_category`` maps category -> total, with totals stored as
+    JSON strings (not numbers) so that NUMERIC precision survives the round
+    trip through the JSON driver without float rounding.
+
+    If the table ever drifts (manual SQL, restored backup) it can be rebuilt
+    from the source tables with ``scripts/backfill_monthly_rollups.py``.
+    """
+
+    __tablename__ = "monthly_rollups"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    month = Column(String(7), primary_key=True)  # Format: YYYY-MM
+    total_income = Column(Numeric(14, 2), nullable=False, server_default="0")
+    total_expenses = Column(Numeric(14, 2), nullable=False, server_default="0")
+    expenses_by_category = Column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb")
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "month ~ '^[0-9]{4}-[0-9]{2}$'", name="ck_monthly_rollups_month_format"
+        ),
+    )
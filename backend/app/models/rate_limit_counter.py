@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Integer, DateTime, Index
+from app.models.base import Base
+
+
+class RateLimitCounter(Base):
+    """
+    Fixed-window rate-limit counters for RATE_LIMIT_STORAGE_URL=postgresql://.
+
+    One row per limiter key (limit + client + window). Incremented with a
+    single INSERT ... ON CONFLICT so every worker and container sharing the
+    database enforces the same count. A row whose expires_at has passed is
+    reset on its next increment, and PostgresStorage periodically deletes
+    expired rows (ix_rate_limit_counters_expires_at serves that DELETE).
+    """
+
+    __tablename__ = "rate_limit_counters"
+
+    key = Column(String(512), primary_key=True, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_rate_limit_counters_expires_at", "expires_at"),
+    )
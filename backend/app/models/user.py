@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String
+from sqlalchemy import BigInteger, Column, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -14,6 +14,8 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(255), nullable=False)
+    # Bumped by every budget/income/expense write; ETag source for reads.
+    data_version = Column(BigInteger, nullable=False, default=0, server_default="0")
 
     # Relationships
     budgets = relationship(
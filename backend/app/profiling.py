@@ -0,0 +1,234 @@
+"""
+Sampled profiling of live requests.
+
+With ``PROFILING_SAMPLE_RATE`` > 0, ProfilingMiddleware profiles that
+fraction of HTTP requests and aggregates the results per route template.
+Operators read them back from ``/api/v1/admin/profiles`` (ADMIN_EMAILS
+only) as pstats text, a binary pstats dump for ``snakeviz``/``pstats``, or
+collapsed stacks for flame graph tools.
+
+Two modes (``PROFILING_MODE``):
+
+    cprofile  deterministic cProfile of the event-loop thread; exact call
+              counts, higher overhead. Collapsed output is caller;callee
+              pairs only, since cProfile does not keep full stacks.
+    sampler   a background thread samples the event-loop thread's stack
+              every PROFILING_SAMPLER_INTERVAL_MS; full stacks, low overhead.
+
+Only one request is profiled at a time per worker (one profiler can be
+active per thread), and work that runs in the threadpool is not captured.
+Coroutines from other requests that run on the loop while a sampled
+request is in flight are attributed to it. Sampler stacks are stored by the
+sampler thread as it exits, shortly after the response is sent.
+"""
+
+import cProfile
+import io
+import marshal
+import pstats
+import random
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+PROFILING_MODES = ("cprofile", "sampler")
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RouteProfile:
+    """Everything collected for one route template."""
+
+    samples: int = 0
+    stats: Optional[pstats.Stats] = None
+    stacks: Counter = field(default_factory=Counter)
+
+    def add_profile(self, profiler: cProfile.Profile) -> None:
+        if self.stats is None:
+            self.stats = pstats.Stats(profiler)
+        else:
+            self.stats.add(profiler)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", code.co_filename)
+    return f"{module}:{code.co_name}"
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval into collapsed form."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._on_done: Optional[Callable[[Counter], None]] = None
+        self._thread = threading.Thread(
+            target=self._run, name="profiling-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, on_done: Callable[[Counter], None]) -> None:
+        """
+        Signal the sampler to finish without waiting for it.
+
+        The sampled thread is usually the event loop, so joining here would
+        stall it for up to one interval. The sampler thread hands its stacks
+        to *on_done* as it exits instead.
+        """
+        self._on_done = on_done
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels: List[str] = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+        if self._on_done is not None:
+            self._on_done(self.stacks)
+
+
+class ProfileStore:
+    """Thread-safe per-route aggregation of sampled profiles."""
+
+    def __init__(self):
+        self._routes: Dict[str, RouteProfile] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        route: str,
+        profiler: Optional[cProfile.Profile] = None,
+        stacks: Optional[Counter] = None,
+    ) -> None:
+        with self._lock:
+            entry = self._routes.setdefault(route, RouteProfile())
+            entry.samples += 1
+            if profiler is not None:
+                entry.add_profile(profiler)
+            if stacks:
+                entry.stacks.update(stacks)
+
+    def summary(self) -> Dict[str, int]:
+        """Sample count per route."""
+        with self._lock:
+            return {route: entry.samples for route, entry in self._routes.items()}
+
+    def get(self, route: str) -> Optional[RouteProfile]:
+        with self._lock:
+            return self._routes.get(route)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def pstats_text(
+        self, route: str, sort: str = "cumulative", limit: int = 50
+    ) -> Optional[str]:
+        """Human-readable pstats report, or None if no cProfile data exists."""
+        entry = self.get(route)
+        if entry is None or entry.stats is None:
+            return None
+        out = io.StringIO()
+        with self._lock:
+            entry.stats.stream = out
+            entry.stats.sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def pstats_dump(self, route: str) -> Optional[bytes]:
+        """Marshalled stats in the format pstats.Stats(filename) loads."""
+        entry = self.get(route)
+        if entry is None or entry.stats is None:
+            return None
+        with self._lock:
+            return marshal.dumps(entry.stats.stats)
+
+    def collapsed(self, route: str) -> Optional[str]:
+        """
+        Collapsed stacks ("frame;frame;frame count" per line).
+
+        Sampler data gives full stacks; cProfile data gives caller;callee
+        pairs weighted by the callee's call count from that caller.
+        """
+        entry = self.get(route)
+        if entry is None:
+            return None
+        with self._lock:
+            stacks = Counter(entry.stacks)
+            if entry.stats is not None:
+                for callee, (_, _, _, _, callers) in entry.stats.stats.items():
+                    for caller, caller_stats in callers.items():
+                        edge = (
+                            f"{pstats.func_std_string(caller)};"
+                            f"{pstats.func_std_string(callee)}"
+                        )
+                        stacks[edge] += caller_stats[0]
+        return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+# Process-wide store read by the admin profiling endpoints.
+profile_store = ProfileStore()
+
+
+class ProfilingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float,
+        mode: str = "cprofile",
+        sampler_interval: float = 0.005,
+        store: ProfileStore = profile_store,
+    ):
+        if mode not in PROFILING_MODES:
+            raise ValueError(f"PROFILING_MODE must be one of {PROFILING_MODES}")
+        self.app = app
+        self.sample_rate = sample_rate
+        self.mode = mode
+        self.sampler_interval = sampler_interval
+        self.store = store
+        self._busy = threading.Lock()
+
+    def _record_stacks(self, route: str, stacks: Counter) -> None:
+        self.store.record(route, stacks=stacks)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or random.random() >= self.sample_rate
+            or not self._busy.acquire(blocking=False)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = sampler = None
+        try:
+            if self.mode == "cprofile":
+                profiler = cProfile.Profile()
+                profiler.enable()
+            else:
+                sampler = StackSampler(threading.get_ident(), self.sampler_interval)
+                sampler.start()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                if profiler is not None:
+                    profiler.disable()
+                    self.store.record(route, profiler=profiler)
+                if sampler is not None:
+                    sampler.stop(partial(self._record_stacks, route))
+        finally:
+            self._busy.release()
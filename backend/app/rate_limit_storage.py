@@ -0,0 +1,241 @@
+"""
+Shared rate-limit storage backends.
+
+slowapi hands ``RATE_LIMIT_STORAGE_URL`` to the ``limits`` library, which
+picks a storage class by URL scheme. Subclassing ``limits.storage.Storage``
+with a ``STORAGE_SCHEME`` registers it, so importing this module is enough
+to make the extra schemes usable:
+
+    memory://            per-process counters (limits built-in, default)
+    redis://host:6379/0  any Redis-protocol server (limits built-in; needs
+                         the ``redis`` package)
+    postgresql://        counters in the application database (this module)
+    fake://name          in-process shared server for tests (this module)
+
+Every backend here implements the counter operations used by the default
+fixed-window strategy, and each increment is a single atomic operation so
+that all workers see one consistent count.
+
+The PostgreSQL backend is a fixed-window counter, not a token bucket.
+slowapi drives every storage through the same ``limits`` strategy
+(``incr``/``get``/``get_expiry``), which never passes the limit's capacity
+to the storage. A bucket would need its own strategy, and then the limits
+would mean something different on memory:// and redis://. Keeping the
+fixed window gives one behaviour on every backend.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from limits.storage import Storage
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+
+class PostgresStorage(Storage):
+    """
+    Fixed-window counters in the ``rate_limit_counters`` table.
+
+    A bare ``postgresql://`` reuses the application's engine and pool; a
+    full URL gets a small dedicated pool. Window expiry uses the database
+    clock, so workers with skewed clocks still agree on window boundaries.
+
+    Expired rows are reset by their next increment, but keys that never
+    come back (one-off client IPs) would stay forever. So at most once per
+    *cleanup_interval* seconds per process, an increment also deletes the
+    expired rows (see purge_expired).
+    """
+
+    STORAGE_SCHEME = ["postgresql", "postgres", "postgresql+psycopg2"]
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        wrap_exceptions: bool = False,
+        engine: Optional[Engine] = None,
+        cleanup_interval: float = 60.0,
+        **options,
+    ):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._uri = uri
+        self._engine = engine
+        self._cleanup_interval = cleanup_interval
+        self._next_cleanup = time.monotonic() + cleanup_interval
+        self._cleanup_lock = threading.Lock()
+
+    @property
+    def base_exceptions(self):
+        return SQLAlchemyError
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            parsed = urlparse(self._uri or "")
+            if parsed.netloc or parsed.path.strip("/"):
+                self._engine = create_engine(
+                    self._uri, pool_pre_ping=True, pool_size=2, max_overflow=2
+                )
+            else:
+                from app.models.base import engine
+
+                self._engine = engine
+        return self._engine
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Add *amount* to the key's window, starting a new window if expired."""
+        if self._cleanup_due():
+            self.purge_expired()
+        with self.engine.begin() as conn:
+            return conn.execute(
+                text("""
+                    INSERT INTO rate_limit_counters (key, count, expires_at)
+                    VALUES (:key, :amount, now() + make_interval(secs => :expiry))
+                    ON CONFLICT (key) DO UPDATE SET
+                        count = CASE
+                            WHEN rate_limit_counters.expires_at <= now()
+                                THEN EXCLUDED.count
+                            ELSE rate_limit_counters.count + EXCLUDED.count
+                        END,
+                        expires_at = CASE
+                            WHEN rate_limit_counters.expires_at <= now()
+                                THEN EXCLUDED.expires_at
+                            ELSE rate_limit_counters.expires_at
+                        END
+                    RETURNING count
+                """),
+                {"key": key, "amount": amount, "expiry": expiry},
+            ).scalar_one()
+
+    def _cleanup_due(self) -> bool:
+        now = time.monotonic()
+        with self._cleanup_lock:
+            if now < self._next_cleanup:
+                return False
+            self._next_cleanup = now + self._cleanup_interval
+            return True
+
+    def purge_expired(self) -> int:
+        """Delete every row whose window has ended; returns the number deleted."""
+        # A concurrent incr that restarts a window moves expires_at into the
+        # future, and the DELETE re-checks its condition on that row.
+        with self.engine.begin() as conn:
+            return conn.execute(
+                text("DELETE FROM rate_limit_counters WHERE expires_at <= now()")
+            ).rowcount
+
+    def get(self, key: str) -> int:
+        with self.engine.connect() as conn:
+            count = conn.execute(
+                text(
+                    "SELECT count FROM rate_limit_counters "
+                    "WHERE key = :key AND expires_at > now()"
+                ),
+                {"key": key},
+            ).scalar()
+        return count or 0
+
+    def get_expiry(self, key: str) -> float:
+        with self.engine.connect() as conn:
+            expires_at = conn.execute(
+                text(
+                    "SELECT extract(epoch FROM expires_at) FROM rate_limit_counters "
+                    "WHERE key = :key"
+                ),
+                {"key": key},
+            ).scalar()
+        return float(expires_at) if expires_at is not None else time.time()
+
+    def check(self) -> bool:
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return True
+        except SQLAlchemyError:
+            return False
+
+    def reset(self) -> Optional[int]:
+        with self.engine.begin() as conn:
+            return conn.execute(text("DELETE FROM rate_limit_counters")).rowcount
+
+    def clear(self, key: str) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("DELETE FROM rate_limit_counters WHERE key = :key"), {"key": key}
+            )
+
+
+class _FakeServer:
+    """The state behind one ``fake://name`` URL."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[str, Tuple[int, float]] = {}
+
+
+class FakeSharedStorage(Storage):
+    """
+    In-process stand-in for a shared rate-limit server.
+
+    Every storage created for the same ``fake://name`` talks to the same
+    counters, so several ``Limiter`` instances in one test process behave
+    like workers sharing Redis. Not for production: state is lost on exit.
+    """
+
+    STORAGE_SCHEME = ["fake"]
+
+    _servers: Dict[str, _FakeServer] = {}
+    _servers_lock = threading.Lock()
+
+    def __init__(
+        self, uri: Optional[str] = None, wrap_exceptions: bool = False, **options
+    ):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        name = urlparse(uri or "fake://").netloc or "default"
+        with self._servers_lock:
+            self._server = self._servers.setdefault(name, _FakeServer())
+
+    @property
+    def base_exceptions(self):
+        return ValueError
+
+    def _live(self, key: str, now: float) -> Optional[Tuple[int, float]]:
+        entry = self._server.counters.get(key)
+        if entry is not None and entry[1] <= now:
+            del self._server.counters[key]
+            return None
+        return entry
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        with self._server.lock:
+            entry = self._live(key, now)
+            count, expires_at = entry if entry else (0, now + expiry)
+            self._server.counters[key] = (count + amount, expires_at)
+            return count + amount
+
+    def get(self, key: str) -> int:
+        with self._server.lock:
+            entry = self._live(key, time.time())
+        return entry[0] if entry else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._server.lock:
+            entry = self._live(key, now)
+        return entry[1] if entry else now
+
+    def check(self) -> bool:
+        return True
+
+    def reset(self) -> Optional[int]:
+        with self._server.lock:
+            count = len(self._server.counters)
+            self._server.counters.clear()
+        return count
+
+    def clear(self, key: str) -> None:
+        with self._server.lock:
+            self._server.counters.pop(key, None)
@@ -1,12 +1,132 @@
+from typing import Optional
+
+from fastapi import Request
+from fastapi.security.utils import get_authorization_scheme_param
+from limits import parse
 from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from slowapi.wrappers import Limit
 
+import app.rate_limit_storage  # noqa: F401  registers postgresql:// and fake://
 from app.config import get_settings
+from app.utils.security import decode_access_token
 
 settings = get_settings()
 
+
+def bearer_token_payload(request: Request) -> Optional[dict]:
+    """
+    Decode the request's bearer token at most once per request.
+
+    The result is kept on request.state (shared by the middleware and the
+    route's Request objects) so get_current_user can reuse it instead of
+    verifying the signature a second time.
+    """
+    scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+    if scheme.lower() != "bearer" or not token:
+        return None
+
+    cached = getattr(request.state, "token_payload", None)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    payload = decode_access_token(token)
+    request.state.token_payload = (token, payload)
+    return payload
+
+
+def rate_limit_key(request: Request) -> str:
+    """
+    Bucket requests by token subject when authenticated, client IP otherwise.
+
+    Only verified tokens count: an expired or forged token falls back to the
+    IP, so it cannot be used to mint fresh buckets.
+    """
+    payload = bearer_token_payload(request)
+    subject = payload.get("sub") if payload else None
+    if subject:
+        return f"user:{subject}"
+    return get_remote_address(request)
+
+
+def route_cost(request: Request) -> int:
+    """
+    Weight of this request against USER_RATE_LIMIT.
+
+    Looked up by route template relative to API_V1_PREFIX (for example
+    "/reports/summary"); unlisted API routes cost 1, and anything outside
+    the API prefix (health, root, docs) is free.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", request.url.path)
+    if not path.startswith(settings.API_V1_PREFIX):
+        return 0
+    return settings.RATE_LIMIT_ROUTE_COSTS.get(
+        path[len(settings.API_V1_PREFIX):], 1
+    )
+
+
 # Shared limiter instance used by FastAPI app and route decorators.
+# Counters live in RATE_LIMIT_STORAGE_URL; if a shared store becomes
+# unreachable, slowapi falls back to per-process counters until it recovers.
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=rate_limit_key,
     default_limits=[settings.GLOBAL_RATE_LIMIT],
+    storage_uri=settings.RATE_LIMIT_STORAGE_URL,
+    in_memory_fallback_enabled=settings.RATE_LIMIT_STORAGE_URL != "memory://",
 )
+
+_user_budget = parse(settings.USER_RATE_LIMIT)
+
+
+def enforce_user_budget(request: Request) -> None:
+    """
+    Charge route_cost against the caller's USER_RATE_LIMIT budget.
+
+    slowapi limits are per endpoint, and decorated routes skip its
+    application-wide limits, so the weighted budget shared by every API
+    route is checked here as an app-level dependency instead.
+    """
+    cost = route_cost(request)
+    if cost <= 0:
+        return
+
+    key = rate_limit_key(request)
+    if not _hit_user_budget(key, cost):
+        raise RateLimitExceeded(
+            Limit(
+                limit=_user_budget,
+                key_func=rate_limit_key,
+                scope="user-budget",
+                per_method=False,
+                methods=None,
+                error_message=None,
+                exempt_when=None,
+                cost=cost,
+                override_defaults=False,
+            )
+        )
+
+
+def _hit_user_budget(key: str, cost: int) -> bool:
+    """
+    Charge the budget, handling storage errors the way slowapi does.
+
+    A failing shared store switches the limiter to its in-memory fallback
+    (when enabled) and the hit is retried there; otherwise the request is
+    let through if swallow_errors is set, and the error is raised if not.
+    """
+    try:
+        return limiter.limiter.hit(_user_budget, "user-budget", key, cost=cost)
+    except Exception:
+        if limiter._in_memory_fallback_enabled and not limiter._storage_dead:
+            limiter.logger.warning(
+                "Rate limit storage unreachable - falling back to in-memory storage"
+            )
+            limiter._storage_dead = True
+            return _hit_user_budget(key, cost)
+        if limiter._swallow_errors:
+            limiter.logger.exception("Failed to rate limit. Swallowing error")
+            return True
+        raise
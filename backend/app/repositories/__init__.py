@@ -1,15 +1,25 @@
 from app.repositories.base_repository import BaseRepository
 from app.repositories.user_repository import UserRepository
-from app.repositories.budget_repository import BudgetRepository
+from app.repositories.budget_repository import BudgetRepository, BudgetSpend
 from app.repositories.income_repository import IncomeRepository
 from app.repositories.expense_repository import ExpenseRepository
 from app.repositories.login_attempt_repository import LoginAttemptRepository
+from app.repositories.report_repository import ReportRepository, SummaryAggregates
+from app.repositories.monthly_rollup_repository import MonthlyRollupRepository
+from app.repositories.export_repository import ExportRepository
+from app.repositories.data_version_repository import DataVersionRepository
 
 __all__ = [
     "BaseRepository",
     "UserRepository",
     "BudgetRepository",
+    "BudgetSpend",
     "IncomeRepository",
     "ExpenseRepository",
     "LoginAttemptRepository",
+    "ReportRepository",
+    "SummaryAggregates",
+    "MonthlyRollupRepository",
+    "ExportRepository",
+    "DataVersionRepository",
 ]
@@ -1,19 +1,40 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
 from typing import Optional
 from uuid import UUID
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 from app.models.budget import Budget
+from app.models.expense import Expense
 from app.repositories.base_repository import BaseRepository
+from app.repositories.data_version_repository import DataVersionRepository
+
+
+@dataclass(frozen=True)
+class BudgetSpend:
+    """A month's budget amount next to the expenses recorded against it."""
+
+    budget_id: UUID
+    amount: Decimal
+    spent: Decimal = Decimal("0")
 
 
 class BudgetRepository(BaseRepository[Budget]):
-    """Budget repository implementation."""
+    """Budget repository implementation.
+
+    Every write bumps the user's data version in the same transaction.
+    """
 
     def __init__(self, db: Session):
         super().__init__(db)
+        self.versions = DataVersionRepository(db)
 
     def create(self, entity: Budget) -> Budget:
         """Create a new budget."""
         self.db.add(entity)
+        self.db.flush()
+        self.versions.bump(entity.user_id)
         self.db.commit()
         self.db.refresh(entity)
         return entity
@@ -30,8 +51,44 @@ class BudgetRepository(BaseRepository[Budget]):
             .first()
         )
 
+    def get_spend(
+        self, user_id: UUID, month: str, start_date: date, end_date: date
+    ) -> Optional[BudgetSpend]:
+        """
+        Get the user's budget for *month* and its expense total for
+        ``[start_date, end_date)``, or None when no budget exists.
+
+        One statement: the budget row LEFT JOINed to the month's expenses
+        and summed, so a month without expenses still returns its budget.
+        """
+        stmt = (
+            select(
+                Budget.id,
+                Budget.amount,
+                func.coalesce(func.sum(Expense.amount), 0).label("spent"),
+            )
+            .select_from(Budget)
+            .outerjoin(
+                Expense,
+                and_(
+                    Expense.user_id == Budget.user_id,
+                    Expense.date >= start_date,
+                    Expense.date < end_date,
+                ),
+            )
+            .where(Budget.user_id == user_id, Budget.month == month)
+            .group_by(Budget.id, Budget.amount)
+        )
+        row = self.db.execute(stmt).first()
+        if row is None:
+            return None
+        return BudgetSpend(
+            budget_id=row.id, amount=Decimal(row.amount), spent=Decimal(row.spent)
+        )
+
     def update(self, entity: Budget) -> Budget:
         """Update a budget."""
+        self.versions.bump(entity.user_id)
         self.db.commit()
         self.db.refresh(entity)
         return entity
@@ -40,6 +97,7 @@ class BudgetRepository(BaseRepository[Budget]):
         """Delete a budget."""
         budget = self.get_by_id(entity_id)
         if budget:
+            self.versions.bump(budget.user_id)
             self.db.delete(budget)
             self.db.commit()
             return True
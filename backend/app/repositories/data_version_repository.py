@@ -0,0 +1,35 @@
+from uuid import UUID
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.models.user import User
+
+
+class DataVersionRepository:
+    """
+    Per-user data version: ``users.data_version``, a counter that moves
+    whenever any of the user's budgets, incomes or expenses change.
+
+    ``bump`` never commits: like MonthlyRollupRepository.apply_*, it is
+    called by the budget, income and expense repositories inside their own
+    transaction, so the version changes exactly when the data does. Taking
+    the user row lock first also serializes one user's writes.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: UUID) -> int:
+        """Current version (primary-key lookup); 0 for an unknown user."""
+        return (
+            self.db.execute(select(User.data_version).where(User.id == user_id))
+            .scalar()
+            or 0
+        )
+
+    def bump(self, user_id: UUID) -> None:
+        """Increment the user's version in the caller's transaction."""
+        self.db.execute(
+            update(User.__table__)
+            .where(User.__table__.c.id == user_id)
+            .values(data_version=User.__table__.c.data_version + 1)
+        )
@@ -1,25 +1,71 @@
-from typing import Optional, List
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, Optional, List, Tuple
 from uuid import UUID
 from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, insert, or_
 from app.models.expense import Expense
 from app.repositories.base_repository import BaseRepository
+from app.repositories.data_version_repository import DataVersionRepository
+from app.repositories.monthly_rollup_repository import (
+    MonthlyRollupRepository,
+    committed_value,
+    month_key,
+)
 
 
 class ExpenseRepository(BaseRepository[Expense]):
-    """Expense repository implementation."""
+    """Expense repository implementation.
+
+    Every write also adjusts ``monthly_rollups`` and bumps the user's data
+    version in the same transaction.
+    """
 
     def __init__(self, db: Session):
         super().__init__(db)
+        self.rollups = MonthlyRollupRepository(db)
+        self.versions = DataVersionRepository(db)
 
     def create(self, entity: Expense) -> Expense:
         """Create a new expense record."""
         self.db.add(entity)
+        self.db.flush()
+        self.versions.bump(entity.user_id)
+        self.rollups.apply_expense_delta(
+            entity.user_id, month_key(entity.date), entity.category, entity.amount
+        )
         self.db.commit()
         self.db.refresh(entity)
         return entity
 
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many expenses and their rollup changes in one transaction.
+
+        *rows* are column-value dicts (user_id, amount, category, date,
+        note). They go through a Core executemany, which the psycopg2
+        dialect sends as multi-row INSERT ... VALUES batches instead of one
+        round trip per row, and no ORM objects are built. Rollup deltas are
+        summed per (user, month, category) first. Returns the row count.
+        """
+        if not rows:
+            return 0
+
+        deltas: Dict[tuple[UUID, str, str], Decimal] = defaultdict(Decimal)
+        for row in rows:
+            deltas[(row["user_id"], month_key(row["date"]), row["category"])] += (
+                row["amount"]
+            )
+
+        self.db.execute(insert(Expense.__table__), rows)
+        for user_id in {row["user_id"] for row in rows}:
+            self.versions.bump(user_id)
+        for (user_id, month, category), delta in deltas.items():
+            self.rollups.apply_expense_delta(user_id, month, category, delta)
+        self.db.commit()
+        return len(rows)
+
     def get_by_id(self, entity_id: UUID) -> Optional[Expense]:
         """Get expense by ID."""
         return self.db.query(Expense).filter(Expense.id == entity_id).first()
@@ -40,8 +86,74 @@ class ExpenseRepository(BaseRepository[Expense]):
             .all()
         )
 
+    def list_page(
+        self,
+        user_id: UUID,
+        limit: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> List[Expense]:
+        """
+        Get one page of a user's expenses, newest first.
+
+        Rows are ordered by ``(date DESC, id DESC)``. *after* is the sort key
+        of the previous page's last row; only rows strictly past it are
+        returned, so the scan starts at that key in ``ix_expenses_user_date``
+        instead of skipping OFFSET rows. Dates are inclusive.
+        """
+        query = self.db.query(Expense).filter(Expense.user_id == user_id)
+        if start_date is not None:
+            query = query.filter(Expense.date >= start_date)
+        if end_date is not None:
+            query = query.filter(Expense.date <= end_date)
+        if category is not None:
+            query = query.filter(Expense.category == category)
+        if min_amount is not None:
+            query = query.filter(Expense.amount >= min_amount)
+        if max_amount is not None:
+            query = query.filter(Expense.amount <= max_amount)
+        if after is not None:
+            after_date, after_id = after
+            # The plain date bound is what the index range scan uses; the
+            # OR breaks ties between rows on the same date.
+            query = query.filter(
+                Expense.date <= after_date,
+                or_(
+                    Expense.date < after_date,
+                    and_(Expense.date == after_date, Expense.id < after_id),
+                ),
+            )
+
+        return (
+            query.order_by(Expense.date.desc(), Expense.id.desc())
+            .limit(limit)
+            .all()
+        )
+
     def update(self, entity: Expense) -> Expense:
         """Update an expense record."""
+        old_month = month_key(committed_value(entity, "date"))
+        old_category = committed_value(entity, "category")
+        old_amount = committed_value(entity, "amount")
+        new_month = month_key(entity.date)
+        self.versions.bump(entity.user_id)
+
+        if (old_month, old_category, old_amount) != (
+            new_month,
+            entity.category,
+            entity.amount,
+        ):
+            self.rollups.apply_expense_delta(
+                entity.user_id, old_month, old_category, -old_amount
+            )
+            self.rollups.apply_expense_delta(
+                entity.user_id, new_month, entity.category, entity.amount
+            )
+
         self.db.commit()
         self.db.refresh(entity)
         return entity
@@ -50,6 +162,13 @@ class ExpenseRepository(BaseRepository[Expense]):
         """Delete an expense record."""
         expense = self.get_by_id(entity_id)
         if expense:
+            self.versions.bump(expense.user_id)
+            self.rollups.apply_expense_delta(
+                expense.user_id,
+                month_key(expense.date),
+                expense.category,
+                -expense.amount,
+            )
             self.db.delete(expense)
             self.db.commit()
             return True
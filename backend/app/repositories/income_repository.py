@@ -1,25 +1,67 @@
-from typing import Optional, List
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
 from app.models.income import Income
 from app.repositories.base_repository import BaseRepository
+from app.repositories.data_version_repository import DataVersionRepository
+from app.repositories.monthly_rollup_repository import (
+    MonthlyRollupRepository,
+    committed_value,
+    month_key,
+)
 
 
 class IncomeRepository(BaseRepository[Income]):
-    """Income repository implementation."""
+    """Income repository implementation.
+
+    Every write also adjusts ``monthly_rollups`` and bumps the user's data
+    version in the same transaction.
+    """
 
     def __init__(self, db: Session):
         super().__init__(db)
+        self.rollups = MonthlyRollupRepository(db)
+        self.versions = DataVersionRepository(db)
 
     def create(self, entity: Income) -> Income:
         """Create a new income record."""
         self.db.add(entity)
+        self.db.flush()
+        self.versions.bump(entity.user_id)
+        self.rollups.apply_income_delta(
+            entity.user_id, month_key(entity.date), entity.amount
+        )
         self.db.commit()
         self.db.refresh(entity)
         return entity
 
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many incomes and their rollup changes in one transaction.
+
+        *rows* are column-value dicts (user_id, amount, source, date); see
+        ExpenseRepository.bulk_create. Rollup deltas are summed per
+        (user, month). Returns the row count.
+        """
+        if not rows:
+            return 0
+
+        deltas: Dict[tuple[UUID, str], Decimal] = defaultdict(Decimal)
+        for row in rows:
+            deltas[(row["user_id"], month_key(row["date"]))] += row["amount"]
+
+        self.db.execute(insert(Income.__table__), rows)
+        for user_id in {row["user_id"] for row in rows}:
+            self.versions.bump(user_id)
+        for (user_id, month), delta in deltas.items():
+            self.rollups.apply_income_delta(user_id, month, delta)
+        self.db.commit()
+        return len(rows)
+
     def get_by_id(self, entity_id: UUID) -> Optional[Income]:
         """Get income by ID."""
         return self.db.query(Income).filter(Income.id == entity_id).first()
@@ -42,6 +84,15 @@ class IncomeRepository(BaseRepository[Income]):
 
     def update(self, entity: Income) -> Income:
         """Update an income record."""
+        old_month = month_key(committed_value(entity, "date"))
+        old_amount = committed_value(entity, "amount")
+        new_month = month_key(entity.date)
+        self.versions.bump(entity.user_id)
+
+        if (old_month, old_amount) != (new_month, entity.amount):
+            self.rollups.apply_income_delta(entity.user_id, old_month, -old_amount)
+            self.rollups.apply_income_delta(entity.user_id, new_month, entity.amount)
+
         self.db.commit()
         self.db.refresh(entity)
         return entity
@@ -50,6 +101,10 @@ class IncomeRepository(BaseRepository[Income]):
         """Delete an income record."""
         income = self.get_by_id(entity_id)
         if income:
+            self.versions.bump(income.user_id)
+            self.rollups.apply_income_delta(
+                income.user_id, month_key(income.date), -income.amount
+            )
             self.db.delete(income)
             self.db.commit()
             return True
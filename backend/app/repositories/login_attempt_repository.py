@@ -1,7 +1,28 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import literal, select, text
 from app.models.login_attempt import LoginAttempt
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class LoginState:
+    """The user row and lockout status for one email, read together."""
+
+    user: Optional[User] = None
+    has_attempts: bool = False
+    locked_until: Optional[datetime] = None
+
+    def is_locked(self, now: Optional[datetime] = None) -> bool:
+        """True while locked_until (stored in UTC) is in the future."""
+        if self.locked_until is None:
+            return False
+        locked_until_utc = self.locked_until
+        if locked_until_utc.tzinfo is None:
+            locked_until_utc = locked_until_utc.replace(tzinfo=timezone.utc)
+        return (now or datetime.now(timezone.utc)) < locked_until_utc
 
 
 class LoginAttemptRepository:
@@ -11,6 +32,10 @@ class LoginAttemptRepository:
     The core write operation uses PostgreSQL's INSERT ... ON CONFLICT
     (upsert) so it is atomic — no race condition between check and
     increment even under concurrent requests from the same email.
+
+    A login costs one read (get_login_state) plus, on failure, one upsert
+    that also decides the lockout, or, on success after earlier failures,
+    one DELETE.
     """
 
     def __init__(self, db: Session):
@@ -24,23 +49,54 @@ class LoginAttemptRepository:
             .first()
         )
 
-    def record_failure(self, email: str, window_minutes: int) -> LoginAttempt:
+    def get_login_state(self, email: str) -> LoginState:
+        """
+        Fetch the user and their lockout row in one query.
+
+        Either side may be missing — failures are recorded for unknown
+        emails too — so both are LEFT JOINed onto the probed email.
+        """
+        probe = select(literal(email).label("email")).subquery()
+        row = self.db.execute(
+            select(User, LoginAttempt.email, LoginAttempt.locked_until)
+            .select_from(probe)
+            .outerjoin(User, User.email == probe.c.email)
+            .outerjoin(LoginAttempt, LoginAttempt.email == probe.c.email)
+        ).one()
+        return LoginState(
+            user=row[0],
+            has_attempts=row[1] is not None,
+            locked_until=row[2],
+        )
+
+    def record_failure(
+        self,
+        email: str,
+        window_minutes: int,
+        max_attempts: Optional[int] = None,
+    ):
         """
         Atomically increment the failure counter for this email.
 
         If the existing row's first_attempt_at is outside the current window,
         the counter is reset to 1 (sliding window behaviour matches Sprint 2).
-        Returns the updated row so the caller can decide whether to lock.
+        When the new count reaches *max_attempts*, locked_until is set to
+        now + window in the same statement.
+
+        Returns the row's ``attempt_count`` and ``locked_until`` via
+        RETURNING, so a failure costs a single statement and commit.
         """
         now = datetime.now(timezone.utc)
         window_start = now - timedelta(minutes=window_minutes)
 
-        self.db.execute(
+        row = self.db.execute(
             text("""
                 INSERT INTO login_attempts
-                    (email, attempt_count, first_attempt_at, last_attempt_at)
+                    (email, attempt_count, first_attempt_at, last_attempt_at,
+                     locked_until)
                 VALUES
-                    (:email, 1, :now, :now)
+                    (:email, 1, :now, :now,
+                     CASE WHEN 1 >= :max_attempts THEN :lock_until END)
                 ON CONFLICT (email) DO UPDATE SET
                     attempt_count = CASE
                         WHEN login_attempts.first_attempt_at < :window_start
@@ -52,19 +108,28 @@ class LoginAttemptRepository:
                             THEN :now
                         ELSE login_attempts.first_attempt_at
                     END,
-                    last_attempt_at = :now
+                    last_attempt_at = :now,
+                    locked_until = CASE
+                        WHEN (CASE
+                                WHEN login_attempts.first_attempt_at < :window_start
+                                    THEN 1
+                                ELSE login_attempts.attempt_count + 1
+                              END) >= :max_attempts
+                            THEN :lock_until
+                        ELSE login_attempts.locked_until
+                    END
+                RETURNING attempt_count, locked_until
             """),
-            {"email": email, "now": now, "window_start": window_start},
-        )
+            {
+                "email": email,
+                "now": now,
+                "window_start": window_start,
+                "max_attempts": max_attempts,
+                "lock_until": now + timedelta(minutes=window_minutes),
+            },
+        ).one()
         self.db.commit()
-        return self.get(email)
-
-    def set_locked(self, email: str, until: datetime) -> None:
-        """Set locked_until on the row — called once threshold is crossed."""
-        attempt = self.get(email)
-        if attempt:
-            attempt.locked_until = until
-            self.db.commit()
+        return row
 
     def clear(self, email: str) -> None:
         """Delete the row on successful login — resets all counters."""
@@ -79,9 +144,6 @@ class LoginAttemptRepository:
         Compares locked_until (stored in UTC) against UTC now.
         """
         attempt = self.get(email)
-        if not attempt or not attempt.locked_until:
+        if not attempt:
             return False
-        locked_until_utc = attempt.locked_until
-        if locked_until_utc.tzinfo is None:
-            locked_until_utc = locked_until_utc.replace(tzinfo=timezone.utc)
-        return datetime.now(timezone.utc) < locked_until_utc
\ No newline at end of file
+        return LoginState(locked_until=attempt.locked_until).is_locked()
@@ -0,0 +1,181 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, List, Optional
+from uuid import UUID
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+from app.models.monthly_rollup import MonthlyRollup
+
+
+def month_key(value: date) -> str:
+    """Return the YYYY-MM rollup key for a transaction date."""
+    return value.strftime("%Y-%m")
+
+
+def committed_value(entity, attribute: str) -> Any:
+    """
+    Return the value *attribute* had when *entity* was loaded.
+
+    Used by update() paths to find which rollup bucket a row belonged to
+    before the caller mutated it in memory.
+    """
+    history = inspect(entity).attrs[attribute].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(entity, attribute)
+
+
+class MonthlyRollupRepository:
+    """
+    Incremental maintenance and lookup of the ``monthly_rollups`` table.
+
+    The ``apply_*`` methods never commit: they are called by the income and
+    expense repositories between their own flush and commit so the rollup
+    change lands in the same transaction as the row that caused it. Each
+    one is a single INSERT ... ON CONFLICT statement, so concurrent writes
+    for the same user/month serialize on the row lock instead of racing.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: UUID, month: str) -> Optional[MonthlyRollup]:
+        """Fetch the rollup row for this user and month, or None."""
+        return (
+            self.db.query(MonthlyRollup)
+            .filter(MonthlyRollup.user_id == user_id, MonthlyRollup.month == month)
+            .first()
+        )
+
+    def get_range(
+        self, user_id: UUID, start_month: str, end_month: str
+    ) -> List[MonthlyRollup]:
+        """Fetch the user's rollup rows for an inclusive YYYY-MM span."""
+        return (
+            self.db.query(MonthlyRollup)
+            .filter(
+                MonthlyRollup.user_id == user_id,
+                MonthlyRollup.month >= start_month,
+                MonthlyRollup.month <= end_month,
+            )
+            .order_by(MonthlyRollup.month)
+            .all()
+        )
+
+    def apply_income_delta(self, user_id: UUID, month: str, delta: Decimal) -> None:
+        """Add *delta* (may be negative) to the month's income total."""
+        self.db.execute(
+            text("""
+                INSERT INTO monthly_rollups
+                    (user_id, month, total_income, total_expenses,
+                     expenses_by_category)
+                VALUES
+                    (:user_id, :month, :delta, 0, '{}'::jsonb)
+                ON CONFLICT (user_id, month) DO UPDATE SET
+                    total_income = monthly_rollups.total_income + :delta,
+                    updated_at = now()
+            """),
+            {"user_id": str(user_id), "month": month, "delta": delta},
+        )
+
+    def apply_expense_delta(
+        self, user_id: UUID, month: str, category: str, delta: Decimal
+    ) -> None:
+        """
+        Add *delta* (may be negative) to the month's expense total and to
+        *category*'s entry. A category whose total returns to zero is
+        removed so the report does not list empty categories.
+        """
+        self.db.execute(
+            text("""
+                INSERT INTO monthly_rollups
+                    (user_id, month, total_income, total_expenses,
+                     expenses_by_category)
+                VALUES
+                    (:user_id, :month, 0, :delta,
+                     jsonb_build_object(
+                         CAST(:category AS TEXT), CAST(:delta AS NUMERIC)::text
+                     ))
+                ON CONFLICT (user_id, month) DO UPDATE SET
+                    total_expenses = monthly_rollups.total_expenses + :delta,
+                    expenses_by_category = CASE
+                        WHEN COALESCE(
+                            (monthly_rollups.expenses_by_category
+                                ->> CAST(:category AS TEXT))::numeric, 0
+                        ) + :delta = 0
+                            THEN monthly_rollups.expenses_by_category
+                                - CAST(:category AS TEXT)
+                        ELSE monthly_rollups.expenses_by_category
+                            || jsonb_build_object(
+                                CAST(:category AS TEXT),
+                                (COALESCE(
+                                    (monthly_rollups.expenses_by_category
+                                        ->> CAST(:category AS TEXT))::numeric, 0
+                                ) + :delta)::text
+                            )
+                    END,
+                    updated_at = now()
+            """),
+            {
+                "user_id": str(user_id),
+                "month": month,
+                "category": category,
+                "delta": delta,
+            },
+        )
+
+    def rebuild(self, user_id: Optional[UUID] = None) -> int:
+        """
+        Recompute rollups from the source tables and commit.
+
+        Rebuilds every user when *user_id* is None. Returns the number of
+        rollup rows written. Safe to re-run; used for the initial backfill
+        and to repair drift.
+        """
+        params = {"user_id": str(user_id) if user_id else None}
+        self.db.execute(
+            text("""
+                DELETE FROM monthly_rollups
+                WHERE CAST(:user_id AS UUID) IS NULL
+                   OR user_id = CAST(:user_id AS UUID)
+            """),
+            params,
+        )
+        result = self.db.execute(
+            text("""
+                INSERT INTO monthly_rollups
+                    (user_id, month, total_income, total_expenses,
+                     expenses_by_category)
+                SELECT
+                    COALESCE(e.user_id, i.user_id),
+                    COALESCE(e.month, i.month),
+                    COALESCE(i.total, 0),
+                    COALESCE(e.total, 0),
+                    COALESCE(e.by_category, '{}'::jsonb)
+                FROM (
+                    SELECT user_id, month,
+                           SUM(total) AS total,
+                           jsonb_object_agg(category, total::text) AS by_category
+                    FROM (
+                        SELECT user_id, to_char(date, 'YYYY-MM') AS month,
+                               category, SUM(amount) AS total
+                        FROM expenses
+                        WHERE CAST(:user_id AS UUID) IS NULL
+                           OR user_id = CAST(:user_id AS UUID)
+                        GROUP BY 1, 2, 3
+                    ) per_category
+                    GROUP BY user_id, month
+                ) e
+                FULL OUTER JOIN (
+                    SELECT user_id, to_char(date, 'YYYY-MM') AS month,
+                           SUM(amount) AS total
+                    FROM incomes
+                    WHERE CAST(:user_id AS UUID) IS NULL
+                       OR user_id = CAST(:user_id AS UUID)
+                    GROUP BY 1, 2
+                ) i ON e.user_id = i.user_id AND e.month = i.month
+            """),
+            params,
+        )
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,150 @@
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List
+from uuid import UUID
+from sqlalchemy import String, and_, func, literal, select, union_all
+from sqlalchemy.orm import Session
+from app.models.expense import Expense
+from app.models.income import Income
+
+
+@dataclass(frozen=True)
+class SummaryAggregates:
+    """Pre-aggregated income/expense totals for one user and date range."""
+
+    total_income: Decimal = Decimal("0")
+    expenses_by_category: Dict[str, Decimal] = field(default_factory=dict)
+
+
+class ReportRepository:
+    """
+    Read-only aggregate queries used by the reporting layer.
+
+    Unlike the per-model repositories this one spans both the ``incomes``
+    and ``expenses`` tables so that a report can be computed by PostgreSQL
+    (SUM / GROUP BY) in a single round trip, without hydrating ORM rows.
+    """
+
+    _INCOME = "income"
+    _EXPENSE = "expense"
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_summary_aggregates(
+        self, user_id: UUID, start_date: date, end_date: date
+    ) -> SummaryAggregates:
+        """
+        Return total income and per-category expense totals for
+        ``[start_date, end_date)``.
+
+        Both aggregates are fetched with one UNION ALL statement: a single
+        income row (always present, COALESCEd to 0) followed by one row
+        per expense category.
+        """
+        income_totals = select(
+            literal(self._INCOME).label("kind"),
+            literal(None, String).label("category"),
+            func.coalesce(func.sum(Income.amount), 0).label("total"),
+        ).where(
+            and_(
+                Income.user_id == user_id,
+                Income.date >= start_date,
+                Income.date < end_date,
+            )
+        )
+        expense_totals = (
+            select(
+                literal(self._EXPENSE).label("kind"),
+                Expense.category.label("category"),
+                func.sum(Expense.amount).label("total"),
+            )
+            .where(
+                and_(
+                    Expense.user_id == user_id,
+                    Expense.date >= start_date,
+                    Expense.date < end_date,
+                )
+            )
+            .group_by(Expense.category)
+        )
+
+        total_income = Decimal("0")
+        expenses_by_category: Dict[str, Decimal] = {}
+        for row in self.db.execute(union_all(income_totals, expense_totals)):
+            if row.kind == self._INCOME:
+                total_income = Decimal(row.total)
+            else:
+                expenses_by_category[row.category] = Decimal(row.total)
+
+        return SummaryAggregates(
+            total_income=total_income, expenses_by_category=expenses_by_category
+        )
+
+    def get_range_aggregates(
+        self, user_id: UUID, start_date: date, end_date: date
+    ) -> Dict[str, SummaryAggregates]:
+        """
+        Return per-month aggregates for ``[start_date, end_date)``, keyed
+        by ``YYYY-MM``.
+
+        Same UNION ALL shape as get_summary_aggregates, grouped by
+        ``date_trunc('month', date)`` so a whole span costs one round trip.
+        Months without any activity are absent from the result.
+        """
+        income_month = func.to_char(func.date_trunc("month", Income.date), "YYYY-MM")
+        expense_month = func.to_char(
+            func.date_trunc("month", Expense.date), "YYYY-MM"
+        )
+        income_totals = (
+            select(
+                literal(self._INCOME).label("kind"),
+                income_month.label("month"),
+                literal(None, String).label("category"),
+                func.sum(Income.amount).label("total"),
+            )
+            .where(
+                and_(
+                    Income.user_id == user_id,
+                    Income.date >= start_date,
+                    Income.date < end_date,
+                )
+            )
+            .group_by(income_month)
+        )
+        expense_totals = (
+            select(
+                literal(self._EXPENSE).label("kind"),
+                expense_month.label("month"),
+                Expense.category.label("category"),
+                func.sum(Expense.amount).label("total"),
+            )
+            .where(
+                and_(
+                    Expense.user_id == user_id,
+                    Expense.date >= start_date,
+                    Expense.date < end_date,
+                )
+            )
+            .group_by(expense_month, Expense.category)
+        )
+
+        income_by_month: Dict[str, Decimal] = {}
+        categories_by_month: Dict[str, Dict[str, Decimal]] = {}
+        for row in self.db.execute(union_all(income_totals, expense_totals)):
+            if row.kind == self._INCOME:
+                income_by_month[row.month] = Decimal(row.total)
+            else:
+                categories_by_month.setdefault(row.month, {})[row.category] = (
+                    Decimal(row.total)
+                )
+
+        months: List[str] = sorted(set(income_by_month) | set(categories_by_month))
+        return {
+            month: SummaryAggregates(
+                total_income=income_by_month.get(month, Decimal("0")),
+                expenses_by_category=categories_by_month.get(month, {}),
+            )
+            for month in months
+        }
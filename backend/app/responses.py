@@ -0,0 +1,156 @@
+"""
+Fast JSON responses (FAST_JSON_ENABLED).
+
+Two independent savings for large payloads:
+
+    FastJSONResponse    renders with orjson instead of the stdlib encoder.
+                        Used as the app's default response class, it speeds
+                        up every JSON route without changing its output.
+    ResponseSerializer  skips FastAPI's response-model pass (dump, validate
+                        again, encode) for trusted service output. ORM rows
+                        are read straight into alias-keyed dicts
+                        (``expenseId``, ``createdAt``...) and handed to
+                        FastJSONResponse.
+
+The body is the same as on the default path. orjson writes UUIDs, dates and
+datetimes in pydantic's format (``OPT_UTC_Z`` gives the ``Z`` suffix), and
+Decimals (and UUID subclasses) go out as strings. orjson is optional and
+only needed when FAST_JSON_ENABLED is set.
+"""
+
+import types
+from decimal import Decimal
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Optional, Union, get_args, get_origin
+from uuid import UUID
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.metrics import timed_phase
+from app.middleware.timing import TimedJSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional: only FAST_JSON_ENABLED needs it
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    # orjson encodes uuid.UUID itself, but not subclasses such as asyncpg's.
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode *content* with orjson, matching pydantic's JSON output."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+class FastJSONResponse(TimedJSONResponse):
+    """TimedJSONResponse rendered by orjson (still timed as serialize)."""
+
+    def render(self, content) -> bytes:
+        with timed_phase("serialize"):
+            return dumps(content)
+
+
+def json_response_class(fast: bool) -> type[JSONResponse]:
+    """The app's default response class for the FAST_JSON_ENABLED setting."""
+    if not fast:
+        return TimedJSONResponse
+    if orjson is None:
+        raise RuntimeError(
+            "FAST_JSON_ENABLED is set but the 'orjson' package is not installed"
+        )
+    return FastJSONResponse
+
+
+def _compile(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Converter for values of *annotation*; None when they pass as-is."""
+    origin = get_origin(annotation)
+    if origin is list:
+        item = _compile(get_args(annotation)[0])
+        if item is None:
+            return None
+        return lambda values: [item(value) for value in values]
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        inner = _compile(members[0]) if len(members) == 1 else None
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _compile_model(annotation)
+    return None
+
+
+def _compile_model(model: type[BaseModel]) -> Callable[[Any], dict]:
+    names = tuple(model.model_fields)
+    aliases = tuple(
+        field.serialization_alias or field.alias or name
+        for name, field in model.model_fields.items()
+    )
+    nested = tuple(
+        (index, convert)
+        for index, field in enumerate(model.model_fields.values())
+        if (convert := _compile(field.annotation)) is not None
+    )
+    # attrgetter/itemgetter read every field in one C call, but return a
+    # bare value rather than a tuple for a single name.
+    if len(names) > 1:
+        read_attrs, read_keys = attrgetter(*names), itemgetter(*names)
+    else:
+
+        def read_attrs(obj):
+            return tuple(getattr(obj, name) for name in names)
+
+        def read_keys(obj):
+            return tuple(obj[name] for name in names)
+
+    def convert_model(obj) -> dict:
+        values = read_keys(obj) if isinstance(obj, dict) else read_attrs(obj)
+        if nested:
+            values = list(values)
+            for index, convert in nested:
+                values[index] = convert(values[index])
+        return dict(zip(aliases, values))
+
+    return convert_model
+
+
+class ResponseSerializer:
+    """
+    Response-model mapping compiled once, applied without validation.
+
+    *annotation* is a response model or ``List[Model]``. Nested models,
+    lists and Optional fields are followed, and every other field is passed
+    through for orjson to encode. Source values may be ORM objects or dicts
+    keyed by field name. Only use this where the service output already has
+    the model's types: nothing is checked or coerced.
+    """
+
+    def __init__(self, annotation: Any):
+        self._convert = _compile(annotation) or (lambda content: content)
+
+    def __call__(self, content: Any) -> Any:
+        return self._convert(content)
+
+
+def trusted_response(
+    serializer: ResponseSerializer,
+    content: Any,
+    response: Optional[Response] = None,
+) -> FastJSONResponse:
+    """
+    Return *content* as a FastJSONResponse, skipping response-model validation.
+
+    Headers already set on the endpoint's injected *response* (such as the
+    ETag) are carried over, as FastAPI does for model return values.
+    """
+    fast = FastJSONResponse(serializer(content))
+    if response is not None:
+        fast.headers.raw.extend(response.headers.raw)
+    return fast
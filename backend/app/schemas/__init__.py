@@ -12,8 +12,17 @@ from app.schemas.budget_schemas import (
     BudgetResponse,
 )
 from app.schemas.income_schemas import IncomeCreateRequest, IncomeResponse
-from app.schemas.expense_schemas import ExpenseCreateRequest, ExpenseResponse
-from app.schemas.report_schemas import MonthlySummaryResponse, CategoryExpense
+from app.schemas.expense_schemas import (
+    ExpenseCreateRequest,
+    ExpenseResponse,
+    ExpensePageResponse,
+)
+from app.schemas.report_schemas import (
+    MonthlySummaryResponse,
+    RangeSummaryResponse,
+    CategoryExpense,
+)
+from app.schemas.bulk_schemas import BulkImportResponse, BulkRowError
 
 __all__ = [
     "ErrorDetail",
@@ -31,6 +40,10 @@ __all__ = [
     "IncomeResponse",
     "ExpenseCreateRequest",
     "ExpenseResponse",
+    "ExpensePageResponse",
     "MonthlySummaryResponse",
+    "RangeSummaryResponse",
     "CategoryExpense",
+    "BulkImportResponse",
+    "BulkRowError",
 ]
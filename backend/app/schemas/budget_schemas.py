@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from uuid import UUID
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime
 import re
 
 
@@ -58,3 +58,46 @@ class BudgetResponse(BaseModel):
             }
         },
     )
+
+
+class BudgetStatusResponse(BaseModel):
+    """Budget-vs-actual status for one month."""
+
+    budget_id: UUID = Field(serialization_alias="budgetId")
+    month: str = Field(..., description="Budget month in YYYY-MM format")
+    amount: Decimal = Field(serialization_alias="totalAmount")
+    spent: Decimal = Field(..., description="Expenses recorded for the month")
+    remaining: Decimal = Field(
+        ..., description="Budget minus spent (negative when over budget)"
+    )
+    daily_burn_rate: Decimal = Field(
+        ...,
+        serialization_alias="dailyBurnRate",
+        description="Average spend per elapsed day of the month",
+    )
+    projected_spend: Decimal = Field(
+        ...,
+        serialization_alias="projectedSpend",
+        description="Month-end spend if the burn rate holds",
+    )
+    days_elapsed: int = Field(..., serialization_alias="daysElapsed")
+    days_in_month: int = Field(..., serialization_alias="daysInMonth")
+    as_of: date = Field(..., serialization_alias="asOf")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
+            "example": {
+                "budgetId": "550e8400-e29b-41d4-a716-446655440000",
+                "month": "2024-03",
+                "totalAmount": 3100.00,
+                "spent": 1000.00,
+                "remaining": 2100.00,
+                "dailyBurnRate": 100.00,
+                "projectedSpend": 3100.00,
+                "daysElapsed": 10,
+                "daysInMonth": 31,
+                "asOf": "2024-03-10",
+            }
+        },
+    )
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List
+
+
+class BulkRowError(BaseModel):
+    """One rejected row of a bulk import."""
+
+    row: int = Field(..., description="1-based row number in the request body")
+    code: str = Field(..., serialization_alias="errorCode")
+    message: str
+
+
+class BulkImportResponse(BaseModel):
+    """Bulk import result: rows inserted plus per-row errors."""
+
+    imported: int = Field(..., description="Rows inserted")
+    failed: int = Field(..., description="Rows rejected")
+    errors: List[BulkRowError] = Field(default_factory=list)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "imported": 2,
+                "failed": 1,
+                "errors": [
+                    {
+                        "row": 2,
+                        "errorCode": "EXP-002",
+                        "message": "Expense amount must be greater than 0",
+                    }
+                ],
+            }
+        }
+    )
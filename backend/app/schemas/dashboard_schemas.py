@@ -0,0 +1,65 @@
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
+from typing import List, Optional
+from app.schemas.budget_schemas import BudgetStatusResponse
+from app.schemas.expense_schemas import ExpenseResponse
+from app.schemas.report_schemas import MonthlySummaryResponse
+
+
+class DashboardResponse(BaseModel):
+    """Home screen payload for the current month."""
+
+    month: str = Field(..., description="Current month (UTC) in YYYY-MM format")
+    budget: Optional[BudgetStatusResponse] = Field(
+        None, description="Budget vs. spend; null when the month has no budget"
+    )
+    summary: MonthlySummaryResponse = Field(
+        ..., description="Month totals; byCategory holds the category totals"
+    )
+    recent_expenses: List[ExpenseResponse] = Field(
+        ...,
+        serialization_alias="recentExpenses",
+        description="The month's latest expenses, newest first",
+    )
+    generated_at: datetime = Field(..., serialization_alias="generatedAt")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
+            "example": {
+                "month": "2024-03",
+                "budget": {
+                    "budgetId": "550e8400-e29b-41d4-a716-446655440000",
+                    "month": "2024-03",
+                    "totalAmount": 3100.00,
+                    "spent": 1000.00,
+                    "remaining": 2100.00,
+                    "dailyBurnRate": 100.00,
+                    "projectedSpend": 3100.00,
+                    "daysElapsed": 10,
+                    "daysInMonth": 31,
+                    "asOf": "2024-03-10",
+                },
+                "summary": {
+                    "month": "2024-03",
+                    "totalIncome": 5000.00,
+                    "totalExpenses": 1000.00,
+                    "net": 4000.00,
+                    "byCategory": {"Groceries": 600.00, "Transport": 400.00},
+                    "generatedAt": "2024-03-10T12:00:00Z",
+                },
+                "recentExpenses": [
+                    {
+                        "expenseId": "770e8400-e29b-41d4-a716-446655440000",
+                        "userId": "660e8400-e29b-41d4-a716-446655440000",
+                        "amount": 150.00,
+                        "category": "Groceries",
+                        "date": "2024-03-10",
+                        "note": "Weekly shopping",
+                        "createdAt": "2024-03-10T12:00:00Z",
+                    }
+                ],
+                "generatedAt": "2024-03-10T12:00:00Z",
+            }
+        },
+    )
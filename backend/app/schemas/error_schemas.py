@@ -90,3 +90,4 @@ class ErrorCodes:
     SYS_INTERNAL_ERROR = "SYS-001"
     SYS_DATABASE_ERROR = "SYS-002"
     SYS_RATE_LIMIT = "SYS-003"
+    SYS_BUSY = "SYS-004"  # Bounded worker pool saturated (503)
@@ -3,7 +3,7 @@ from uuid import UUID
 from decimal import Decimal
 from datetime import date as date_type
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 class ExpenseCreateRequest(BaseModel):
@@ -54,3 +54,14 @@ class ExpenseResponse(BaseModel):
             }
         },
     )
+
+
+class ExpensePageResponse(BaseModel):
+    """One page of an expense listing."""
+
+    items: List[ExpenseResponse]
+    next_cursor: Optional[str] = Field(
+        None,
+        serialization_alias="nextCursor",
+        description="Pass as ?cursor= to fetch the next page; null on the last page",
+    )
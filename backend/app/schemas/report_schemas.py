@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List
 from datetime import datetime
 
 
@@ -56,3 +56,67 @@ class MonthlySummaryResponse(BaseModel):
             }
         },
     )
+
+
+class RangeSummaryResponse(BaseModel):
+    """Per-month summaries and overall totals for a span of months."""
+
+    start_month: str = Field(
+        ..., serialization_alias="from", description="First month (YYYY-MM)"
+    )
+    end_month: str = Field(
+        ..., serialization_alias="to", description="Last month (YYYY-MM), inclusive"
+    )
+    total_income: Decimal = Field(
+        ..., serialization_alias="totalIncome", description="Total income for the span"
+    )
+    total_expenses: Decimal = Field(
+        ...,
+        serialization_alias="totalExpenses",
+        description="Total expenses for the span",
+    )
+    net_balance: Decimal = Field(
+        ..., serialization_alias="net", description="Net balance (income - expenses)"
+    )
+    expenses_by_category: Dict[str, Decimal] = Field(
+        ...,
+        serialization_alias="byCategory",
+        description="Expenses for the span grouped by category",
+    )
+    months: List[MonthlySummaryResponse] = Field(
+        ..., description="One summary per month, oldest first, empty months included"
+    )
+    generated_at: datetime = Field(..., serialization_alias="generatedAt")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
+            "example": {
+                "from": "2024-02",
+                "to": "2024-03",
+                "totalIncome": 10000.00,
+                "totalExpenses": 5100.00,
+                "net": 4900.00,
+                "byCategory": {"Groceries": 900.00, "Rent": 4200.00},
+                "months": [
+                    {
+                        "month": "2024-02",
+                        "totalIncome": 5000.00,
+                        "totalExpenses": 2550.00,
+                        "net": 2450.00,
+                        "byCategory": {"Groceries": 450.00, "Rent": 2100.00},
+                        "generatedAt": "2024-03-31T23:59:59Z",
+                    },
+                    {
+                        "month": "2024-03",
+                        "totalIncome": 5000.00,
+                        "totalExpenses": 2550.00,
+                        "net": 2450.00,
+                        "byCategory": {"Groceries": 450.00, "Rent": 2100.00},
+                        "generatedAt": "2024-03-31T23:59:59Z",
+                    },
+                ],
+                "generatedAt": "2024-03-31T23:59:59Z",
+            }
+        },
+    )
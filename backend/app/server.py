@@ -0,0 +1,233 @@
+"""
+Production launcher: uvicorn with one worker per core and a checked
+connection budget.
+
+Every worker process owns its own SQLAlchemy pool(s), so the database sees
+up to ``workers * connections_per_worker`` connections. Before starting,
+the launcher reads ``max_connections`` from PostgreSQL and refuses to boot
+a configuration that could exhaust it. It also refuses per-process state
+that several workers would silently split (memory:// rate-limit counters,
+/metrics counters), turns the memory:// report cache off with a warning,
+and runs the RUN_DB_INIT table creation once itself instead of in every
+worker.
+
+Usage:
+    python -m app.server                # WEB_CONCURRENCY workers (default: CPU count)
+    python -m app.server --workers 4
+    python -m app.server --check        # validate the pool budget and exit
+"""
+
+import argparse
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlparse
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool
+
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# app.rate_limit_storage.PostgresStorage opens a dedicated pool (2 + 2 overflow) when
+# RATE_LIMIT_STORAGE_URL is a full postgresql://host/... URL.
+RATE_LIMIT_POOL_CONNECTIONS = 4
+
+
+class ConnectionBudgetExceeded(RuntimeError):
+    """Raised when the configured workers could open more connections than allowed."""
+
+
+class UnsafeWorkerConfig(RuntimeError):
+    """Raised when a setting only works correctly inside a single worker."""
+
+
+@dataclass(frozen=True)
+class ServerPlan:
+    """Worker count and the connections each worker may hold at peak."""
+
+    workers: int
+    connections_per_worker: int
+
+    @property
+    def total_connections(self) -> int:
+        return self.workers * self.connections_per_worker
+
+
+def resolve_workers(settings: Settings, override: Optional[int] = None) -> int:
+    """Explicit override, then WEB_CONCURRENCY, then one worker per CPU core."""
+    workers = override or settings.WEB_CONCURRENCY or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("worker count must be at least 1")
+    return workers
+
+
+def connections_per_worker(settings: Settings) -> int:
+    """Peak connections one worker process can hold across all of its pools."""
+    per_pool = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    total = per_pool
+    if settings.DATABASE_ASYNC_ENABLED:
+        total += per_pool
+    parsed = urlparse(settings.RATE_LIMIT_STORAGE_URL)
+    dedicated = parsed.netloc or parsed.path.strip("/")
+    if parsed.scheme.startswith("postgres") and dedicated:
+        total += RATE_LIMIT_POOL_CONNECTIONS
+    return total
+
+
+def check_connection_budget(
+    plan: ServerPlan, max_connections: int, reserved: int
+) -> None:
+    """
+    Raise ConnectionBudgetExceeded if the plan could exceed the server limit.
+
+    ``reserved`` covers connections this app does not own: migrations,
+    psql sessions, monitoring, and PostgreSQL's superuser slots.
+    """
+    available = max_connections - reserved
+    if plan.total_connections > available:
+        suggested = max(available // plan.workers, 0)
+        raise ConnectionBudgetExceeded(
+            f"{plan.workers} workers x {plan.connections_per_worker} connections "
+            f"= {plan.total_connections}, but max_connections={max_connections} "
+            f"leaves {available} after {reserved} reserved. Lower WEB_CONCURRENCY "
+            f"or keep DB_POOL_SIZE + DB_MAX_OVERFLOW at or below {suggested} "
+            f"per worker."
+        )
+
+
+def check_multi_worker_settings(settings: Settings, workers: int) -> None:
+    """
+    Raise UnsafeWorkerConfig for per-process state that workers would split.
+
+    /metrics counters live in the process that served the scrape, so
+    successive scrapes would jump between workers and break rate().
+    memory:// rate-limit counters are kept per worker, so every limit would
+    silently allow ``workers`` times its configured rate.
+    """
+    if workers <= 1:
+        return
+    if settings.METRICS_ENABLED and settings.METRICS_TOKEN:
+        raise UnsafeWorkerConfig(
+            f"/metrics serves one process's counters, so a scrape would land "
+            f"on a random one of {workers} workers. Unset METRICS_TOKEN or "
+            f"run a single worker."
+        )
+    if settings.RATE_LIMIT_ENABLED and settings.RATE_LIMIT_STORAGE_URL.startswith(
+        "memory://"
+    ):
+        raise UnsafeWorkerConfig(
+            f"memory:// rate-limit counters are per process, so {workers} "
+            f"workers would allow {workers}x every limit. Set "
+            f"RATE_LIMIT_STORAGE_URL=postgresql:// (or redis://...)."
+        )
+
+
+def disable_worker_local_cache(settings: Settings, workers: int) -> bool:
+    """
+    Turn the memory:// report cache off for the workers; True if it was on.
+
+    A write invalidates that cache only in the worker that handled it. The
+    others would keep serving the old summary or budget status until the
+    TTL expires, and the data-version ETags would pin that stale body on
+    clients through 304s. Reports stay correct uncached, so this warns
+    rather than refusing to start.
+    """
+    if workers <= 1 or not settings.REPORT_CACHE_ENABLED:
+        return False
+    if not settings.REPORT_CACHE_URL.startswith("memory://"):
+        return False
+    logger.warning(
+        "The memory:// report cache is per process; disabling it for %d "
+        "workers. Set REPORT_CACHE_URL=redis://... to cache across workers.",
+        workers,
+    )
+    os.environ["REPORT_CACHE_ENABLED"] = "false"
+    return True
+
+
+def init_db_once() -> None:
+    """
+    Create tables here, before the workers start, when RUN_DB_INIT is set.
+
+    Workers would otherwise all run create_all concurrently against a fresh
+    database. They inherit RUN_DB_INIT=false and skip it.
+    """
+    from app.models import init_db
+
+    init_db()
+    os.environ["RUN_DB_INIT"] = "false"
+
+
+def fetch_max_connections(database_url: str) -> Optional[int]:
+    """Read max_connections from the server, or None if it is unreachable."""
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with engine.connect() as conn:
+            return int(conn.execute(text("SHOW max_connections")).scalar_one())
+    except SQLAlchemyError as exc:
+        logger.warning("Could not read max_connections (%s); skipping check", exc)
+        return None
+    finally:
+        engine.dispose()
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--check", action="store_true", help="Validate the connection budget and exit"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    settings = get_settings()
+    plan = ServerPlan(
+        workers=resolve_workers(settings, args.workers),
+        connections_per_worker=connections_per_worker(settings),
+    )
+
+    try:
+        check_multi_worker_settings(settings, plan.workers)
+    except UnsafeWorkerConfig as exc:
+        logger.error("%s", exc)
+        return 1
+    disable_worker_local_cache(settings, plan.workers)
+
+    max_connections = fetch_max_connections(settings.DATABASE_URL)
+    if max_connections is not None:
+        try:
+            check_connection_budget(
+                plan, max_connections, settings.DB_RESERVED_CONNECTIONS
+            )
+        except ConnectionBudgetExceeded as exc:
+            logger.error("%s", exc)
+            return 1
+    logger.info(
+        "Starting %d worker(s), up to %d DB connections each (%d total)",
+        plan.workers,
+        plan.connections_per_worker,
+        plan.total_connections,
+    )
+    if args.check:
+        return 0
+    if settings.RUN_DB_INIT:
+        init_db_once()
+
+    import uvicorn
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=plan.workers,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,9 @@ from app.services.budget_service import BudgetService
 from app.services.income_service import IncomeService
 from app.services.expense_service import ExpenseService
 from app.services.report_service import ReportService
+from app.services.export_service import ExportService
+from app.services.dashboard_service import DashboardService
+from app.services.data_version_service import DataVersionService
 
 __all__ = [
     "AuthService",
@@ -10,4 +13,7 @@ __all__ = [
     "IncomeService",
     "ExpenseService",
     "ReportService",
+    "ExportService",
+    "DashboardService",
+    "DataVersionService",
 ]
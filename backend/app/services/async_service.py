@@ -0,0 +1,56 @@
+"""
+Async facade for the synchronous services (DATABASE_ASYNC_ENABLED).
+
+Repositories and services are written against a synchronous ``Session``.
+Rather than maintaining a second copy of every query, ``AsyncService`` runs
+each service call inside ``AsyncSession.run_sync``: the same repository code
+executes on the session's greenlet, and every statement it issues is sent
+through the asyncpg driver, so the event loop is free while it waits.
+"""
+
+import inspect
+from typing import Any, Callable, Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+S = TypeVar("S")
+
+
+class AsyncService(Generic[S]):
+    """
+    Wrap a service so that its methods become coroutines.
+
+    *build* creates the service from a synchronous ``Session``; it is called
+    once per method call with the sync view of *session*. Building a service
+    performs no I/O, and a connection is only checked out once a repository
+    executes a statement.
+    """
+
+    def __init__(self, session: AsyncSession, build: Callable[[Session], S]):
+        self._session = session
+        self._build = build
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def _call(*args, **kwargs):
+            def _run(sync_session: Session):
+                return getattr(self._build(sync_session), name)(*args, **kwargs)
+
+            return await self._session.run_sync(_run)
+
+        return _call
+
+
+async def resolve(result: Any) -> Any:
+    """
+    Return a service call's result whether the service is sync or async.
+
+    Controllers wrap every service call in ``await resolve(...)`` so the same
+    handler works with the plain services and with ``AsyncService``.
+    """
+    if inspect.isawaitable(result):
+        return await result
+    return result
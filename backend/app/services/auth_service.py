@@ -1,11 +1,20 @@
 from uuid import UUID
 from typing import Optional
-from datetime import datetime, timedelta, timezone
+from starlette.concurrency import run_in_threadpool
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
-from app.repositories.login_attempt_repository import LoginAttemptRepository
-from app.utils.security import hash_password, verify_password, create_access_token
+from app.repositories.login_attempt_repository import (
+    LoginAttemptRepository,
+    LoginState,
+)
+from app.utils.security import (
+    PasswordHashingPool,
+    create_access_token,
+    hash_password,
+    verify_password,
+)
 from app.schemas.error_schemas import ErrorCodes
+from app.cache import PrincipalCache
 from app.config import get_settings
 
 settings = get_settings()
@@ -16,9 +25,30 @@ class AuthService:
         self,
         user_repository: UserRepository,
         login_attempt_repository: LoginAttemptRepository,
+        principal_cache: Optional[PrincipalCache] = None,
+        password_pool: Optional[PasswordHashingPool] = None,
     ):
         self.user_repository = user_repository
         self.login_attempt_repo = login_attempt_repository
+        self.principal_cache = principal_cache
+        self.password_pool = password_pool
+
+    def _bcrypt(self, func, *args):
+        """Run a bcrypt call on the password pool when one is configured."""
+        if self.password_pool is None:
+            return func(*args)
+        return self.password_pool.call(func, *args)
+
+    async def _bcrypt_async(self, func, *args):
+        """
+        Await a bcrypt call on the password pool when one is configured.
+
+        The event loop waits on the pool's future, so no threadpool thread
+        is held while the hash runs or queues.
+        """
+        if self.password_pool is None:
+            return await run_in_threadpool(func, *args)
+        return await self.password_pool.run(func, *args)
 
     def register_user(self, email: str, password: str, full_name: str) -> User:
         """
@@ -27,12 +57,32 @@ class AuthService:
         Raises:
             ValueError: If a user with this email already exists.
         """
-        existing_user = self.user_repository.get_by_email(email)
-        if existing_user:
+        self._ensure_email_free(email)
+        hashed_password = self._bcrypt(hash_password, password)
+        return self._create_user(email, hashed_password, full_name)
+
+    async def register_user_async(
+        self, email: str, password: str, full_name: str
+    ) -> User:
+        """
+        register_user for async callers.
+
+        The lookup and insert each take a threadpool thread only for the
+        query; the hash is awaited on the password pool in between.
+        """
+        await run_in_threadpool(self._ensure_email_free, email)
+        hashed_password = await self._bcrypt_async(hash_password, password)
+        return await run_in_threadpool(
+            self._create_user, email, hashed_password, full_name
+        )
+
+    def _ensure_email_free(self, email: str) -> None:
+        if self.user_repository.get_by_email(email):
             raise ValueError(
                 f"{ErrorCodes.USER_EXISTS}:User with this email already exists"
             )
-        hashed_password = hash_password(password)
+
+    def _create_user(self, email: str, hashed_password: str, full_name: str) -> User:
         user = User(email=email, hashed_password=hashed_password, full_name=full_name)
         return self.user_repository.create(user)
 
@@ -46,50 +96,81 @@ class AuthService:
         3. Verify password — records failure and raises if wrong
         4. Success — clears lockout record, issues JWT
 
-        After recording each failure the service checks whether the
-        threshold has been crossed and sets locked_until if so.
+        Steps 1 and 2 share one query. Recording a failure is a single
+        upsert that also sets locked_until once the threshold is reached,
+        and step 4 only deletes the lockout row when one exists.
 
         Raises:
             ValueError: AUTH_INVALID_CREDENTIALS on lockout or bad creds.
         """
-        # Step 1 — DB-backed lockout check
-        if self.login_attempt_repo.is_locked(email):
+        state = self._load_login_state(email)
+        # Step 3 — Verify password (bcrypt constant-time compare)
+        verified = self._bcrypt(verify_password, password, state.user.hashed_password)
+        return self._finish_login(email, state, verified)
+
+    async def login_user_async(self, email: str, password: str) -> str:
+        """
+        login_user for async callers.
+
+        Steps 1, 2 and 4 take a threadpool thread only for their queries;
+        the bcrypt check is awaited on the password pool, so a login burst
+        cannot tie up the threadpool that sync endpoints run on.
+        """
+        state = await run_in_threadpool(self._load_login_state, email)
+        verified = await self._bcrypt_async(
+            verify_password, password, state.user.hashed_password
+        )
+        return await run_in_threadpool(self._finish_login, email, state, verified)
+
+    def _load_login_state(self, email: str) -> LoginState:
+        """Steps 1 + 2 — lockout row and user, read together."""
+        state = self.login_attempt_repo.get_login_state(email)
+        if state.is_locked():
             raise ValueError(
                 f"{ErrorCodes.AUTH_INVALID_CREDENTIALS}:"
                 f"Too many failed login attempts. "
                 f"Try again in {settings.LOGIN_LOCKOUT_WINDOW_MINUTES} minutes."
             )
 
-        # Step 2 — Fetch user
-        user = self.user_repository.get_by_email(email)
-        if not user:
-            self._record_and_maybe_lock(email)
+        if not state.user:
+            self._record_failure(email)
             raise ValueError(
                 f"{ErrorCodes.AUTH_INVALID_CREDENTIALS}:Invalid email or password"
             )
+        return state
 
-        # Step 3 — Verify password (bcrypt constant-time compare)
-        if not verify_password(password, user.hashed_password):
-            self._record_and_maybe_lock(email)
+    def _finish_login(self, email: str, state: LoginState, verified: bool) -> str:
+        """Record a failed step 3, or complete step 4."""
+        user = state.user
+        if not verified:
+            self._record_failure(email)
             raise ValueError(
                 f"{ErrorCodes.AUTH_INVALID_CREDENTIALS}:Invalid email or password"
             )
 
         # Step 4 — Success
-        self.login_attempt_repo.clear(email)
+        if state.has_attempts:
+            self.login_attempt_repo.clear(email)
         return create_access_token(user.id, user.email)
 
-    def _record_and_maybe_lock(self, email: str) -> None:
-        """Record a failure; set locked_until if the threshold is now met."""
-        attempt = self.login_attempt_repo.record_failure(
-            email, settings.LOGIN_LOCKOUT_WINDOW_MINUTES
+    def _record_failure(self, email: str) -> None:
+        """Record a failure; the upsert locks the email at the threshold."""
+        self.login_attempt_repo.record_failure(
+            email,
+            settings.LOGIN_LOCKOUT_WINDOW_MINUTES,
+            settings.LOGIN_LOCKOUT_MAX_ATTEMPTS,
         )
-        if attempt and attempt.attempt_count >= settings.LOGIN_LOCKOUT_MAX_ATTEMPTS:
-            locked_until = datetime.now(timezone.utc) + timedelta(
-                minutes=settings.LOGIN_LOCKOUT_WINDOW_MINUTES
-            )
-            self.login_attempt_repo.set_locked(email, locked_until)
 
     def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
-        return self.user_repository.get_by_id(user_id)
\ No newline at end of file
+        return self.user_repository.get_by_id(user_id)
+
+    def delete_user(self, user_id: UUID) -> bool:
+        """
+        Delete a user and evict them from the principal cache so their
+        outstanding tokens stop authenticating on this worker immediately.
+        """
+        deleted = self.user_repository.delete(user_id)
+        if self.principal_cache is not None:
+            self.principal_cache.invalidate(user_id)
+        return deleted
@@ -1,11 +1,14 @@
 from uuid import UUID
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
 import re
+from app.cache import ReportCache
 from app.models.budget import Budget
 from app.repositories.budget_repository import BudgetRepository
+from app.repositories.data_version_repository import DataVersionRepository
 from app.schemas.error_schemas import ErrorCodes
+from app.utils.validators import as_date, get_month_range
 
 try:
     from sqlalchemy.exc import IntegrityError as SAIntegrityError
@@ -21,12 +24,30 @@ class BudgetService:
     - Amount validation (must be > 0)
     - User-scoped access control (users can only read/update their own budgets)
     - Duplicate-budget prevention with race-condition-safe DB fallback
+    - Budget-vs-actual status (remaining, burn rate, month-end projection)
     """
 
     _MONTH_RE = re.compile(r"^\d{4}-\d{2}$")
-
-    def __init__(self, budget_repository: BudgetRepository):
+    _CENT = Decimal("0.01")
+
+    def __init__(
+        self,
+        budget_repository: BudgetRepository,
+        report_cache: Optional[ReportCache] = None,
+        data_version_repository: Optional[DataVersionRepository] = None,
+    ):
         self.budget_repository = budget_repository
+        self.report_cache = report_cache
+        self.data_version_repository = data_version_repository
+
+    @staticmethod
+    def utc_now():
+        return datetime.now(timezone.utc)
+
+    def _data_version(self, user_id: UUID) -> Optional[int]:
+        if self.data_version_repository is None:
+            return None
+        return self.data_version_repository.get(user_id)
 
     @classmethod
     def _validate_month_strict(cls, month: str) -> None:
@@ -72,7 +93,7 @@ class BudgetService:
         budget = Budget(user_id=user_id, month=month, amount=amount)
 
         try:
-            return self.budget_repository.create(budget)
+            created = self.budget_repository.create(budget)
         except Exception as e:
             if SAIntegrityError is not None and isinstance(e, SAIntegrityError):
                 db_error = str(getattr(e, "orig", e)).lower()
@@ -109,6 +130,9 @@ class BudgetService:
 
             raise
 
+        self._invalidate_status(user_id, month)
+        return created
+
     def get_budget_by_id(self, budget_id: UUID, user_id: UUID) -> Budget:
         """Return the budget identified by budget_id, enforcing user ownership.
 
@@ -139,7 +163,14 @@ class BudgetService:
             )
         budget = self.get_budget_by_id(budget_id, user_id)
         budget.amount = new_amount
-        return self.budget_repository.update(budget)
+        updated = self.budget_repository.update(budget)
+        self._invalidate_status(user_id, updated.month)
+        return updated
+
+    def _invalidate_status(self, user_id: UUID, month: str) -> None:
+        """Drop the cached budget status after a committed budget write."""
+        if self.report_cache is not None:
+            self.report_cache.invalidate_budget(user_id, month)
 
     def get_current_month_budget(self, user_id: UUID) -> Budget:
         """Return the budget for the current calendar month (UTC) for user_id.
@@ -151,4 +182,72 @@ class BudgetService:
         budget = self.budget_repository.get_by_user_and_month(user_id, current_month)
         if not budget:
             raise ValueError(f"{ErrorCodes.BUD_NOT_FOUND}:Budget not found")
-        return budget
\ No newline at end of file
+        return budget
+
+    def get_budget_status(self, user_id: UUID, month: str) -> Dict:
+        """Return the month's budget against the expenses recorded so far.
+
+        Budget amount and spend come from one joined query (cached with the
+        monthly reports and invalidated by the same writes). The figures
+        that depend on today's date are derived on every call:
+
+        - days_elapsed: 0 before the month starts, the whole month after it
+        - daily_burn_rate: spent / days_elapsed (0 when nothing has elapsed)
+        - projected_spend: burn rate carried to month end; equals spent
+          once the month is over or before it begins
+
+        Raises:
+            ValueError: BUD_INVALID_MONTH, or BUD_NOT_FOUND when the user
+                has no budget for the month.
+        """
+        budget_status = self.find_budget_status(user_id, month)
+        if budget_status is None:
+            raise ValueError(f"{ErrorCodes.BUD_NOT_FOUND}:Budget not found")
+        return budget_status
+
+    def find_budget_status(self, user_id: UUID, month: str) -> Optional[Dict]:
+        """Same as get_budget_status, but None when the month has no budget.
+
+        Raises:
+            ValueError: BUD_INVALID_MONTH if format or range is invalid.
+        """
+        self._validate_month_strict(month)
+
+        spend = None
+        if self.report_cache is not None:
+            # Read before the spend query; see ReportCache.
+            version = self._data_version(user_id)
+            spend = self.report_cache.get_budget_spend(user_id, month, version)
+        if spend is None:
+            start_date, end_date = get_month_range(month)
+            spend = self.budget_repository.get_spend(
+                user_id, month, start_date, end_date
+            )
+            if spend is None:
+                return None
+            if self.report_cache is not None:
+                self.report_cache.set_budget_spend(user_id, month, spend, version)
+
+        start, end = (as_date(bound) for bound in get_month_range(month))
+        as_of = self.utc_now().date()
+        days_in_month = (end - start).days
+        days_elapsed = min(max((as_of - start).days + 1, 0), days_in_month)
+
+        if days_elapsed:
+            burn_rate = spend.spent / days_elapsed
+            projected = burn_rate * days_in_month
+        else:
+            burn_rate, projected = Decimal("0"), spend.spent
+
+        return {
+            "budget_id": spend.budget_id,
+            "month": month,
+            "amount": spend.amount,
+            "spent": spend.spent,
+            "remaining": spend.amount - spend.spent,
+            "daily_burn_rate": burn_rate.quantize(self._CENT, ROUND_HALF_UP),
+            "projected_spend": projected.quantize(self._CENT, ROUND_HALF_UP),
+            "days_elapsed": days_elapsed,
+            "days_in_month": days_in_month,
+            "as_of": as_of,
+        }
@@ -0,0 +1,57 @@
+from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+from app.services.budget_service import BudgetService
+from app.services.expense_service import ExpenseService
+from app.services.report_service import ReportService
+from app.utils.validators import as_date, get_month_range
+
+
+class DashboardService:
+    """Home screen service — the current month at a glance.
+
+    Composes the budget, report and expense services, which share the
+    request's session, so the screen costs one authenticated request
+    instead of three. Each part takes its cheapest path: the budget status
+    is one budget/expense join, the summary a rollup row, and both are
+    served from ReportCache when warm; only the recent-expenses page always
+    queries.
+    """
+
+    def __init__(
+        self,
+        budget_service: BudgetService,
+        report_service: ReportService,
+        expense_service: ExpenseService,
+    ):
+        self.budget_service = budget_service
+        self.report_service = report_service
+        self.expense_service = expense_service
+
+    @staticmethod
+    def utc_now():
+        return datetime.now(timezone.utc)
+
+    def get_dashboard(self, user_id: UUID, recent_limit: int) -> Dict:
+        """Return the current month's budget status, summary and latest expenses.
+
+        ``budget`` is None when the month has no budget; ``recent_expenses``
+        holds at most *recent_limit* of the month's expenses, newest first.
+        """
+        now = self.utc_now()
+        month = now.strftime("%Y-%m")
+        start, end = (as_date(bound) for bound in get_month_range(month))
+
+        recent = self.expense_service.list_expenses(
+            user_id=user_id,
+            limit=recent_limit,
+            start_date=start,
+            end_date=end - timedelta(days=1),
+        )
+        return {
+            "month": month,
+            "budget": self.budget_service.find_budget_status(user_id, month),
+            "summary": self.report_service.get_monthly_summary(user_id, month),
+            "recent_expenses": recent["items"],
+            "generated_at": now,
+        }
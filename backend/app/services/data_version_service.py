@@ -0,0 +1,19 @@
+from uuid import UUID
+from app.repositories.data_version_repository import DataVersionRepository
+
+
+class DataVersionService:
+    """Per-user data version for conditional GETs.
+
+    The version only grows, and every budget, income and expense write bumps
+    it in the write's own transaction. Controllers read it before loading
+    any data and derive their ETag from it (app/utils/etag.py), so an
+    unchanged resource is revalidated with one primary-key lookup and a 304.
+    """
+
+    def __init__(self, data_version_repository: DataVersionRepository):
+        self.data_version_repository = data_version_repository
+
+    def get_data_version(self, user_id: UUID) -> int:
+        """Return the user's current data version."""
+        return self.data_version_repository.get(user_id)
@@ -1,17 +1,25 @@
 from uuid import UUID
 from decimal import Decimal
 from datetime import date
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 from app.models.expense import Expense
 from app.repositories.expense_repository import ExpenseRepository
 from app.schemas.error_schemas import ErrorCodes
+from app.cache import ReportCache
+from app.utils.bulk_import import row_error
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 class ExpenseService:
     """Expense service containing business logic."""
 
-    def __init__(self, expense_repository: ExpenseRepository):
+    def __init__(
+        self,
+        expense_repository: ExpenseRepository,
+        report_cache: Optional[ReportCache] = None,
+    ):
         self.expense_repository = expense_repository
+        self.report_cache = report_cache
 
     def add_expense(
         self,
@@ -32,6 +40,60 @@ class ExpenseService:
         Raises:
             ValueError: If amount <= 0 or category invalid
         """
+        expense = Expense(
+            user_id=user_id,
+            amount=amount,
+            category=self._validated_category(amount, category),
+            date=expense_date,
+            note=note,
+        )
+
+        # Persist expense, then drop the now-stale cached report
+        created = self.expense_repository.create(expense)
+        self._invalidate_report(user_id, expense_date)
+        return created
+
+    def add_expenses_bulk(
+        self, user_id: UUID, rows: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Validate many expenses and insert the valid ones in one transaction.
+
+        *rows* pairs a 1-based row number with add_expense keyword arguments
+        (amount, category, expense_date, note). Rows that break a business
+        rule are skipped and reported; they do not abort the batch.
+
+        Returns:
+            {"imported": int, "errors": [{"row", "code", "message"}, ...]}
+        """
+        values: list[Dict[str, Any]] = []
+        errors: list[Dict[str, Any]] = []
+        for row, fields in rows:
+            try:
+                category = self._validated_category(
+                    fields["amount"], fields["category"]
+                )
+            except ValueError as e:
+                errors.append(row_error(row, e))
+                continue
+            values.append(
+                {
+                    "user_id": user_id,
+                    "amount": fields["amount"],
+                    "category": category,
+                    "date": fields["expense_date"],
+                    "note": fields.get("note"),
+                }
+            )
+
+        imported = self.expense_repository.bulk_create(values)
+        for month_start in {value["date"].replace(day=1) for value in values}:
+            self._invalidate_report(user_id, month_start)
+        return {"imported": imported, "errors": errors}
+
+    @staticmethod
+    def _validated_category(amount: Decimal, category: str) -> str:
+        """Apply the expense business rules; return the normalized category."""
         # Validate amount
         if amount <= 0:
             raise ValueError(
@@ -43,26 +105,81 @@ class ExpenseService:
                 f"{ErrorCodes.EXP_INVALID_CATEGORY}:Expense category must be provided"
             )
 
-        # Create expense entity
-        expense = Expense(
+        return category.strip()
+
+    def _invalidate_report(self, user_id: UUID, expense_date: date) -> None:
+        """Invalidate the cached summary for the month of a committed write.
+
+        Every write path (add, and any future update/delete) must call this
+        after the repository commit, once per affected month.
+        """
+        if self.report_cache is not None:
+            self.report_cache.invalidate_date(user_id, expense_date)
+
+    def list_expenses(
+        self,
+        user_id: UUID,
+        limit: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a user's expenses, newest first.
+
+        Pass the returned ``next_cursor`` back as *cursor* to fetch the next
+        page; it is None on the last page. Filters must stay the same across
+        pages of one listing.
+
+        Raises:
+            ValueError: VAL-004 for an inverted date or amount range or a
+                non-positive limit; VAL-003 for a malformed cursor.
+        """
+        if limit < 1:
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_RANGE}:Page size must be at least 1"
+            )
+        if start_date and end_date and start_date > end_date:
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_RANGE}:'from' must not be after 'to'"
+            )
+        if (
+            min_amount is not None
+            and max_amount is not None
+            and min_amount > max_amount
+        ):
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_RANGE}:min_amount must not exceed max_amount"
+            )
+
+        # Fetch one extra row to learn whether another page exists.
+        rows = self.expense_repository.list_page(
             user_id=user_id,
-            amount=amount,
-            category=category.strip(),
-            date=expense_date,
-            note=note,
+            limit=limit + 1,
+            start_date=start_date,
+            end_date=end_date,
+            category=category.strip() if category else None,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            after=decode_cursor(cursor) if cursor else None,
         )
-
-        # Persist expense
-        return self.expense_repository.create(expense)
+        items = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(items[-1].date, items[-1].id)
+        return {"items": items, "next_cursor": next_cursor}
 
     def get_current_month_expenses(self, user_id: UUID) -> list[Expense]:
         """
-        Get current month's expenses for a user.
+        Get current month's (UTC) expenses for a user.
 
         """
-        from datetime import datetime
+        from datetime import datetime, timezone
 
-        current_month = datetime.now().strftime("%Y-%m")
+        current_month = datetime.now(timezone.utc).strftime("%Y-%m")
         print(
             "DEBUG: Fetching current month expenses for user_id:",
             user_id,
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import Callable, Iterator, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.repositories.export_repository import ExportRepository
+from app.schemas.error_schemas import ErrorCodes
+
+
+class ExportService:
+    """
+    Transaction export as CSV or NDJSON.
+
+    Exports are streamed: ``export_transactions`` validates its arguments
+    up front and returns an iterator of text chunks that a
+    ``StreamingResponse`` consumes after the endpoint has returned. Because
+    request-scoped sessions are closed by then, the iterator opens its own
+    session from *session_factory* and closes it when the export ends or
+    the client disconnects.
+    """
+
+    FORMATS = ("csv", "ndjson")
+    MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+    CSV_COLUMNS = ("type", "id", "date", "amount", "category", "source", "note")
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 1000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    def export_transactions(
+        self,
+        user_id: UUID,
+        export_format: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[str]:
+        """
+        Return an iterator over the export body, one chunk per batch.
+
+        Raises:
+            ValueError: VAL-003 for an unknown format, VAL-004 when
+                start_date is after end_date. Raised here, before any
+                bytes are sent, so the client still gets a JSON error.
+        """
+        if export_format not in self.FORMATS:
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_FORMAT}:format must be one of "
+                + ", ".join(self.FORMATS)
+            )
+        if start_date and end_date and start_date > end_date:
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_RANGE}:'from' must not be after 'to'"
+            )
+        return self._stream(user_id, export_format, start_date, end_date)
+
+    def _stream(
+        self,
+        user_id: UUID,
+        export_format: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if export_format == "csv" else None
+        if writer is not None:
+            # Send the header at once so the download starts immediately.
+            writer.writerow(self.CSV_COLUMNS)
+            yield self._drain(buffer)
+
+        with self.session_factory() as db:
+            rows = ExportRepository(db).iter_transactions(
+                user_id, start_date, end_date, batch_size=self.batch_size
+            )
+            for count, row in enumerate(rows, start=1):
+                if writer is not None:
+                    writer.writerow(["" if value is None else value for value in row])
+                else:
+                    buffer.write(self._ndjson_line(row))
+                if count % self.batch_size == 0:
+                    yield self._drain(buffer)
+
+        tail = self._drain(buffer)
+        if tail:
+            yield tail
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        """Return the buffered text and empty the buffer."""
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    @staticmethod
+    def _ndjson_line(row) -> str:
+        """One JSON object per row; columns that do not apply are omitted."""
+        record = {
+            key: value for key, value in row._asdict().items() if value is not None
+        }
+        return json.dumps(record, default=str) + "\n"
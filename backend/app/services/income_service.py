@@ -1,16 +1,24 @@
 from uuid import UUID
 from decimal import Decimal
 from datetime import date
+from typing import Any, Dict, Iterable, Optional, Tuple
 from app.models.income import Income
 from app.repositories.income_repository import IncomeRepository
 from app.schemas.error_schemas import ErrorCodes
+from app.cache import ReportCache
+from app.utils.bulk_import import row_error
 
 
 class IncomeService:
     """Income service containing business logic."""
 
-    def __init__(self, income_repository: IncomeRepository):
+    def __init__(
+        self,
+        income_repository: IncomeRepository,
+        report_cache: Optional[ReportCache] = None,
+    ):
         self.income_repository = income_repository
+        self.report_cache = report_cache
 
     def add_income(
         self, user_id: UUID, amount: Decimal, source: str, income_date: date
@@ -26,6 +34,56 @@ class IncomeService:
         Raises:
             ValueError: If amount <= 0 or source invalid
         """
+        income = Income(
+            user_id=user_id,
+            amount=amount,
+            source=self._validated_source(amount, source),
+            date=income_date,
+        )
+
+        # Persist income, then drop the now-stale cached report
+        created = self.income_repository.create(income)
+        self._invalidate_report(user_id, income_date)
+        return created
+
+    def add_incomes_bulk(
+        self, user_id: UUID, rows: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Validate many incomes and insert the valid ones in one transaction.
+
+        *rows* pairs a 1-based row number with add_income keyword arguments
+        (amount, source, income_date). Rows that break a business rule are
+        skipped and reported; they do not abort the batch.
+
+        Returns:
+            {"imported": int, "errors": [{"row", "code", "message"}, ...]}
+        """
+        values: list[Dict[str, Any]] = []
+        errors: list[Dict[str, Any]] = []
+        for row, fields in rows:
+            try:
+                source = self._validated_source(fields["amount"], fields["source"])
+            except ValueError as e:
+                errors.append(row_error(row, e))
+                continue
+            values.append(
+                {
+                    "user_id": user_id,
+                    "amount": fields["amount"],
+                    "source": source,
+                    "date": fields["income_date"],
+                }
+            )
+
+        imported = self.income_repository.bulk_create(values)
+        for month_start in {value["date"].replace(day=1) for value in values}:
+            self._invalidate_report(user_id, month_start)
+        return {"imported": imported, "errors": errors}
+
+    @staticmethod
+    def _validated_source(amount: Decimal, source: str) -> str:
+        """Apply the income business rules; return the normalized source."""
         # Validate amount
         if amount <= 0:
             raise ValueError(
@@ -37,10 +95,13 @@ class IncomeService:
                 f"{ErrorCodes.INC_INVALID_SOURCE}:Income source must be provided"
             )
 
-        # Create income entity
-        income = Income(
-            user_id=user_id, amount=amount, source=source.strip(), date=income_date
-        )
+        return source.strip()
+
+    def _invalidate_report(self, user_id: UUID, income_date: date) -> None:
+        """Invalidate the cached summary for the month of a committed write.
 
-        # Persist income
-        return self.income_repository.create(income)
+        Every write path (add, and any future update/delete) must call this
+        after the repository commit, once per affected month.
+        """
+        if self.report_cache is not None:
+            self.report_cache.invalidate_date(user_id, income_date)
@@ -1,10 +1,19 @@
 from uuid import UUID
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
 from app.repositories.income_repository import IncomeRepository
 from app.repositories.expense_repository import ExpenseRepository
-from app.utils.validators import validate_month_format, get_month_range
+from app.repositories.report_repository import ReportRepository, SummaryAggregates
+from app.repositories.monthly_rollup_repository import MonthlyRollupRepository
+from app.repositories.data_version_repository import DataVersionRepository
+from app.cache import ReportCache
+from app.utils.validators import (
+    validate_month_format,
+    get_month_range,
+    month_span,
+    months_between,
+)
 from app.schemas.error_schemas import ErrorCodes
 from datetime import datetime, timezone
 
@@ -18,6 +27,11 @@ class ReportCalculationStrategy(ABC):
         """Calculate metric from data."""
         pass
 
+    @abstractmethod
+    def calculate_aggregated(self, aggregates: SummaryAggregates) -> Decimal:
+        """Calculate metric from totals already aggregated by the database."""
+        pass
+
 
 class TotalIncomeStrategy(ReportCalculationStrategy):
     """Strategy for calculating total income."""
@@ -26,6 +40,10 @@ class TotalIncomeStrategy(ReportCalculationStrategy):
         """Calculate total income."""
         return sum(income.amount for income in incomes) if incomes else Decimal("0")
 
+    def calculate_aggregated(self, aggregates: SummaryAggregates) -> Decimal:
+        """Return the income total computed by the database."""
+        return aggregates.total_income
+
 
 class TotalExpensesStrategy(ReportCalculationStrategy):
     """Strategy for calculating total expenses."""
@@ -34,6 +52,10 @@ class TotalExpensesStrategy(ReportCalculationStrategy):
         """Calculate total expenses."""
         return sum(expense.amount for expense in expenses) if expenses else Decimal("0")
 
+    def calculate_aggregated(self, aggregates: SummaryAggregates) -> Decimal:
+        """Sum the per-category totals (one value per category, not per row)."""
+        return sum(aggregates.expenses_by_category.values(), Decimal("0"))
+
 
 class ExpensesByCategoryStrategy(ReportCalculationStrategy):
     """Strategy for grouping expenses by category."""
@@ -48,6 +70,10 @@ class ExpensesByCategoryStrategy(ReportCalculationStrategy):
                 category_totals[expense.category] = expense.amount
         return category_totals
 
+    def calculate_aggregated(self, aggregates: SummaryAggregates) -> Dict[str, Decimal]:
+        """Return the per-category totals grouped by the database."""
+        return dict(aggregates.expenses_by_category)
+
 
 # Factory Pattern: Report Generator Factory
 class ReportGenerator:
@@ -87,6 +113,105 @@ class ReportGenerator:
             "expenses_by_category": expenses_by_category,
         }
 
+    def generate_range(self, user_id: UUID, months: List[str]) -> List[Dict]:
+        """Generate one report per month (two queries per month)."""
+        return [self.generate(user_id, month) for month in months]
+
+
+class AggregatedReportGenerator:
+    """
+    Report generator that lets PostgreSQL do the summing.
+
+    Fetches one row per expense category plus one income row, so the cost
+    of a report stays flat as the number of transactions in a month grows.
+    """
+
+    def __init__(self, report_repository: ReportRepository):
+        self.report_repository = report_repository
+        self.total_income_strategy = TotalIncomeStrategy()
+        self.total_expenses_strategy = TotalExpensesStrategy()
+        self.expenses_by_category_strategy = ExpensesByCategoryStrategy()
+
+    def generate(self, user_id: UUID, month: str) -> Dict:
+        """Generate report from database-side aggregates."""
+        start_date, end_date = get_month_range(month)
+        aggregates = self.report_repository.get_summary_aggregates(
+            user_id, start_date, end_date
+        )
+        return self._build(month, aggregates)
+
+    def generate_range(self, user_id: UUID, months: List[str]) -> List[Dict]:
+        """Generate one report per month from a single grouped query."""
+        start_date, _ = get_month_range(months[0])
+        _, end_date = get_month_range(months[-1])
+        by_month = self.report_repository.get_range_aggregates(
+            user_id, start_date, end_date
+        )
+        return [
+            self._build(month, by_month.get(month, SummaryAggregates()))
+            for month in months
+        ]
+
+    def _build(self, month: str, aggregates: SummaryAggregates) -> Dict:
+        """Apply the calculation strategies to pre-aggregated totals."""
+        total_income = self.total_income_strategy.calculate_aggregated(aggregates)
+        total_expenses = self.total_expenses_strategy.calculate_aggregated(aggregates)
+        net_balance = total_income - total_expenses
+        expenses_by_category = (
+            self.expenses_by_category_strategy.calculate_aggregated(aggregates)
+        )
+
+        return {
+            "month": month,
+            "total_income": total_income,
+            "total_expenses": total_expenses,
+            "net_balance": net_balance,
+            "expenses_by_category": expenses_by_category,
+        }
+
+
+class RollupReportGenerator(AggregatedReportGenerator):
+    """
+    Report generator that reads the pre-computed ``monthly_rollups`` row.
+
+    A single primary-key lookup regardless of how many transactions the
+    month contains. A missing row means the user has no activity that month.
+    """
+
+    def __init__(self, rollup_repository: MonthlyRollupRepository):
+        super().__init__(report_repository=None)
+        self.rollup_repository = rollup_repository
+
+    def generate(self, user_id: UUID, month: str) -> Dict:
+        """Generate report from the month's rollup row."""
+        rollup = self.rollup_repository.get(user_id, month)
+        return self._build(month, self._aggregates(rollup))
+
+    def generate_range(self, user_id: UUID, months: List[str]) -> List[Dict]:
+        """Generate one report per month from a single rollup range scan."""
+        rollups = {
+            rollup.month: rollup
+            for rollup in self.rollup_repository.get_range(
+                user_id, months[0], months[-1]
+            )
+        }
+        return [
+            self._build(month, self._aggregates(rollups.get(month)))
+            for month in months
+        ]
+
+    @staticmethod
+    def _aggregates(rollup) -> SummaryAggregates:
+        if rollup is None:
+            return SummaryAggregates()
+        return SummaryAggregates(
+            total_income=Decimal(rollup.total_income),
+            expenses_by_category={
+                category: Decimal(total)
+                for category, total in (rollup.expenses_by_category or {}).items()
+            },
+        )
+
 
 class ReportGeneratorFactory:
     """Factory for creating report generators."""
@@ -98,16 +223,42 @@ class ReportGeneratorFactory:
         """Create monthly summary report generator."""
         return ReportGenerator(income_repository, expense_repository)
 
+    @staticmethod
+    def create_aggregated_summary_generator(
+        report_repository: ReportRepository,
+    ) -> AggregatedReportGenerator:
+        """Create monthly summary generator backed by SQL aggregates."""
+        return AggregatedReportGenerator(report_repository)
+
+    @staticmethod
+    def create_rollup_summary_generator(
+        rollup_repository: MonthlyRollupRepository,
+    ) -> RollupReportGenerator:
+        """Create monthly summary generator backed by the rollup table."""
+        return RollupReportGenerator(rollup_repository)
+
 
 # Service Layer
 class ReportService:
     """Report service containing business logic."""
 
     def __init__(
-        self, income_repository: IncomeRepository, expense_repository: ExpenseRepository
+        self,
+        income_repository: IncomeRepository,
+        expense_repository: ExpenseRepository,
+        report_repository: Optional[ReportRepository] = None,
+        rollup_repository: Optional[MonthlyRollupRepository] = None,
+        report_cache: Optional[ReportCache] = None,
+        max_range_months: int = 24,
+        data_version_repository: Optional[DataVersionRepository] = None,
     ):
         self.income_repository = income_repository
         self.expense_repository = expense_repository
+        self.report_repository = report_repository
+        self.rollup_repository = rollup_repository
+        self.report_cache = report_cache
+        self.max_range_months = max_range_months
+        self.data_version_repository = data_version_repository
 
     @staticmethod
     def utc_now():
@@ -130,10 +281,93 @@ class ReportService:
         if not is_valid:
             raise ValueError(f"{ErrorCodes.RPT_INVALID_MONTH}:{error_message}")
 
-        # Create report generator using factory
-        generator = ReportGeneratorFactory.create_monthly_summary_generator(
-            self.income_repository, self.expense_repository
-        )
+        if self.report_cache is not None:
+            # Read before generating, so a write committed meanwhile moves
+            # the version past the one this fill is stored under.
+            version = self._data_version(user_id)
+            cached = self.report_cache.get_summary(user_id, month, version)
+            if cached is not None:
+                return cached
 
         # Generate report
-        return generator.generate(user_id, month)
+        summary = self._generator().generate(user_id, month)
+        if self.report_cache is not None:
+            self.report_cache.set_summary(user_id, month, summary, version)
+        return summary
+
+    def _data_version(self, user_id: UUID) -> Optional[int]:
+        if self.data_version_repository is None:
+            return None
+        return self.data_version_repository.get(user_id)
+
+    def get_range_summary(
+        self, user_id: UUID, start_month: str, end_month: str
+    ) -> Dict:
+        """
+        Generate per-month summaries for an inclusive span of months.
+
+        Business Rules:
+        - Both bounds must be in valid YYYY-MM format
+        - start_month must not be after end_month
+        - The span is capped at max_range_months months
+        - Every month in the span is reported, with zero totals when empty
+
+        Returns a dict with the span's overall totals and a ``months`` list
+        holding one monthly-summary dict per month, oldest first.
+
+        Raises:
+            ValueError: RPT-001 for a malformed month, VAL-004 for a
+                reversed or oversized span
+        """
+        for month in (start_month, end_month):
+            is_valid, error_message = validate_month_format(month)
+            if not is_valid:
+                raise ValueError(f"{ErrorCodes.RPT_INVALID_MONTH}:{error_message}")
+
+        span = month_span(start_month, end_month)
+        if span < 1:
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_RANGE}:'from' must not be after 'to'"
+            )
+        if span > self.max_range_months:
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_RANGE}:Range is limited to "
+                f"{self.max_range_months} months"
+            )
+        months = months_between(start_month, end_month)
+
+        summaries = self._generator().generate_range(user_id, months)
+
+        expenses_by_category: Dict[str, Decimal] = {}
+        for summary in summaries:
+            for category, total in summary["expenses_by_category"].items():
+                expenses_by_category[category] = (
+                    expenses_by_category.get(category, Decimal("0")) + total
+                )
+        total_income = sum((s["total_income"] for s in summaries), Decimal("0"))
+        total_expenses = sum((s["total_expenses"] for s in summaries), Decimal("0"))
+
+        return {
+            "start_month": start_month,
+            "end_month": end_month,
+            "total_income": total_income,
+            "total_expenses": total_expenses,
+            "net_balance": total_income - total_expenses,
+            "expenses_by_category": expenses_by_category,
+            "months": summaries,
+        }
+
+    def _generator(self):
+        # Create report generator using factory. Prefer the maintained rollup
+        # row (O(1)), then SQL aggregates, then summing ORM rows in Python.
+        if self.rollup_repository is not None:
+            return ReportGeneratorFactory.create_rollup_summary_generator(
+                self.rollup_repository
+            )
+        if self.report_repository is not None:
+            return ReportGeneratorFactory.create_aggregated_summary_generator(
+                self.report_repository
+            )
+        return ReportGeneratorFactory.create_monthly_summary_generator(
+            self.income_repository, self.expense_repository
+        )
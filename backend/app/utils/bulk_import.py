@@ -0,0 +1,193 @@
+"""Request-body parsing for the bulk import endpoints.
+
+Three body formats are accepted, selected by Content-Type:
+
+    application/json        a JSON array of row objects
+    application/x-ndjson    one JSON object per line, parsed as it streams in
+    text/csv                a header row followed by one row per line
+
+Each row is validated against the single-item request schema; rows that
+fail are reported by 1-based row number instead of rejecting the request.
+
+Bodies are read from the request stream with a byte cap, and NDJSON and
+CSV rows are parsed as their lines arrive, so an oversized upload is
+rejected once it crosses the row or byte limit rather than after it has
+been buffered whole.
+"""
+
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, List, Tuple, Type, TypeVar
+
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+
+from app.schemas.error_schemas import ErrorCodes
+
+M = TypeVar("M", bound=BaseModel)
+
+JSON_TYPES = ("application/json",)
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+CSV_TYPES = ("text/csv",)
+
+
+def row_error(row: int, error: Exception | str) -> Dict[str, Any]:
+    """Build a per-row error from a ``"CODE:message"`` ValueError or string."""
+    code, _, message = str(error).partition(":")
+    if not message:
+        code, message = ErrorCodes.VAL_INVALID_INPUT, code
+    return {"row": row, "code": code.strip(), "message": message.strip()}
+
+
+def _validation_message(exc: ValidationError) -> str:
+    issues = []
+    for e in exc.errors():
+        field = ".".join(str(x) for x in e.get("loc", ()))
+        issues.append(f"{field}: {e.get('msg')}" if field else e.get("msg"))
+    return "; ".join(issues)
+
+
+async def _iter_chunks(request: Request, max_bytes: int) -> AsyncIterator[bytes]:
+    """Yield body chunks, raising VAL-004 once more than *max_bytes* arrived."""
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_RANGE}:Bulk import body is limited to "
+                f"{max_bytes} bytes"
+            )
+        yield chunk
+
+
+async def _iter_lines(request: Request, max_bytes: int) -> AsyncIterator[str]:
+    """Yield decoded body lines as chunks arrive, without buffering the body."""
+    pending = b""
+    async for chunk in _iter_chunks(request, max_bytes):
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace")
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+async def _iter_csv_records(request: Request, max_bytes: int) -> AsyncIterator[list]:
+    """Yield parsed CSV records; a quoted field may span several lines."""
+    record = ""
+    async for line in _iter_lines(request, max_bytes):
+        record += line + "\n"
+        # An odd number of quotes means a quoted field is still open.
+        if record.count('"') % 2:
+            continue
+        values = next(csv.reader([record]), [])
+        record = ""
+        if values:
+            yield values
+    if record:
+        values = next(csv.reader([record]), [])
+        if values:
+            yield values
+
+
+async def _raw_rows(
+    request: Request, max_bytes: int
+) -> AsyncIterator[Tuple[int, Any]]:
+    """Yield ``(row_number, raw_row)``; raw_row is None for undecodable rows."""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if content_type in JSON_TYPES:
+        # A JSON array cannot be split into rows before it is complete, so
+        # only the byte cap bounds what is buffered here.
+        body = b"".join([chunk async for chunk in _iter_chunks(request, max_bytes)])
+        try:
+            body = json.loads(body)
+        except ValueError:
+            raise ValueError(f"{ErrorCodes.VAL_INVALID_FORMAT}:Body is not valid JSON")
+        if not isinstance(body, list):
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_FORMAT}:Body must be a JSON array of rows"
+            )
+        for index, item in enumerate(body, start=1):
+            yield index, item
+
+    elif content_type in NDJSON_TYPES:
+        row = 0
+        async for line in _iter_lines(request, max_bytes):
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                yield row, json.loads(line)
+            except ValueError:
+                yield row, None
+
+    elif content_type in CSV_TYPES:
+        header = None
+        index = 0
+        async for values in _iter_csv_records(request, max_bytes):
+            if header is None:
+                header = values
+                continue
+            index += 1
+            # Empty cells mean "not provided" so optional fields fall back to
+            # their defaults and required ones are reported as missing.
+            yield index, {k: v for k, v in zip(header, values) if k and v}
+
+    else:
+        raise ValueError(
+            f"{ErrorCodes.VAL_INVALID_FORMAT}:Unsupported Content-Type "
+            f"'{content_type}'; use application/json, application/x-ndjson "
+            "or text/csv"
+        )
+
+
+async def parse_bulk_rows(
+    request: Request, schema: Type[M], max_rows: int, max_bytes: int
+) -> Tuple[List[Tuple[int, M]], List[Dict[str, Any]]]:
+    """
+    Read and validate every row of a bulk import body.
+
+    Returns ``(valid_rows, errors)`` where valid_rows pairs each row number
+    with its validated schema instance.
+
+    Raises:
+        ValueError: VAL-003 for an unusable body, VAL-004 when the body
+            holds more than *max_rows* rows or *max_bytes* bytes.
+    """
+    valid: List[Tuple[int, M]] = []
+    errors: List[Dict[str, Any]] = []
+    async for row, raw in _raw_rows(request, max_bytes):
+        if row > max_rows:
+            raise ValueError(
+                f"{ErrorCodes.VAL_INVALID_RANGE}:Bulk import is limited to "
+                f"{max_rows} rows per request"
+            )
+        if raw is None:
+            errors.append(
+                row_error(row, f"{ErrorCodes.VAL_INVALID_FORMAT}:Invalid JSON")
+            )
+            continue
+        try:
+            valid.append((row, schema.model_validate(raw)))
+        except ValidationError as e:
+            message = _validation_message(e)
+            errors.append(
+                row_error(row, f"{ErrorCodes.VAL_INVALID_INPUT}:{message}")
+            )
+    return valid, errors
+
+
+def bulk_openapi_body(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """``openapi_extra`` documenting the accepted bulk body formats."""
+    item = {"$ref": f"#/components/schemas/{schema.__name__}"}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": item}},
+                "application/x-ndjson": {"schema": item},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    }
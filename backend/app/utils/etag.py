@@ -0,0 +1,50 @@
+"""
+Conditional GET helpers (ETag / If-None-Match).
+
+Read endpoints derive a weak ETag from the caller's data version
+(DataVersionService, a counter every budget/income/expense write bumps)
+plus whatever else shapes the payload (the current month or date, query
+parameters). A matching If-None-Match is answered with 304 after that one
+primary-key lookup, before the endpoint's service does any work.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+# Clients may store responses but must revalidate before reusing them.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Weak ETag over *parts* — equal parts, equal tag."""
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of *etag* against an If-None-Match header value."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach *etag* and the revalidation policy to a full response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 for a request whose If-None-Match matched *etag*."""
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
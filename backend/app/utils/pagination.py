@@ -0,0 +1,34 @@
+"""Opaque keyset cursors for paginated listings.
+
+A cursor encodes the ``(date, id)`` sort key of the last row a client has
+seen. It is base64url so it survives query strings untouched, and carries
+no meaning for clients beyond "pass it back to get the next page".
+"""
+
+import base64
+from datetime import date
+from typing import Tuple
+from uuid import UUID
+
+from app.schemas.error_schemas import ErrorCodes
+
+
+def encode_cursor(row_date: date, row_id: UUID) -> str:
+    """Encode a ``(date, id)`` sort key as an opaque cursor."""
+    raw = f"{row_date.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: VAL-003 if the cursor is malformed or tampered with.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_date, raw_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return date.fromisoformat(raw_date), UUID(raw_id)
+    except ValueError:
+        raise ValueError(f"{ErrorCodes.VAL_INVALID_FORMAT}:Invalid pagination cursor")
@@ -1,23 +1,123 @@
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import partial
+from typing import Any, Callable, Optional
 from uuid import UUID
+import asyncio
+import threading
 from app.config import get_settings
+from app.metrics import timed_phase
 
 settings = get_settings()
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+class PasswordPoolSaturated(RuntimeError):
+    """Raised when the password pool's workers and queue are all in use."""
+
+
+class PasswordHashingPool:
+    """
+    Bounded thread pool for bcrypt work, kept off the event loop.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism
+    here without the pickling cost of a process pool. At most
+    ``max_workers`` calls run at once and ``max_queue`` more may wait;
+    anything beyond that fails fast with PasswordPoolSaturated (mapped to
+    503) instead of piling up behind a login storm. Only the hash or verify
+    call itself runs here; the queries around it stay on the caller's thread.
+
+    The executor is created lazily and recreated after ``shutdown`` so the
+    app lifespan can start and stop repeatedly (as TestClient does).
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+            return self._executor
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                raise PasswordPoolSaturated("Password hashing pool is saturated")
+            self._in_flight += 1
+
+    def _release(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Start *func* on the pool, or raise PasswordPoolSaturated.
+
+        The slot is released by a done-callback on the returned future, so
+        it stays taken for as long as the thread is busy, even when the
+        caller gives up waiting (a cancelled request). *func* runs in a copy
+        of the caller's context, so its time lands in the request's phases.
+        """
+        self._acquire()
+        try:
+            future = self._get_executor().submit(
+                partial(copy_context().run, func, *args, **kwargs)
+            )
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run *func* on the pool and block for its result (worker threads)."""
+        return self.submit(func, *args, **kwargs).result()
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run *func* on the pool and await its result."""
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Stop worker threads; a later call starts a fresh executor."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# Shared pool for the bcrypt work in AuthService (login/register).
+password_pool = PasswordHashingPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_QUEUE_DEPTH,
+)
+
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    with timed_phase("auth"):
+        return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    with timed_phase("auth"):
+        return pwd_context.verify(plain_password, hashed_password)
 
 
 def create_access_token(user_id: UUID, email: str) -> str:
@@ -35,9 +135,10 @@ def create_access_token(user_id: UUID, email: str) -> str:
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and validate a JWT access token."""
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        with timed_phase("auth"):
+            payload = jwt.decode(
+                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            )
         return payload
     except JWTError:
         return None
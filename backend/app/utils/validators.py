@@ -5,8 +5,8 @@ Consumers that need naive datetimes must strip tzinfo themselves.
 """
 
 import re
-from datetime import datetime, timezone
-from typing import Tuple
+from datetime import date, datetime, timezone
+from typing import List, Tuple, Union
 
 
 def validate_month_format(month: str) -> Tuple[bool, str]:
@@ -75,4 +75,34 @@ def get_month_range(month: str) -> Tuple[datetime, datetime]:
     else:
         end_date = datetime(year, month_num + 1, 1, tzinfo=timezone.utc)
 
-    return start_date, end_date
\ No newline at end of file
+    return start_date, end_date
+
+
+def as_date(value: Union[date, datetime]) -> date:
+    """Range bounds arrive as tz-aware datetimes from get_month_range."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def month_span(start_month: str, end_month: str) -> int:
+    """Return how many months *start_month*..*end_month* covers, inclusive.
+
+    Both arguments must already be valid YYYY-MM strings. Computed without
+    listing the months, so callers can cap a span before building it; zero
+    or negative when *start_month* is after *end_month*.
+    """
+    start_year, start_num = int(start_month[:4]), int(start_month[5:7])
+    end_year, end_num = int(end_month[:4]), int(end_month[5:7])
+    return (end_year - start_year) * 12 + end_num - start_num + 1
+
+
+def months_between(start_month: str, end_month: str) -> List[str]:
+    """Return every YYYY-MM from *start_month* to *end_month*, inclusive.
+
+    Both arguments must already be valid YYYY-MM strings. Returns an empty
+    list when *start_month* is after *end_month*.
+    """
+    first = int(start_month[:4]) * 12 + int(start_month[5:7]) - 1
+    return [
+        f"{index // 12:04d}-{index % 12 + 1:02d}"
+        for index in range(first, first + month_span(start_month, end_month))
+    ]
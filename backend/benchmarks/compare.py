@@ -0,0 +1,103 @@
+"""
+Compare a pytest-benchmark JSON run against the stored baseline.
+
+Usage (from the backend directory):
+    python benchmarks/compare.py benchmarks/results.json
+    python benchmarks/compare.py benchmarks/results.json --tolerance 0.5
+    python benchmarks/compare.py benchmarks/results.json --update
+
+Benchmarks are matched by fullname and compared on the median. Exits 1
+when any median is more than --tolerance (fractional, default 0.25)
+slower than the baseline. Benchmarks missing from either side are
+reported but do not fail the run. --update rewrites the baseline from the
+run instead of comparing.
+
+Baselines are only meaningful on the machine that recorded them, so none
+is committed. CI (the backend-benchmarks job) records one on every push to
+main and keeps it in the Actions cache; pull requests restore the newest
+baseline from their base branch and compare against it. The baseline is
+refreshed by merging to main. To compare locally, run the suite with
+--update on the base commit, then run it again on your branch and compare,
+both on the same machine. benchmarks/baseline.json is git-ignored so a
+local baseline is never committed.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+
+
+def load_medians(path: Path) -> Dict[str, float]:
+    """fullname -> median seconds, from a pytest-benchmark JSON file."""
+    data = json.loads(Path(path).read_text())
+    return {bench["fullname"]: bench["stats"]["median"] for bench in data["benchmarks"]}
+
+
+def compare(
+    baseline: Dict[str, float], current: Dict[str, float], tolerance: float
+) -> List[str]:
+    """Return one line per regressed benchmark; prints the full table."""
+    regressions = []
+    width = max((len(name) for name in baseline.keys() | current.keys()), default=0)
+    for name in sorted(baseline.keys() | current.keys()):
+        before, after = baseline.get(name), current.get(name)
+        if before is None or after is None:
+            status = "new" if before is None else "missing"
+            print(f"{name:<{width}}  {status}")
+            continue
+        change = (after - before) / before if before else 0.0
+        status = "REGRESSED" if change > tolerance else "ok"
+        print(
+            f"{name:<{width}}  {before * 1000:10.3f} ms  {after * 1000:10.3f} ms"
+            f"  {change:+7.1%}  {status}"
+        )
+        if status == "REGRESSED":
+            regressions.append(
+                f"{name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms"
+                f" ({change:+.1%})"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "results", type=Path, help="pytest-benchmark --benchmark-json output"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument(
+        "--update", action="store_true", help="replace the baseline with this run"
+    )
+    args = parser.parse_args(argv)
+
+    current = load_medians(args.results)
+    if args.update:
+        args.baseline.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline} ({len(current)} benchmarks)")
+        return 0
+
+    if not args.baseline.exists():
+        print(
+            f"No baseline at {args.baseline}; run with --update first", file=sys.stderr
+        )
+        return 2
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(baseline, current, args.tolerance)
+    if regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) regressed beyond {args.tolerance:.0%}:"
+        )
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
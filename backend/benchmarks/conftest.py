@@ -0,0 +1,210 @@
+"""
+Benchmark fixtures - the in-process ASGI app on a seeded PostgreSQL.
+
+Uses the same database as the integration tests (.env.test, port 5433):
+    docker-compose -f docker-compose.test.yml up -d
+
+The schema is dropped and recreated, so the target is BENCH_DATABASE_URL
+(falling back to DATABASE_URL) and its database name must end in ``_test``
+or ``_bench``; anything else aborts the run before the app is imported.
+
+Run from the backend directory:
+    pytest benchmarks --benchmark-json=benchmarks/results.json
+    python benchmarks/compare.py benchmarks/results.json
+
+Rate limiting and the report cache are switched off so every round does
+the real work. BENCH_SIZES (default "10,1000,100000") sets the expense
+rows seeded per user; each size gets its own user, seeded once per session.
+Fixed sizes keep results comparable; for multi-user, heavy-tailed data
+(load tests) use scripts/seed_data.py instead.
+"""
+
+import os
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+ENV_TEST_PATH = BACKEND_ROOT / ".env.test"
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv(dotenv_path=str(ENV_TEST_PATH), override=False)
+
+from sqlalchemy.engine import make_url  # noqa: E402
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL") or os.getenv("DATABASE_URL", "")
+_bench_db_name = (
+    make_url(BENCH_DATABASE_URL).database or "" if BENCH_DATABASE_URL else ""
+)
+if not _bench_db_name.endswith(("_test", "_bench")):
+    pytest.exit(
+        f"Refusing to run benchmarks against database {_bench_db_name!r}: the "
+        f"schema is dropped. Set BENCH_DATABASE_URL to a *_test or *_bench "
+        f"database.",
+        returncode=2,
+    )
+# The app under test and the drop/create below must hit the checked database.
+os.environ["DATABASE_URL"] = BENCH_DATABASE_URL
+os.environ.pop("DATABASE_ASYNC_URL", None)
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["REPORT_CACHE_ENABLED"] = "false"
+os.environ["PROFILING_SAMPLE_RATE"] = "0"
+
+from app.config import get_settings  # noqa: E402
+
+get_settings.cache_clear()
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+with patch("app.models.init_db", return_value=None):
+    from app.main import app  # noqa: E402
+
+from app.models import Base  # noqa: E402
+from app.models.base import SessionLocal, engine  # noqa: E402
+from app.repositories import MonthlyRollupRepository  # noqa: E402
+from app.seeding import copy_rows  # noqa: E402
+from app.utils.security import hash_password  # noqa: E402
+
+BENCH_SIZES = [
+    int(size) for size in os.getenv("BENCH_SIZES", "10,1000,100000").split(",") if size
+]
+BENCH_PASSWORD = "bench-password-123"
+SEED = 20240101
+CATEGORIES = ["Food", "Rent", "Transport", "Utilities", "Entertainment", "Health"]
+MONTHS_OF_HISTORY = 12
+
+
+def _month_starts(today: date, count: int):
+    year, month = today.year, today.month
+    for _ in range(count):
+        yield date(year, month, 1)
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+
+
+def current_month() -> str:
+    return date.today().strftime("%Y-%m")
+
+
+def range_start_month() -> str:
+    """First month of the seeded history, for range reports over all of it."""
+    return list(_month_starts(date.today(), MONTHS_OF_HISTORY))[-1].strftime("%Y-%m")
+
+
+def _rows(user_id, count: int, today: date, rng: random.Random):
+    """Expense tuples over the last MONTHS_OF_HISTORY months, this one included."""
+    months = list(_month_starts(today, MONTHS_OF_HISTORY))
+    for _ in range(count):
+        start = rng.choice(months)
+        next_month = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        last_day = min(next_month - timedelta(days=1), today)
+        day = rng.randint(1, last_day.day)
+        amount = Decimal(rng.randint(100, 50000)) / 100
+        yield uuid4(), user_id, amount, rng.choice(CATEGORIES), start.replace(day=day)
+
+
+def seed_user(size: int, hashed_password: str) -> dict:
+    """Create one user with *size* expenses (and size // 10 incomes) plus rollups."""
+    rng = random.Random(SEED + size)
+    today = date.today()
+    user_id = uuid4()
+    email = f"bench-{size}-{user_id.hex[:8]}@example.com"
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        copy_rows(
+            cursor, "users", ("id", "email", "hashed_password", "full_name"),
+            [(user_id, email, hashed_password, f"Bench {size}")],
+        )
+        copy_rows(
+            cursor, "expenses", ("id", "user_id", "amount", "category", "date"),
+            _rows(user_id, size, today, rng),
+        )
+        copy_rows(
+            cursor, "incomes", ("id", "user_id", "amount", "source", "date"),
+            (
+                (id_, uid, amount * 10, "Salary", day)
+                for id_, uid, amount, _, day in _rows(
+                    user_id, max(size // 10, 1), today, rng
+                )
+            ),
+        )
+        raw.commit()
+    finally:
+        raw.close()
+
+    db = SessionLocal()
+    try:
+        MonthlyRollupRepository(db).rebuild(user_id)
+    finally:
+        db.close()
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE expenses; ANALYZE incomes"))
+    return {"user_id": user_id, "email": email, "rows": size}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def bench_database():
+    """Fresh schema for the session; skips the suite if PostgreSQL is down."""
+    assert engine.url.database == _bench_db_name, engine.url
+    # A dedicated engine for the DDL, built from the checked URL only.
+    schema_engine = create_engine(BENCH_DATABASE_URL)
+    try:
+        try:
+            with schema_engine.connect():
+                pass
+        except OperationalError as exc:
+            pytest.skip(f"PostgreSQL not reachable for benchmarks: {exc}")
+        Base.metadata.drop_all(bind=schema_engine)
+        Base.metadata.create_all(bind=schema_engine)
+    finally:
+        schema_engine.dispose()
+    yield
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def bench_client(bench_database):
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def seeded_users(bench_client):
+    """Lazily seeds one user per size; returns a callable size -> user dict."""
+    hashed = hash_password(BENCH_PASSWORD)
+    users = {}
+
+    def get(size: int) -> dict:
+        if size not in users:
+            user = seed_user(size, hashed)
+            resp = bench_client.post(
+                "/api/v1/auth/login",
+                json={"email": user["email"], "password": BENCH_PASSWORD},
+            )
+            assert resp.status_code == 200, resp.text
+            user["headers"] = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+            users[size] = user
+        return users[size]
+
+    return get
+
+
+@pytest.fixture(params=BENCH_SIZES, ids=lambda size: f"rows={size}")
+def bench_user(request, seeded_users):
+    """A user seeded with ``rows`` expenses, plus auth headers."""
+    return seeded_users(request.param)
+
+
+@pytest.fixture
+def small_user(seeded_users):
+    """The smallest configured user, for benchmarks that do not depend on data size."""
+    return seeded_users(min(BENCH_SIZES))
@@ -0,0 +1,158 @@
+"""
+End-to-end endpoint benchmarks through the in-process ASGI app.
+
+Each request goes through routing, auth, validation, the service layer and
+PostgreSQL, so the numbers include everything except the network hop.
+"""
+
+import itertools
+from datetime import date
+
+import pytest
+
+from app.config import get_settings
+from benchmarks.conftest import BENCH_PASSWORD, current_month, range_start_month
+
+API = "/api/v1"
+
+# Budgets are unique per (user, month); walk forward from year 3000 so
+# every create in the session gets a fresh month.
+_budget_months = (
+    f"{year}-{month:02d}" for year in itertools.count(3000) for month in range(1, 13)
+)
+
+
+def _ok(resp, expected: int = 200):
+    assert resp.status_code == expected, resp.text
+    return resp
+
+
+def test_login(benchmark, bench_client, small_user):
+    """bcrypt dominates; a few rounds are enough for a stable median."""
+    body = {"email": small_user["email"], "password": BENCH_PASSWORD}
+    benchmark.pedantic(
+        lambda: _ok(bench_client.post(f"{API}/auth/login", json=body)),
+        rounds=5,
+        iterations=1,
+        warmup_rounds=1,
+    )
+
+
+def test_budget_create(benchmark, bench_client, small_user):
+    def create():
+        body = {"month": next(_budget_months), "amount": "2500.00"}
+        return _ok(
+            bench_client.post(
+                f"{API}/budgets", json=body, headers=small_user["headers"]
+            ),
+            201,
+        )
+
+    benchmark(create)
+
+
+def test_budget_get(benchmark, bench_client, small_user):
+    body = {"month": next(_budget_months), "amount": "2500.00"}
+    budget_id = _ok(
+        bench_client.post(f"{API}/budgets", json=body, headers=small_user["headers"]),
+        201,
+    ).json()["budgetId"]
+
+    benchmark(
+        lambda: _ok(
+            bench_client.get(
+                f"{API}/budgets/{budget_id}", headers=small_user["headers"]
+            )
+        )
+    )
+
+
+def test_budget_update(benchmark, bench_client, small_user):
+    body = {"month": next(_budget_months), "amount": "2500.00"}
+    budget_id = _ok(
+        bench_client.post(f"{API}/budgets", json=body, headers=small_user["headers"]),
+        201,
+    ).json()["budgetId"]
+
+    benchmark(
+        lambda: _ok(
+            bench_client.put(
+                f"{API}/budgets/{budget_id}",
+                json={"amount": "2750.00"},
+                headers=small_user["headers"],
+            )
+        )
+    )
+
+
+def test_expense_create(benchmark, bench_client, small_user):
+    body = {"amount": "12.50", "category": "Food", "date": date.today().isoformat()}
+    benchmark(
+        lambda: _ok(
+            bench_client.post(
+                f"{API}/expenses", json=body, headers=small_user["headers"]
+            ),
+            201,
+        )
+    )
+
+
+def test_expenses_current_month(benchmark, bench_client, bench_user):
+    benchmark.extra_info["rows"] = bench_user["rows"]
+    resp = benchmark(
+        lambda: _ok(
+            bench_client.get(
+                f"{API}/expenses/current-month", headers=bench_user["headers"]
+            )
+        )
+    )
+    benchmark.extra_info["returned"] = len(resp.json())
+
+
+def test_expenses_current_month_fast_json(
+    benchmark, bench_client, bench_user, monkeypatch
+):
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(get_settings(), "FAST_JSON_ENABLED", True)
+    benchmark.extra_info["rows"] = bench_user["rows"]
+    resp = benchmark(
+        lambda: _ok(
+            bench_client.get(
+                f"{API}/expenses/current-month", headers=bench_user["headers"]
+            )
+        )
+    )
+    benchmark.extra_info["returned"] = len(resp.json())
+
+
+def test_report_summary(benchmark, bench_client, bench_user):
+    benchmark.extra_info["rows"] = bench_user["rows"]
+    params = {"month": current_month()}
+    benchmark(
+        lambda: _ok(
+            bench_client.get(
+                f"{API}/reports/summary", params=params, headers=bench_user["headers"]
+            )
+        )
+    )
+
+
+def test_report_range(benchmark, bench_client, bench_user):
+    benchmark.extra_info["rows"] = bench_user["rows"]
+    params = {"from": range_start_month(), "to": current_month()}
+    benchmark(
+        lambda: _ok(
+            bench_client.get(
+                f"{API}/reports/range", params=params, headers=bench_user["headers"]
+            )
+        )
+    )
+
+
+def test_dashboard(benchmark, bench_client, bench_user):
+    # The report cache is off for benchmarks, so every call does the full
+    # composition (no ETag short-circuit).
+    benchmark.extra_info["rows"] = bench_user["rows"]
+    benchmark(
+        lambda: _ok(bench_client.get(f"{API}/dashboard", headers=bench_user["headers"]))
+    )
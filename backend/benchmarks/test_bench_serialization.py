@@ -0,0 +1,81 @@
+"""
+Response serialization benchmarks, without HTTP or the database.
+
+Renders a 5k-item expense list (the GET /expenses/current-month payload)
+the way each mode does it:
+
+    default  FastAPI's response-model pass (validate the rows, dump by
+             alias) followed by TimedJSONResponse's stdlib encoder
+    fast     FAST_JSON_ENABLED: ResponseSerializer straight from the rows,
+             rendered by FastJSONResponse (orjson)
+
+Both produce the same bytes.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List
+from uuid import uuid4
+
+import pytest
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.middleware.timing import TimedJSONResponse
+from app.models.expense import Expense
+from app.schemas.expense_schemas import ExpenseResponse
+
+pytest.importorskip("orjson")
+
+from app.responses import FastJSONResponse, ResponseSerializer  # noqa: E402
+
+LIST_SIZE = 5000
+
+
+@pytest.fixture(scope="module")
+def expense_rows():
+    user_id = uuid4()
+    created = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    return [
+        Expense(
+            id=uuid4(),
+            user_id=user_id,
+            amount=Decimal(f"{i % 500}.{i % 100:02d}"),
+            category=("Food", "Rent", "Transport")[i % 3],
+            date=date(2024, 3, 1 + i % 28),
+            note=None if i % 4 else f"note {i}",
+            created_at=created + timedelta(seconds=i),
+        )
+        for i in range(LIST_SIZE)
+    ]
+
+
+def _default_renderer():
+    field = create_model_field(
+        name="Response_expenses", type_=List[ExpenseResponse], mode="serialization"
+    )
+    loop = asyncio.new_event_loop()
+
+    def render(rows) -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=rows, is_coroutine=True)
+        )
+        return TimedJSONResponse(content).body
+
+    return render
+
+
+def _fast_renderer():
+    serializer = ResponseSerializer(List[ExpenseResponse])
+    return lambda rows: FastJSONResponse(serializer(rows)).body
+
+
+RENDERERS = {"default": _default_renderer, "fast": _fast_renderer}
+
+
+@pytest.mark.parametrize("mode", list(RENDERERS))
+def test_render_expense_list(benchmark, expense_rows, mode):
+    benchmark.extra_info["items"] = LIST_SIZE
+    body = benchmark(RENDERERS[mode](), expense_rows)
+    assert body == RENDERERS["default"]()(expense_rows)
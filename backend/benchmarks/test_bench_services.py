@@ -0,0 +1,54 @@
+"""
+Service-level report benchmarks, without HTTP.
+
+Compares the two report paths the app wires on the same seeded data:
+rollups (REPORT_ROLLUPS_ENABLED) and database-side aggregates.
+"""
+
+import pytest
+
+from app.models.base import SessionLocal
+from app.repositories import (
+    ExpenseRepository,
+    IncomeRepository,
+    MonthlyRollupRepository,
+    ReportRepository,
+)
+from app.services.report_service import ReportService
+from benchmarks.conftest import current_month, range_start_month
+
+
+@pytest.fixture
+def db_session():
+    db = SessionLocal()
+    yield db
+    db.close()
+
+
+def _report_service(db, rollups: bool) -> ReportService:
+    return ReportService(
+        IncomeRepository(db),
+        ExpenseRepository(db),
+        ReportRepository(db),
+        MonthlyRollupRepository(db) if rollups else None,
+        None,
+    )
+
+
+@pytest.mark.parametrize("rollups", [True, False], ids=["rollups", "aggregates"])
+def test_service_monthly_summary(benchmark, db_session, bench_user, rollups):
+    benchmark.extra_info["rows"] = bench_user["rows"]
+    service = _report_service(db_session, rollups)
+    benchmark(service.get_monthly_summary, bench_user["user_id"], current_month())
+
+
+@pytest.mark.parametrize("rollups", [True, False], ids=["rollups", "aggregates"])
+def test_service_range_summary(benchmark, db_session, bench_user, rollups):
+    benchmark.extra_info["rows"] = bench_user["rows"]
+    service = _report_service(db_session, rollups)
+    benchmark(
+        service.get_range_summary,
+        bench_user["user_id"],
+        range_start_month(),
+        current_month(),
+    )
@@ -7,7 +7,14 @@ from app.config import get_settings
 from app.models.base import Base
 
 # Import model modules so metadata is fully populated for autogenerate.
-from app.models import user, budget, income, expense, login_attempt  # noqa: F401
+from app.models import (  # noqa: F401
+    user,
+    budget,
+    income,
+    expense,
+    login_attempt,
+    monthly_rollup,
+)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,98 @@
+"""add_monthly_rollups
+
+Revision ID: 7c1f4a9b2e3d
+Revises: 2966cb534cc6
+Create Date: 2026-10-17 09:00:00.000000
+
+The table is populated from the existing incomes and expenses in the same
+migration, so the rollup read path (REPORT_ROLLUPS_ENABLED) is correct as
+soon as the upgrade commits. scripts/backfill_monthly_rollups.py repairs
+drift later.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f4a9b2e3d'
+down_revision: Union[str, Sequence[str], None] = '2966cb534cc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'monthly_rollups',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('month', sa.String(length=7), nullable=False),
+        sa.Column(
+            'total_income',
+            sa.Numeric(precision=14, scale=2),
+            server_default='0',
+            nullable=False,
+        ),
+        sa.Column(
+            'total_expenses',
+            sa.Numeric(precision=14, scale=2),
+            server_default='0',
+            nullable=False,
+        ),
+        sa.Column(
+            'expenses_by_category',
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "month ~ '^[0-9]{4}-[0-9]{2}$'", name='ck_monthly_rollups_month_format'
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'month'),
+    )
+    # Backfill. Frozen copy of MonthlyRollupRepository.rebuild(): category
+    # totals are stored as JSON strings to keep NUMERIC precision.
+    op.execute(_BACKFILL)
+
+
+_BACKFILL = """
+    INSERT INTO monthly_rollups
+        (user_id, month, total_income, total_expenses, expenses_by_category)
+    SELECT
+        COALESCE(e.user_id, i.user_id),
+        COALESCE(e.month, i.month),
+        COALESCE(i.total, 0),
+        COALESCE(e.total, 0),
+        COALESCE(e.by_category, '{}'::jsonb)
+    FROM (
+        SELECT user_id, month,
+               SUM(total) AS total,
+               jsonb_object_agg(category, total::text) AS by_category
+        FROM (
+            SELECT user_id, to_char(date, 'YYYY-MM') AS month,
+                   category, SUM(amount) AS total
+            FROM expenses
+            GROUP BY 1, 2, 3
+        ) per_category
+        GROUP BY user_id, month
+    ) e
+    FULL OUTER JOIN (
+        SELECT user_id, to_char(date, 'YYYY-MM') AS month, SUM(amount) AS total
+        FROM incomes
+        GROUP BY 1, 2
+    ) i ON e.user_id = i.user_id AND e.month = i.month
+"""
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('monthly_rollups')
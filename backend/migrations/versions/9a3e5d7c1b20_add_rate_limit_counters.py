@@ -0,0 +1,42 @@
+"""add_rate_limit_counters
+
+Revision ID: 9a3e5d7c1b20
+Revises: 7c1f4a9b2e3d
+Create Date: 2026-10-17 12:00:00.000000
+
+Backs RATE_LIMIT_STORAGE_URL=postgresql:// (shared rate-limit counters).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3e5d7c1b20'
+down_revision: Union[str, Sequence[str], None] = '7c1f4a9b2e3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'rate_limit_counters',
+        sa.Column('key', sa.String(length=512), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index(
+        'ix_rate_limit_counters_expires_at',
+        'rate_limit_counters',
+        ['expires_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rate_limit_counters_expires_at', table_name='rate_limit_counters')
+    op.drop_table('rate_limit_counters')
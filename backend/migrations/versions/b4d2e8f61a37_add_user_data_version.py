@@ -0,0 +1,35 @@
+"""add_user_data_version
+
+Revision ID: b4d2e8f61a37
+Revises: 9a3e5d7c1b20
+Create Date: 2026-10-17 15:00:00.000000
+
+Per-user counter bumped by every budget/income/expense write; conditional
+GETs derive their ETags from it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d2e8f61a37'
+down_revision: Union[str, Sequence[str], None] = '9a3e5d7c1b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column(
+            'data_version', sa.BigInteger(), server_default='0', nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'data_version')
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Rebuild the monthly_rollups table from the incomes and expenses tables.
+
+Run once after applying the add_monthly_rollups migration to an existing
+database, and any time the rollups are suspected to have drifted (manual
+SQL edits, partial restores). The rebuild runs in a single transaction,
+so readers see either the old or the new rollups, never a mix.
+
+Usage:
+    # All users
+    python scripts/backfill_monthly_rollups.py
+
+    # One user
+    python scripts/backfill_monthly_rollups.py --user-id <uuid>
+
+    # Against the test database
+    ENV_FILE=.env.test python scripts/backfill_monthly_rollups.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.models.base import SessionLocal  # noqa: E402
+from app.repositories.monthly_rollup_repository import (  # noqa: E402
+    MonthlyRollupRepository,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--user-id", type=UUID, default=None, help="Rebuild a single user only"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        written = MonthlyRollupRepository(db).rebuild(args.user_id)
+    finally:
+        db.close()
+
+    scope = f"user {args.user_id}" if args.user_id else "all users"
+    print(f"Rebuilt {written} monthly rollup row(s) for {scope}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
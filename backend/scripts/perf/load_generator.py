@@ -0,0 +1,663 @@
+#!/usr/bin/env python3
+"""
+Mixed-workload load generator for the Simple Budget API.
+
+Runs weighted user sessions (login, add expense, view dashboard, run
+report, browse expenses) across many seeded accounts against a running
+backend, in one of two modes:
+
+    closed loop  --concurrency N   N virtual users, each starting its next
+                                   session as soon as the previous one ends
+                                   (plus optional --think-ms between steps)
+    open loop    --rate R          sessions arrive at R per second
+                                   (Poisson by default) regardless of how
+                                   fast the server answers; arrivals beyond
+                                   --max-in-flight are counted as dropped
+
+Open-loop step latency is measured from when the step was scheduled, not
+when it was sent, so queueing in the client is not hidden (coordinated
+omission). Latencies go into log-bucketed histograms (HDR style, <1%
+relative error) per step; results are written as JSON together with the
+run parameters, and --compare prints per-step deltas against a previous
+result file.
+
+Accounts come from scripts/seed_data.py (user000000@<domain>, ...), which
+must have seeded at least --accounts users. All accounts are logged in
+before the run unless --no-prelogin; the login session still exercises
+/auth/login during the run. Run the server with
+RATE_LIMIT_ENABLED=false, or the per-user budgets will dominate the result.
+
+Usage:
+    ENV_FILE=.env.test python scripts/seed_data.py --users 500 --replace
+    python scripts/perf/load_generator.py --accounts 500 --concurrency 50 \\
+        --duration 60
+    python scripts/perf/load_generator.py --profile reports --rate 20 --duration 120 \\
+        --output results/rate20.json --compare results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+API = "/api/v1"
+
+# ── Latency histogram ────────────────────────────────────────────────────────
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram over microseconds: each power-of-two range is split
+    into 2**SUB_BUCKET_BITS linear buckets, so a bucket's lower bound is
+    below any value in it by less than 1 / 2**SUB_BUCKET_BITS of the value.
+    Values below 2**(SUB_BUCKET_BITS + 1) us are exact. Histograms merge and
+    serialize losslessly.
+    """
+
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.total = 0
+        self.sum_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def _bucket(self, value_us: int) -> int:
+        # Keep the leading bit plus SUB_BUCKET_BITS bits below it.
+        shift = max(value_us.bit_length() - self.SUB_BUCKET_BITS - 1, 0)
+        return (value_us >> shift) << shift
+
+    def record(self, seconds: float) -> None:
+        value = max(int(seconds * 1_000_000), 0)
+        self.counts[self._bucket(value)] += 1
+        self.total += 1
+        self.sum_us += value
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+        self.max_us = max(self.max_us, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum_us += other.sum_us
+        if other.min_us is not None:
+            self.min_us = (
+                other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+            )
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, p: float) -> float:
+        """Value (ms) at percentile *p* (0-100): the bucket's lower bound."""
+        if not self.total:
+            return 0.0
+        rank = max(math.ceil(self.total * p / 100), 1)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(max(bucket, self.min_us or 0), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "min": (self.min_us or 0) / 1000,
+            "mean": self.sum_us / self.total / 1000 if self.total else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max_us / 1000,
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "unit": "us",
+            "sub_bucket_bits": self.SUB_BUCKET_BITS,
+            "buckets": {str(k): v for k, v in sorted(self.counts.items())},
+        }
+
+
+# ── Per-step statistics ──────────────────────────────────────────────────────
+
+
+@dataclass
+class StepStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+    def record(
+        self, seconds: float, status: Optional[int], error: Optional[str]
+    ) -> None:
+        self.latency.record(seconds)
+        self.statuses[str(status) if status is not None else "none"] += 1
+        if error:
+            self.errors[error] += 1
+
+
+class Recorder:
+    """Collects per-step stats once the warm-up period is over."""
+
+    def __init__(self, warmup_until: float):
+        self.warmup_until = warmup_until
+        self.steps: Dict[str, StepStats] = {}
+        self.sessions: Counter = Counter()
+        self.dropped = 0
+
+    @property
+    def measuring(self) -> bool:
+        return time.perf_counter() >= self.warmup_until
+
+    def record(
+        self, step: str, seconds: float, status: Optional[int], error: Optional[str]
+    ) -> None:
+        if self.measuring:
+            self.steps.setdefault(step, StepStats()).record(seconds, status, error)
+
+
+def classify(
+    response: Optional[httpx.Response],
+    exc: Optional[BaseException],
+    expected: Tuple[int, ...],
+) -> Optional[str]:
+    """Error bucket for one call: exception class, or status plus errorCode."""
+    if exc is not None:
+        return type(exc).__name__
+    if response.status_code in expected:
+        return None
+    code = None
+    try:
+        code = response.json().get("errorCode")
+    except ValueError:
+        pass
+    return f"{response.status_code} {code}" if code else str(response.status_code)
+
+
+# ── Sessions ─────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Account:
+    email: str
+    token: Optional[str] = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+
+class Session:
+    """One virtual user's session: runs steps and records each call."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        recorder: Recorder,
+        account: Account,
+        password: str,
+        rng: random.Random,
+        think: float,
+        scheduled: Optional[float],
+    ):
+        self.client = client
+        self.recorder = recorder
+        self.account = account
+        self.password = password
+        self.rng = rng
+        self.think = think
+        # Open loop: the first step's latency counts from the scheduled arrival.
+        self.scheduled = scheduled
+
+    async def call(
+        self, step: str, method: str, url: str, expected=(200,), **kwargs
+    ) -> Optional[httpx.Response]:
+        start = self.scheduled if self.scheduled is not None else time.perf_counter()
+        self.scheduled = None
+        response = exc = None
+        try:
+            response = await self.client.request(
+                method, url, headers=self.account.headers, **kwargs
+            )
+        except httpx.HTTPError as error:
+            exc = error
+        self.recorder.record(
+            step,
+            time.perf_counter() - start,
+            response.status_code if response is not None else None,
+            classify(response, exc, expected),
+        )
+        if self.think:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think))
+        return response if exc is None and response.status_code in expected else None
+
+    async def ensure_login(self) -> bool:
+        if self.account.token is None:
+            return await self.login()
+        return True
+
+    async def login(self) -> bool:
+        response = await self.call(
+            "login",
+            "POST",
+            f"{API}/auth/login",
+            json={"email": self.account.email, "password": self.password},
+        )
+        if response is None:
+            return False
+        self.account.token = response.json()["access_token"]
+        return True
+
+    async def add_expense(self) -> None:
+        body = {
+            "amount": f"{self.rng.lognormvariate(3, 0.9):.2f}",
+            "category": self.rng.choice(
+                ["Food", "Transport", "Shopping", "Entertainment"]
+            ),
+            "date": date.today().isoformat(),
+        }
+        await self.call(
+            "add_expense", "POST", f"{API}/expenses", expected=(201,), json=body
+        )
+
+    async def view_dashboard(self) -> None:
+        month = date.today().strftime("%Y-%m")
+        await self.call(
+            "dashboard_budget",
+            "GET",
+            f"{API}/budgets/current-month",
+            expected=(200, 404),
+        )
+        await self.call("dashboard_expenses", "GET", f"{API}/expenses/current-month")
+        await self.call(
+            "dashboard_summary",
+            "GET",
+            f"{API}/reports/summary",
+            params={"month": month},
+        )
+
+    async def run_report(self) -> None:
+        today = date.today()
+        index = today.year * 12 + today.month - 12
+        start = f"{index // 12}-{index % 12 + 1:02d}"
+        await self.call(
+            "report_range",
+            "GET",
+            f"{API}/reports/range",
+            params={"from": start, "to": today.strftime("%Y-%m")},
+        )
+
+    async def browse_expenses(self, pages: int = 3) -> None:
+        params = {"limit": 50}
+        for _ in range(pages):
+            response = await self.call(
+                "list_expenses", "GET", f"{API}/expenses", params=params
+            )
+            cursor = response.json().get("nextCursor") if response is not None else None
+            if not cursor:
+                break
+            params = {"limit": 50, "cursor": cursor}
+
+
+SessionFn = Callable[[Session], Awaitable[None]]
+
+
+async def _login_session(s: Session) -> None:
+    await s.login()
+
+
+async def _add_expense_session(s: Session) -> None:
+    if await s.ensure_login():
+        await s.add_expense()
+        await s.view_dashboard()
+
+
+async def _dashboard_session(s: Session) -> None:
+    if await s.ensure_login():
+        await s.view_dashboard()
+
+
+async def _report_session(s: Session) -> None:
+    if await s.ensure_login():
+        await s.run_report()
+
+
+async def _browse_session(s: Session) -> None:
+    if await s.ensure_login():
+        await s.browse_expenses()
+
+
+SESSIONS: Dict[str, SessionFn] = {
+    "login": _login_session,
+    "add_expense": _add_expense_session,
+    "dashboard": _dashboard_session,
+    "report": _report_session,
+    "browse": _browse_session,
+}
+
+# Session weights per profile.
+PROFILES: Dict[str, Dict[str, float]] = {
+    "mixed": {
+        "login": 5,
+        "add_expense": 25,
+        "dashboard": 45,
+        "report": 10,
+        "browse": 15,
+    },
+    "read-heavy": {
+        "login": 2,
+        "add_expense": 5,
+        "dashboard": 60,
+        "report": 13,
+        "browse": 20,
+    },
+    "write-heavy": {"login": 5, "add_expense": 70, "dashboard": 20, "report": 5},
+    "reports": {"dashboard": 30, "report": 70},
+    "login": {"login": 100},
+}
+
+
+# ── Runner ───────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class RunConfig:
+    host: str
+    profile: str
+    accounts: int
+    email_domain: str
+    password: str
+    duration: float
+    warmup: float
+    concurrency: Optional[int]
+    rate: Optional[float]
+    arrival: str
+    max_in_flight: int
+    think_ms: float
+    seed: int
+    timeout: float
+    prelogin: bool = True
+
+
+class LoadRun:
+    def __init__(self, config: RunConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.accounts = [
+            Account(f"user{i:06d}@{config.email_domain}")
+            for i in range(config.accounts)
+        ]
+        weights = PROFILES[config.profile]
+        self.session_names = list(weights)
+        self.session_weights = [weights[name] for name in self.session_names]
+
+    def _new_session(self, client, recorder, scheduled=None) -> Tuple[str, Session]:
+        name = self.rng.choices(self.session_names, weights=self.session_weights)[0]
+        session = Session(
+            client,
+            recorder,
+            self.rng.choice(self.accounts),
+            self.config.password,
+            random.Random(self.rng.getrandbits(64)),
+            self.config.think_ms / 1000,
+            scheduled,
+        )
+        return name, session
+
+    async def _run_session(
+        self, name: str, session: Session, recorder: Recorder
+    ) -> None:
+        await SESSIONS[name](session)
+        if recorder.measuring:
+            recorder.sessions[name] += 1
+
+    async def _closed_loop(self, client, recorder, deadline) -> None:
+        async def virtual_user():
+            while time.perf_counter() < deadline:
+                name, session = self._new_session(client, recorder)
+                await self._run_session(name, session, recorder)
+
+        await asyncio.gather(*(virtual_user() for _ in range(self.config.concurrency)))
+
+    async def _open_loop(self, client, recorder, deadline) -> None:
+        in_flight = set()
+        next_arrival = time.perf_counter()
+        while next_arrival < deadline:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= self.config.max_in_flight:
+                if recorder.measuring:
+                    recorder.dropped += 1
+            else:
+                name, session = self._new_session(
+                    client, recorder, scheduled=next_arrival
+                )
+                task = asyncio.create_task(self._run_session(name, session, recorder))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            gap = 1 / self.config.rate
+            next_arrival += (
+                self.rng.expovariate(1 / gap)
+                if self.config.arrival == "poisson"
+                else gap
+            )
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+    async def _prelogin(self, client, parallel: int = 4) -> None:
+        """Log every account in before the run; nothing here is recorded."""
+        recorder = Recorder(warmup_until=math.inf)
+        semaphore = asyncio.Semaphore(parallel)
+
+        async def login(account: Account) -> None:
+            async with semaphore:
+                session = Session(
+                    client, recorder, account, self.config.password, self.rng, 0, None
+                )
+                if not await session.login():
+                    raise RuntimeError(
+                        f"Login failed for {account.email}; "
+                        f"seed it with scripts/seed_data.py"
+                    )
+
+        await asyncio.gather(*(login(account) for account in self.accounts))
+
+    async def run(self) -> Dict:
+        config = self.config
+        limits = httpx.Limits(
+            max_connections=config.concurrency or config.max_in_flight
+        )
+        async with httpx.AsyncClient(
+            base_url=config.host, timeout=config.timeout, limits=limits
+        ) as client:
+            if config.prelogin:
+                await self._prelogin(client)
+            started = time.perf_counter()
+            recorder = Recorder(warmup_until=started + config.warmup)
+            deadline = started + config.warmup + config.duration
+            if config.rate:
+                await self._open_loop(client, recorder, deadline)
+            else:
+                await self._closed_loop(client, recorder, deadline)
+            elapsed = time.perf_counter() - recorder.warmup_until
+        return self.results(recorder, elapsed)
+
+    def results(self, recorder: Recorder, elapsed: float) -> Dict:
+        config = self.config
+        total = LatencyHistogram()
+        steps = {}
+        for name, stats in sorted(recorder.steps.items()):
+            total.merge(stats.latency)
+            steps[name] = {
+                "requests": stats.latency.total,
+                "errors": sum(stats.errors.values()),
+                "throughput_rps": stats.latency.total / elapsed,
+                "latency_ms": stats.latency.summary(),
+                "status_codes": dict(stats.statuses),
+                "error_breakdown": dict(stats.errors),
+                "histogram": stats.latency.to_dict(),
+            }
+        return {
+            "meta": {
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "mode": "open" if config.rate else "closed",
+                **{k: v for k, v in vars(config).items() if k != "password"},
+            },
+            "measured_seconds": elapsed,
+            "sessions": dict(recorder.sessions),
+            "dropped_arrivals": recorder.dropped,
+            "total": {
+                "requests": total.total,
+                "errors": sum(step["errors"] for step in steps.values()),
+                "throughput_rps": total.total / elapsed,
+                "latency_ms": total.summary(),
+            },
+            "steps": steps,
+        }
+
+
+# ── Output ───────────────────────────────────────────────────────────────────
+
+
+def print_table(results: Dict) -> None:
+    header = (
+        f"{'step':<20} {'reqs':>8} {'err':>6} {'rps':>8} {'p50':>8} {'p90':>8}"
+        f" {'p99':>8} {'p99.9':>8} {'max':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    rows = list(results["steps"].items()) + [("TOTAL", results["total"])]
+    for name, step in rows:
+        lat = step["latency_ms"]
+        print(
+            f"{name:<20} {step['requests']:>8} {step['errors']:>6}"
+            f" {step['throughput_rps']:>8.1f} {lat['p50']:>8.1f} {lat['p90']:>8.1f}"
+            f" {lat['p99']:>8.1f} {lat['p999']:>8.1f} {lat['max']:>8.1f}"
+        )
+    for name, step in results["steps"].items():
+        if step["error_breakdown"]:
+            print(f"  {name} errors: {step['error_breakdown']}")
+    if results["dropped_arrivals"]:
+        print(
+            f"Dropped arrivals (max in flight reached): {results['dropped_arrivals']}"
+        )
+
+
+def print_comparison(previous: Dict, current: Dict) -> None:
+    """Per-step p50/p99/throughput change against a previous result file."""
+    print(f"\n{'step':<20} {'p50 Δ':>10} {'p99 Δ':>10} {'rps Δ':>10} {'err Δ':>8}")
+    names = sorted(set(previous["steps"]) | set(current["steps"]))
+    for name in names + ["TOTAL"]:
+        before = previous["total"] if name == "TOTAL" else previous["steps"].get(name)
+        after = current["total"] if name == "TOTAL" else current["steps"].get(name)
+        if before is None or after is None:
+            print(f"{name:<20} {'new' if before is None else 'missing':>10}")
+            continue
+
+        def change(a, b):
+            return f"{(b - a) / a:+.1%}" if a else "n/a"
+
+        was, now = before["latency_ms"], after["latency_ms"]
+        print(
+            f"{name:<20} {change(was['p50'], now['p50']):>10}"
+            f" {change(was['p99'], now['p99']):>10}"
+            f" {change(before['throughput_rps'], after['throughput_rps']):>10}"
+            f" {after['errors'] - before['errors']:>+8}"
+        )
+    for key in ("profile", "mode", "concurrency", "rate", "accounts"):
+        if previous["meta"].get(key) != current["meta"].get(key):
+            was, now = previous["meta"].get(key), current["meta"].get(key)
+            print(f"Note: {key} differs ({was} -> {now})")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="http://127.0.0.1:8000")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="mixed")
+    parser.add_argument(
+        "--accounts",
+        type=int,
+        default=100,
+        help="Seeded accounts to spread sessions over",
+    )
+    parser.add_argument("--email-domain", default="seed.example.com")
+    parser.add_argument("--password", default="seed-password-123")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--concurrency", type=int, help="Closed loop: virtual users (default 10)"
+    )
+    mode.add_argument(
+        "--rate", type=float, help="Open loop: session arrivals per second"
+    )
+    parser.add_argument("--arrival", choices=("poisson", "uniform"), default="poisson")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=500,
+        help="Open loop: cap on concurrent sessions",
+    )
+    parser.add_argument("--duration", type=float, default=60.0, help="Measured seconds")
+    parser.add_argument(
+        "--warmup", type=float, default=10.0, help="Unrecorded seconds before measuring"
+    )
+    parser.add_argument(
+        "--think-ms", type=float, default=0.0, help="Mean think time between steps"
+    )
+    parser.add_argument(
+        "--no-prelogin",
+        dest="prelogin",
+        action="store_false",
+        help="Start with logged-out accounts (sessions log in on first use)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", default="load_results.json")
+    parser.add_argument("--compare", help="Previous result JSON to diff against")
+    args = parser.parse_args(argv)
+
+    if args.rate is None and args.concurrency is None:
+        args.concurrency = 10
+    config = RunConfig(
+        host=args.host,
+        profile=args.profile,
+        accounts=args.accounts,
+        email_domain=args.email_domain,
+        password=args.password,
+        duration=args.duration,
+        warmup=args.warmup,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        arrival=args.arrival,
+        max_in_flight=args.max_in_flight,
+        think_ms=args.think_ms,
+        seed=args.seed,
+        timeout=args.timeout,
+        prelogin=args.prelogin,
+    )
+
+    results = asyncio.run(LoadRun(config).run())
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    print_table(results)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), results)
+    print(f"\nResults saved to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
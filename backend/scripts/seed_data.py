@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Seed the database with realistic multi-user data for benchmarks and load tests.
+
+Generates --users users with expenses, incomes and budgets over the last
+--months months (see app/seeding.py for the distributions), writes them
+with COPY, and rebuilds monthly_rollups. The same arguments always
+produce the same data; pass --end-date as well to pin it across days.
+
+All seeded users log in with --password; emails are
+user000000@<domain>, user000001@<domain>, ...
+
+Usage:
+    # 1,000 users, default shape
+    ENV_FILE=.env.test python scripts/seed_data.py --users 1000
+
+    # Heavier tail, more history, pinned for a reproducible benchmark
+    ENV_FILE=.env.test python scripts/seed_data.py --users 5000 --months 24 \\
+        --heavy-tail-alpha 1.2 --seed 7 --end-date 2024-12-31 --replace
+
+    # Custom categories (name:weight:median_amount)
+    ENV_FILE=.env.test python scripts/seed_data.py --category Food:50:20 \\
+        --category Rent:5:1500 --category Travel:5:300
+
+    # Print the generated shape without writing
+    python scripts/seed_data.py --users 200 --dry-run
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.seeding import (  # noqa: E402
+    CategorySpec,
+    DEFAULT_CATEGORIES,
+    SeedSpec,
+    delete_seeded_users,
+    generate_users,
+    seed_database,
+)
+
+
+def _category(value: str) -> CategorySpec:
+    try:
+        name, weight, median = value.split(":")
+        return CategorySpec(name, float(weight), float(median))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected NAME:WEIGHT:MEDIAN_AMOUNT, got {value!r}"
+        )
+
+
+def build_spec(args: argparse.Namespace) -> SeedSpec:
+    return SeedSpec(
+        users=args.users,
+        months=args.months,
+        end_date=args.end_date,
+        seed=args.seed,
+        expenses_per_month=args.expenses_per_month,
+        heavy_tail_alpha=args.heavy_tail_alpha,
+        max_activity=args.max_activity,
+        amount_sigma=args.amount_sigma,
+        categories=tuple(args.category) if args.category else DEFAULT_CATEGORIES,
+        incomes_per_month=args.incomes_per_month,
+        budget_probability=args.budget_probability,
+        email_domain=args.email_domain,
+        password=args.password,
+    )
+
+
+def describe(spec: SeedSpec) -> None:
+    """Print per-user expense count percentiles for the spec."""
+    counts = sorted(len(user.expenses) for user in generate_users(spec))
+    if not counts:
+        print("No users.")
+        return
+    deciles = statistics.quantiles(counts, n=100) if len(counts) > 1 else counts * 99
+    print(
+        f"{spec.users} users, {sum(counts)} expenses; per user "
+        f"p50={deciles[49]:.0f} p90={deciles[89]:.0f} p99={deciles[98]:.0f} "
+        f"max={counts[-1]}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument(
+        "--months", type=int, default=12, help="History length ending this month"
+    )
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=None,
+        help="Last day of history (default: today)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--expenses-per-month",
+        type=float,
+        default=40.0,
+        help="Monthly expenses for an activity-1 user",
+    )
+    parser.add_argument(
+        "--heavy-tail-alpha",
+        type=float,
+        default=1.5,
+        help="Pareto shape of per-user activity; lower means heavier tail",
+    )
+    parser.add_argument(
+        "--max-activity",
+        type=float,
+        default=50.0,
+        help="Cap on the activity multiplier",
+    )
+    parser.add_argument(
+        "--amount-sigma",
+        type=float,
+        default=0.9,
+        help="Log-normal sigma of expense amounts",
+    )
+    parser.add_argument(
+        "--category",
+        type=_category,
+        action="append",
+        help="NAME:WEIGHT:MEDIAN_AMOUNT; repeat to replace the defaults",
+    )
+    parser.add_argument("--incomes-per-month", type=int, default=2)
+    parser.add_argument("--budget-probability", type=float, default=0.7)
+    parser.add_argument("--email-domain", default="seed.example.com")
+    parser.add_argument("--password", default="seed-password-123")
+    parser.add_argument(
+        "--batch-users", type=int, default=500, help="Users per COPY transaction"
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Delete existing users under --email-domain first",
+    )
+    parser.add_argument(
+        "--skip-rollups",
+        action="store_true",
+        help="Do not rebuild monthly_rollups afterwards",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the generated shape without touching the database",
+    )
+    args = parser.parse_args()
+
+    spec = build_spec(args)
+    if args.dry_run:
+        describe(spec)
+        return 0
+
+    from app.models.base import engine
+
+    if args.replace:
+        removed = delete_seeded_users(engine, spec.email_domain)
+        print(f"Removed {removed} existing user(s) under @{spec.email_domain}.")
+
+    start = time.perf_counter()
+    result = seed_database(
+        engine,
+        spec,
+        batch_users=args.batch_users,
+        rebuild_rollups=not args.skip_rollups,
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"Seeded {result.users} users, {result.expenses} expenses, "
+        f"{result.incomes} incomes, {result.budgets} budgets, "
+        f"{result.rollups} rollups in {elapsed:.1f}s."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,12 +29,16 @@ from app.dependencies import (  # noqa: E402
     get_auth_service,
     get_budget_service,
     get_current_user,
+    get_dashboard_service,
+    get_data_version_service,
     get_expense_service,
     get_income_service,
     get_report_service,
 )
 from app.models.base import get_db  # noqa: E402
+from app.cache import principal_cache, report_cache  # noqa: E402
 from app.schemas.auth_schemas import TokenData  # noqa: E402
+from app.services.auth_service import AuthService  # noqa: E402
 
 
 def _fake_db():
@@ -73,6 +77,13 @@ def _reset_rate_limiter_state() -> None:
             return
 
 
+def _reset_app_caches() -> None:
+    """Drop cached principals/reports so tests never see each other's state."""
+    for cache in (principal_cache, report_cache):
+        if cache is not None:
+            cache.backend.clear()
+
+
 def make_user(
     user_id: UUID = FIXED_USER_ID,
     email: str = "test@example.com",
@@ -153,13 +164,19 @@ def token_data(sample_user_id) -> TokenData:
 def service_mocks(sample_user_id):
     now = datetime.now(timezone.utc)
 
-    auth_service = SimpleNamespace(
-        register_user=lambda **_: SimpleNamespace(
+    async def register_user_async(**_):
+        return SimpleNamespace(
             id=sample_user_id,
             email="new@example.com",
             full_name="New User",
-        ),
-        login_user=lambda **_: "fake.jwt.token",
+        )
+
+    async def login_user_async(**_):
+        return "fake.jwt.token"
+
+    auth_service = SimpleNamespace(
+        register_user_async=register_user_async,
+        login_user_async=login_user_async,
         get_user_by_id=lambda *_: SimpleNamespace(
             id=sample_user_id,
             email="tester@example.com",
@@ -247,12 +264,15 @@ def service_mocks(sample_user_id):
         utc_now=lambda: now,
     )
 
+    data_version_service = SimpleNamespace(get_data_version=lambda *_: 1)
+
     return {
         "auth": auth_service,
         "budget": budget_service,
         "income": income_service,
         "expense": expense_service,
         "report": report_service,
+        "data_version": data_version_service,
     }
 
 
@@ -264,8 +284,12 @@ def client(service_mocks):
     app.dependency_overrides[get_income_service] = lambda: service_mocks["income"]
     app.dependency_overrides[get_expense_service] = lambda: service_mocks["expense"]
     app.dependency_overrides[get_report_service] = lambda: service_mocks["report"]
+    app.dependency_overrides[get_data_version_service] = (
+        lambda: service_mocks["data_version"]
+    )
 
     _reset_rate_limiter_state()
+    _reset_app_caches()
     with TestClient(
         app,
         raise_server_exceptions=False,
@@ -279,11 +303,14 @@ def client(service_mocks):
 @pytest.fixture
 def auth_client(token_data):
     """Authenticated client with all services mocked for testing protected endpoints."""
-    mock_auth_service = Mock()
+    mock_auth_service = Mock(spec=AuthService)
     mock_expense_service = Mock()
     mock_budget_service = Mock()
     mock_income_service = Mock()
     mock_report_service = Mock()
+    mock_dashboard_service = Mock()
+    mock_data_version_service = Mock()
+    mock_data_version_service.get_data_version.return_value = 1
 
     app.dependency_overrides[get_db] = _fake_db
     app.dependency_overrides[get_current_user] = lambda: token_data
@@ -292,8 +319,13 @@ def auth_client(token_data):
     app.dependency_overrides[get_budget_service] = lambda: mock_budget_service
     app.dependency_overrides[get_income_service] = lambda: mock_income_service
     app.dependency_overrides[get_report_service] = lambda: mock_report_service
+    app.dependency_overrides[get_dashboard_service] = lambda: mock_dashboard_service
+    app.dependency_overrides[get_data_version_service] = (
+        lambda: mock_data_version_service
+    )
 
     _reset_rate_limiter_state()
+    _reset_app_caches()
     with TestClient(
         app,
         raise_server_exceptions=False,
@@ -306,6 +338,8 @@ def auth_client(token_data):
             "budget_service": mock_budget_service,
             "income_service": mock_income_service,
             "report_service": mock_report_service,
+            "dashboard_service": mock_dashboard_service,
+            "data_version_service": mock_data_version_service,
         }
 
     app.dependency_overrides.clear()
@@ -314,11 +348,13 @@ def auth_client(token_data):
 @pytest.fixture
 def unauth_client():
     """Unauthenticated client with all services mocked for testing public endpoints."""
-    mock_auth_service = Mock()
+    mock_auth_service = Mock(spec=AuthService)
     mock_expense_service = Mock()
     mock_budget_service = Mock()
     mock_income_service = Mock()
     mock_report_service = Mock()
+    mock_data_version_service = Mock()
+    mock_data_version_service.get_data_version.return_value = 1
 
     app.dependency_overrides[get_db] = _fake_db
     app.dependency_overrides[get_auth_service] = lambda: mock_auth_service
@@ -326,8 +362,12 @@ def unauth_client():
     app.dependency_overrides[get_budget_service] = lambda: mock_budget_service
     app.dependency_overrides[get_income_service] = lambda: mock_income_service
     app.dependency_overrides[get_report_service] = lambda: mock_report_service
+    app.dependency_overrides[get_data_version_service] = (
+        lambda: mock_data_version_service
+    )
 
     _reset_rate_limiter_state()
+    _reset_app_caches()
     with TestClient(
         app,
         raise_server_exceptions=False,
@@ -340,6 +380,7 @@ def unauth_client():
             "budget_service": mock_budget_service,
             "income_service": mock_income_service,
             "report_service": mock_report_service,
+            "data_version_service": mock_data_version_service,
         }
 
     app.dependency_overrides.clear()
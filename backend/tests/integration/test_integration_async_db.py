@@ -0,0 +1,145 @@
+"""
+Async database layer integration tests (real PostgreSQL via asyncpg).
+
+The async engine is built here rather than through DATABASE_ASYNC_ENABLED so
+the rest of the suite keeps the synchronous wiring. Rows are committed for
+real; the session-scoped create_tables fixture drops them afterwards.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.config import get_settings
+from app.dependencies import get_dashboard_service
+from app.models.base import async_database_url
+from app.models.user import User
+from app.repositories import (
+    BudgetRepository,
+    ExpenseRepository,
+    IncomeRepository,
+    UserRepository,
+)
+from app.services import BudgetService, ExpenseService, IncomeService, ReportService
+from app.services.async_service import AsyncService
+
+
+@asynccontextmanager
+async def _async_sessions():
+    engine = create_async_engine(async_database_url(get_settings().DATABASE_URL))
+    try:
+        yield async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+async def _create_user(session) -> User:
+    users = AsyncService(session, UserRepository)
+    return await users.create(
+        User(
+            email=f"async_{uuid4().hex[:8]}@int.com",
+            hashed_password="hashed_password",
+            full_name="Async Test User",
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_service_writes_and_reads_through_asyncpg():
+    async with _async_sessions() as sessions:
+        async with sessions() as session:
+            user = await _create_user(session)
+            expenses = AsyncService(
+                session, lambda s: ExpenseService(ExpenseRepository(s))
+            )
+            incomes = AsyncService(
+                session, lambda s: IncomeService(IncomeRepository(s))
+            )
+            reports = AsyncService(
+                session,
+                lambda s: ReportService(IncomeRepository(s), ExpenseRepository(s)),
+            )
+
+            await incomes.add_income(
+                user_id=user.id,
+                amount=Decimal("1000.00"),
+                source="Salary",
+                income_date=date(2026, 3, 1),
+            )
+            expense = await expenses.add_expense(
+                user_id=user.id,
+                amount=Decimal("42.50"),
+                category="Food",
+                expense_date=date(2026, 3, 5),
+            )
+            summary = await reports.get_monthly_summary(
+                user_id=user.id, month="2026-03"
+            )
+
+    # Attributes stay readable after the session is closed.
+    assert expense.amount == Decimal("42.50")
+    assert summary["total_income"] == Decimal("1000.00")
+    assert summary["expenses_by_category"] == {"Food": Decimal("42.50")}
+
+
+@pytest.mark.asyncio
+async def test_async_service_surfaces_business_errors():
+    async with _async_sessions() as sessions:
+        async with sessions() as session:
+            user = await _create_user(session)
+            budgets = AsyncService(
+                session, lambda s: BudgetService(BudgetRepository(s))
+            )
+
+            with pytest.raises(ValueError, match="BUD-001"):
+                await budgets.get_budget_by_id(user_id=user.id, budget_id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_overlap_on_one_event_loop():
+    async with _async_sessions() as sessions:
+
+        async def lookup(user_id):
+            async with sessions() as session:
+                return await AsyncService(session, UserRepository).get_by_id(user_id)
+
+        async with sessions() as session:
+            created = [await _create_user(session) for _ in range(3)]
+
+        found = await asyncio.gather(*(lookup(user.id) for user in created))
+
+    assert [user.email for user in found] == [user.email for user in created]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_runs_every_part_on_one_async_session():
+    today = datetime.now(timezone.utc).date()
+    async with _async_sessions() as sessions:
+        async with sessions() as session:
+            user = await _create_user(session)
+            await AsyncService(
+                session, lambda s: BudgetService(BudgetRepository(s))
+            ).create_budget(
+                user_id=user.id, month=today.strftime("%Y-%m"), amount=Decimal("300.00")
+            )
+            await AsyncService(
+                session, lambda s: ExpenseService(ExpenseRepository(s))
+            ).add_expense(
+                user_id=user.id,
+                amount=Decimal("12.25"),
+                category="Food",
+                expense_date=today,
+            )
+
+            dashboard = await get_dashboard_service(
+                db=None, async_db=session, cache=None
+            ).get_dashboard(user_id=user.id, recent_limit=5)
+
+    assert dashboard["budget"]["spent"] == Decimal("12.25")
+    assert dashboard["summary"]["expenses_by_category"] == {"Food": Decimal("12.25")}
+    assert [e.amount for e in dashboard["recent_expenses"]] == [Decimal("12.25")]
@@ -231,6 +231,48 @@ class TestBudgetHappyPath:
         assert resp.status_code == 200
         assert resp.json()["month"] == current_month
 
+    def test_budget_status_tracks_expenses_and_budget_updates(self, integration_client):
+        """Status reflects writes made after it was first (cached) read."""
+        resp = integration_client.post(
+            "/api/v1/budgets",
+            json={"month": "2024-02", "amount": "1000.00"},
+            headers=self.h,
+        )
+        budget_id = resp.json()["budgetId"]
+
+        first = integration_client.get(
+            "/api/v1/budgets/2024-02/status", headers=self.h
+        )
+        assert first.status_code == 200
+        assert float(first.json()["spent"]) == 0.0
+
+        integration_client.post(
+            "/api/v1/expenses",
+            json={"amount": "290.00", "category": "Food", "date": "2024-02-10"},
+            headers=self.h,
+        )
+        integration_client.put(
+            f"/api/v1/budgets/{budget_id}", json={"amount": "1200.00"}, headers=self.h
+        )
+
+        body = integration_client.get(
+            "/api/v1/budgets/2024-02/status", headers=self.h
+        ).json()
+        assert body["budgetId"] == budget_id
+        assert float(body["totalAmount"]) == 1200.00
+        assert float(body["spent"]) == 290.00
+        assert float(body["remaining"]) == 910.00
+        # February 2024 is in the past: 29 elapsed days, projection = spent.
+        assert body["daysElapsed"] == body["daysInMonth"] == 29
+        assert float(body["dailyBurnRate"]) == 10.00
+        assert float(body["projectedSpend"]) == 290.00
+
+    def test_budget_status_without_budget_returns_404(self, integration_client):
+        resp = integration_client.get(
+            "/api/v1/budgets/1999-01/status", headers=self.h
+        )
+        assert resp.status_code == 404
+
 
 class TestReportHappyPath:
 
@@ -294,4 +336,245 @@ class TestReportHappyPath:
         assert resp.status_code == 200
         assert float(resp.json()["totalIncome"]) == 0.0, (
             "Report included another user's income"
-        )
\ No newline at end of file
+        )
+
+    def test_report_reflects_writes_after_being_cached(self, integration_client):
+        """A cached summary must be invalidated by a later expense/income."""
+        first = integration_client.get(
+            "/api/v1/reports/summary?month=2024-05", headers=self.h
+        )
+        assert first.status_code == 200
+        assert float(first.json()["totalExpenses"]) == 0.0
+
+        integration_client.post(
+            "/api/v1/expenses",
+            json={"amount": "42.00", "category": "Books", "date": "2024-05-20"},
+            headers=self.h,
+        )
+        integration_client.post(
+            "/api/v1/incomes",
+            json={"amount": "100.00", "source": "Refund", "date": "2024-05-21"},
+            headers=self.h,
+        )
+
+        second = integration_client.get(
+            "/api/v1/reports/summary?month=2024-05", headers=self.h
+        )
+        body = second.json()
+        assert float(body["totalExpenses"]) == 42.00
+        assert float(body["totalIncome"]) == 100.00
+        assert float(body["byCategory"]["Books"]) == 42.00
+
+
+class TestDashboardHappyPath:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, integration_client):
+        self.token = register_and_login(
+            integration_client, "dash_happy@int.com", "password123"
+        )
+        self.h = auth_headers(self.token)
+
+    def test_dashboard_assembles_month_and_revalidates(self, integration_client):
+        """One call returns budget, summary and recent expenses; ETag → 304."""
+        import datetime
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        month = today.strftime("%Y-%m")
+        integration_client.post(
+            "/api/v1/budgets", json={"month": month, "amount": "800.00"}, headers=self.h
+        )
+        for amount, category in [("20.00", "Food"), ("30.00", "Food"), ("5.00", "Bus")]:
+            expense = {
+                "amount": amount,
+                "category": category,
+                "date": today.isoformat(),
+            }
+            integration_client.post("/api/v1/expenses", json=expense, headers=self.h)
+
+        resp = integration_client.get("/api/v1/dashboard?recent=2", headers=self.h)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["month"] == month
+        assert float(body["budget"]["spent"]) == 55.00
+        assert float(body["budget"]["remaining"]) == 745.00
+        assert float(body["summary"]["totalExpenses"]) == 55.00
+        assert float(body["summary"]["byCategory"]["Food"]) == 50.00
+        assert len(body["recentExpenses"]) == 2
+
+        etag = resp.headers["ETag"]
+        unchanged = integration_client.get(
+            "/api/v1/dashboard?recent=2", headers={**self.h, "If-None-Match": etag}
+        )
+        assert unchanged.status_code == 304
+
+        integration_client.post(
+            "/api/v1/expenses",
+            json={"amount": "1.00", "category": "Bus", "date": today.isoformat()},
+            headers=self.h,
+        )
+        changed = integration_client.get(
+            "/api/v1/dashboard?recent=2", headers={**self.h, "If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert float(changed.json()["budget"]["spent"]) == 56.00
+
+
+class TestConditionalGetHappyPath:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, integration_client):
+        self.token = register_and_login(
+            integration_client, "etag_happy@int.com", "password123"
+        )
+        self.h = auth_headers(self.token)
+
+    def test_reads_revalidate_until_any_write(self, integration_client):
+        """304 while the data version holds; an income write moves every ETag."""
+        import datetime
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        month = today.strftime("%Y-%m")
+        integration_client.post(
+            "/api/v1/budgets", json={"month": month, "amount": "500.00"}, headers=self.h
+        )
+        integration_client.post(
+            "/api/v1/expenses",
+            json={"amount": "12.00", "category": "Food", "date": today.isoformat()},
+            headers=self.h,
+        )
+        paths = [
+            "/api/v1/expenses/current-month",
+            "/api/v1/budgets/current-month",
+            f"/api/v1/reports/summary?month={month}",
+        ]
+        etags = {}
+        for path in paths:
+            resp = integration_client.get(path, headers=self.h)
+            assert resp.status_code == 200
+            etags[path] = resp.headers["ETag"]
+        assert len(set(etags.values())) == len(paths)
+
+        for path in paths:
+            resp = integration_client.get(
+                path, headers={**self.h, "If-None-Match": etags[path]}
+            )
+            assert resp.status_code == 304
+            assert resp.content == b""
+
+        integration_client.post(
+            "/api/v1/incomes",
+            json={"amount": "100.00", "source": "Gift", "date": today.isoformat()},
+            headers=self.h,
+        )
+        for path in paths:
+            resp = integration_client.get(
+                path, headers={**self.h, "If-None-Match": etags[path]}
+            )
+            assert resp.status_code == 200
+            assert resp.headers["ETag"] != etags[path]
+
+
+class TestBulkImportHappyPath:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, integration_client):
+        self.token = register_and_login(
+            integration_client, "bulk_happy@int.com", "password123"
+        )
+        self.h = auth_headers(self.token)
+
+    def test_bulk_rows_are_persisted_and_reported(self, integration_client, db_session):
+        """Valid rows land in the DB and the rollup; invalid rows are listed."""
+        csv_body = (
+            "amount,category,date,note\n"
+            "10.00,Food,2024-07-01,\n"
+            "0,Food,2024-07-02,\n"
+            "15.50,Food,2024-07-03,Dinner\n"
+            "20.00,Travel,2024-07-04,\n"
+        )
+        resp = integration_client.post(
+            "/api/v1/expenses/bulk",
+            content=csv_body,
+            headers={**self.h, "Content-Type": "text/csv"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["imported"] == 3
+        assert [e["row"] for e in resp.json()["errors"]] == [2]
+
+        integration_client.post(
+            "/api/v1/incomes/bulk",
+            json=[{"amount": "500.00", "source": "Salary", "date": "2024-07-01"}],
+            headers=self.h,
+        )
+
+        count = db_session.execute(
+            text(
+                "SELECT COUNT(*) FROM expenses e JOIN users u ON u.id = e.user_id "
+                "WHERE u.email = :e"
+            ),
+            {"e": "bulk_happy@int.com"},
+        ).scalar()
+        assert count == 3
+
+        body = integration_client.get(
+            "/api/v1/reports/summary?month=2024-07", headers=self.h
+        ).json()
+        assert float(body["totalIncome"]) == 500.00
+        assert float(body["totalExpenses"]) == 45.50
+        assert float(body["byCategory"]["Food"]) == 25.50
+        assert float(body["byCategory"]["Travel"]) == 20.00
+
+
+class TestExportHappyPath:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, integration_client, db_session):
+        from contextlib import nullcontext
+        from app.dependencies import get_export_service
+        from app.main import app
+        from app.services.export_service import ExportService
+
+        self.token = register_and_login(
+            integration_client, "export_happy@int.com", "password123"
+        )
+        self.h = auth_headers(self.token)
+        # Exports open their own session; point it at the test transaction.
+        # batch_size=2 forces several server-side cursor fetches.
+        app.dependency_overrides[get_export_service] = lambda: ExportService(
+            lambda: nullcontext(db_session), batch_size=2
+        )
+
+    def test_export_streams_all_transactions_in_date_order(self, integration_client):
+        integration_client.post(
+            "/api/v1/expenses/bulk",
+            json=[
+                {"amount": "9.00", "category": "Food", "date": "2024-08-03"},
+                {"amount": "4.00", "category": "Bus", "date": "2024-08-01"},
+                {"amount": "7.00", "category": "Food", "date": "2023-12-31"},
+            ],
+            headers=self.h,
+        )
+        integration_client.post(
+            "/api/v1/incomes",
+            json={"amount": "100.00", "source": "Gift", "date": "2024-08-02"},
+            headers=self.h,
+        )
+
+        resp = integration_client.get(
+            "/api/v1/exports/transactions?from=2024-01-01&to=2024-12-31",
+            headers=self.h,
+        )
+
+        assert resp.status_code == 200
+        lines = resp.text.splitlines()
+        assert lines[0] == "type,id,date,amount,category,source,note"
+        assert [line.split(",")[0] for line in lines[1:]] == [
+            "expense", "income", "expense",
+        ]
+        assert [line.split(",")[2] for line in lines[1:]] == [
+            "2024-08-01", "2024-08-02", "2024-08-03",
+        ]
+
+        ndjson = integration_client.get(
+            "/api/v1/exports/transactions?format=ndjson", headers=self.h
+        )
+        assert len(ndjson.text.splitlines()) == 4
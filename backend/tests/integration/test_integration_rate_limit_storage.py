@@ -0,0 +1,94 @@
+"""
+Integration tests for RATE_LIMIT_STORAGE_URL=postgresql:// against real
+PostgreSQL. The storage commits on its own connections, so every test uses
+unique keys and removes them afterwards.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+from limits import parse
+from limits.strategies import FixedWindowRateLimiter
+
+from app.rate_limit_storage import PostgresStorage
+from tests.integration.conftest import _engine
+
+
+def _storage():
+    # The app-wide engine may be bound to the unit tests' fake URL, so the
+    # storages here share the integration engine instead.
+    return PostgresStorage("postgresql://", engine=_engine)
+
+
+@pytest.fixture
+def key():
+    value = f"test/{uuid4().hex}"
+    yield value
+    _storage().clear(value)
+
+
+class TestPostgresRateLimitStorage:
+    def test_bare_url_reuses_app_engine(self):
+        from app.models.base import engine
+
+        assert PostgresStorage("postgresql://").engine is engine
+        assert _storage().check() is True
+
+    def test_incr_get_and_expiry(self, key):
+        storage = _storage()
+
+        assert storage.get(key) == 0
+        assert storage.incr(key, expiry=60) == 1
+        assert storage.incr(key, expiry=60, amount=3) == 4
+        assert storage.get(key) == 4
+        assert storage.get_expiry(key) > 0
+
+        storage.clear(key)
+        assert storage.get(key) == 0
+
+    def test_expired_window_restarts_count(self, key):
+        storage = _storage()
+        storage.incr(key, expiry=60)
+        with storage.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "UPDATE rate_limit_counters "
+                "SET expires_at = now() - interval '1 second' WHERE key = %(key)s",
+                {"key": key},
+            )
+
+        assert storage.get(key) == 0
+        assert storage.incr(key, expiry=60) == 1
+
+    def test_expired_rows_are_purged_by_a_later_increment(self, key):
+        storage = PostgresStorage("postgresql://", engine=_engine, cleanup_interval=0)
+        stale = f"{key}/stale"
+        storage.incr(stale, expiry=60)
+        with storage.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "UPDATE rate_limit_counters "
+                "SET expires_at = now() - interval '1 second' WHERE key = %(key)s",
+                {"key": stale},
+            )
+
+        storage.incr(key, expiry=60)
+
+        with storage.engine.connect() as conn:
+            remaining = conn.exec_driver_sql(
+                "SELECT key FROM rate_limit_counters WHERE key IN (%(a)s, %(b)s)",
+                {"a": key, "b": stale},
+            ).scalars().all()
+        assert remaining == [key]
+
+    def test_concurrent_workers_enforce_one_limit(self, key):
+        """Separate storages (one per worker) admit exactly the limit in total."""
+        limit = parse("20/minute")
+        workers = [FixedWindowRateLimiter(_storage()) for _ in range(4)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda i: workers[i % 4].hit(limit, key), range(50))
+            )
+
+        assert results.count(True) == 20
+        _storage().clear(limit.key_for(key))
@@ -1,13 +1,16 @@
 """
 Repository integration tests (real PostgreSQL).
 
-Covers user, budget, and expense repositories with:
+Covers user, budget, expense, and report repositories with:
 - CRUD behavior
 - DB constraint enforcement
 - rollback behavior on failed transactions
+- SQL-side aggregation for reports
+- monthly rollup maintenance on write
 """
 
 from datetime import date
+from decimal import Decimal
 from uuid import uuid4
 
 import pytest
@@ -16,9 +19,15 @@ from sqlalchemy.exc import IntegrityError
 
 from app.models.budget import Budget
 from app.models.expense import Expense
+from app.models.income import Income
 from app.models.user import User
 from app.repositories.budget_repository import BudgetRepository
+from app.repositories.data_version_repository import DataVersionRepository
 from app.repositories.expense_repository import ExpenseRepository
+from app.repositories.income_repository import IncomeRepository
+from app.repositories.login_attempt_repository import LoginAttemptRepository
+from app.repositories.monthly_rollup_repository import MonthlyRollupRepository
+from app.repositories.report_repository import ReportRepository
 from app.repositories.user_repository import UserRepository
 
 
@@ -133,6 +142,42 @@ class TestBudgetRepositoryIntegration:
         assert persisted is not None
         assert float(persisted.amount) == 999.0
 
+    def test_get_spend_joins_budget_to_month_expenses(self, db_session):
+        user_repo = UserRepository(db_session)
+        budget_repo = BudgetRepository(db_session)
+        expense_repo = ExpenseRepository(db_session)
+        user = user_repo.create(_new_user("budget_spend"))
+        other = user_repo.create(_new_user("budget_spend_other"))
+        budget = budget_repo.create(
+            Budget(user_id=user.id, month="2024-03", amount=1000)
+        )
+
+        assert budget_repo.get_spend(
+            user.id, "2024-03", date(2024, 3, 1), date(2024, 4, 1)
+        ).spent == Decimal("0")
+
+        for owner, amount, day in [
+            (user.id, "100.25", date(2024, 3, 1)),
+            (user.id, "50.50", date(2024, 3, 31)),
+            (user.id, "999.00", date(2024, 4, 1)),
+            (other.id, "999.00", date(2024, 3, 15)),
+        ]:
+            expense_repo.create(
+                Expense(
+                    user_id=owner, amount=Decimal(amount), category="Food", date=day
+                )
+            )
+
+        spend = budget_repo.get_spend(
+            user.id, "2024-03", date(2024, 3, 1), date(2024, 4, 1)
+        )
+        assert spend.budget_id == budget.id
+        assert spend.amount == Decimal("1000.00")
+        assert spend.spent == Decimal("150.75")
+        assert budget_repo.get_spend(
+            user.id, "2024-04", date(2024, 4, 1), date(2024, 5, 1)
+        ) is None
+
 
 class TestExpenseRepositoryIntegration:
     def test_crud_and_month_range_queries(self, db_session):
@@ -209,3 +254,316 @@ class TestExpenseRepositoryIntegration:
         persisted = expense_repo.get_by_id(created.id)
         assert persisted is not None
         assert float(persisted.amount) == 44.44
+
+    def test_list_page_walks_keyset_across_same_date_ties(self, db_session):
+        user = UserRepository(db_session).create(_new_user("expense_page"))
+        expense_repo = ExpenseRepository(db_session)
+        expense_repo.bulk_create(
+            [
+                {
+                    "user_id": user.id,
+                    "amount": Decimal(amount),
+                    "category": category,
+                    "date": day,
+                    "note": None,
+                }
+                for amount, category, day in [
+                    ("5.00", "Food", date(2024, 3, 1)),
+                    ("6.00", "Food", date(2024, 3, 2)),
+                    ("7.00", "Food", date(2024, 3, 2)),
+                    ("8.00", "Food", date(2024, 3, 2)),
+                    ("9.00", "Travel", date(2024, 3, 3)),
+                    ("1.00", "Food", date(2024, 2, 28)),
+                ]
+            ]
+        )
+
+        seen = []
+        after = None
+        while True:
+            page = expense_repo.list_page(
+                user.id,
+                limit=2,
+                start_date=date(2024, 3, 1),
+                category="Food",
+                after=after,
+            )
+            seen.extend(page)
+            if len(page) < 2:
+                break
+            after = (page[-1].date, page[-1].id)
+
+        assert [e.date for e in seen] == [
+            date(2024, 3, 2), date(2024, 3, 2), date(2024, 3, 2), date(2024, 3, 1),
+        ]
+        assert len({e.id for e in seen}) == 4
+        same_day_ids = [e.id for e in seen[:3]]
+        assert same_day_ids == sorted(same_day_ids, reverse=True)
+
+        by_amount = expense_repo.list_page(
+            user.id, limit=10, min_amount=Decimal("6.50"), max_amount=Decimal("8.00")
+        )
+        assert sorted(e.amount for e in by_amount) == [Decimal("7.00"), Decimal("8.00")]
+
+
+class TestReportRepositoryIntegration:
+    def test_summary_aggregates_sum_and_group_in_sql(self, db_session):
+        user_repo = UserRepository(db_session)
+        user = user_repo.create(_new_user("report_agg"))
+        other = user_repo.create(_new_user("report_agg_other"))
+
+        db_session.add_all(
+            [
+                Income(user_id=user.id, amount=3000, source="Salary",
+                       date=date(2024, 3, 1)),
+                Income(user_id=user.id, amount=500, source="Side",
+                       date=date(2024, 3, 31)),
+                Income(user_id=user.id, amount=999, source="Next month",
+                       date=date(2024, 4, 1)),
+                Expense(user_id=user.id, amount=200, category="Food",
+                        date=date(2024, 3, 5)),
+                Expense(user_id=user.id, amount=150.25, category="Food",
+                        date=date(2024, 3, 6)),
+                Expense(user_id=user.id, amount=80, category="Transport",
+                        date=date(2024, 3, 7)),
+                Expense(user_id=other.id, amount=777, category="Food",
+                        date=date(2024, 3, 5)),
+            ]
+        )
+        db_session.commit()
+
+        aggregates = ReportRepository(db_session).get_summary_aggregates(
+            user.id, date(2024, 3, 1), date(2024, 4, 1)
+        )
+
+        assert aggregates.total_income == Decimal("3500.00")
+        assert aggregates.expenses_by_category == {
+            "Food": Decimal("350.25"),
+            "Transport": Decimal("80.00"),
+        }
+
+    def test_summary_aggregates_empty_range(self, db_session):
+        user = UserRepository(db_session).create(_new_user("report_empty"))
+
+        aggregates = ReportRepository(db_session).get_summary_aggregates(
+            user.id, date(2024, 3, 1), date(2024, 4, 1)
+        )
+
+        assert aggregates.total_income == Decimal("0")
+        assert aggregates.expenses_by_category == {}
+
+    def test_range_aggregates_group_by_month_in_one_query(self, db_session):
+        user_repo = UserRepository(db_session)
+        user = user_repo.create(_new_user("report_range"))
+        other = user_repo.create(_new_user("report_range_other"))
+
+        db_session.add_all(
+            [
+                Income(user_id=user.id, amount=1000, source="Salary",
+                       date=date(2024, 1, 31)),
+                Income(user_id=user.id, amount=1000, source="Salary",
+                       date=date(2024, 3, 1)),
+                Income(user_id=user.id, amount=5, source="Outside",
+                       date=date(2024, 4, 1)),
+                Expense(user_id=user.id, amount=40, category="Food",
+                        date=date(2024, 1, 2)),
+                Expense(user_id=user.id, amount=2.5, category="Food",
+                        date=date(2024, 1, 30)),
+                Expense(user_id=user.id, amount=60, category="Bus",
+                        date=date(2024, 3, 31)),
+                Expense(user_id=other.id, amount=777, category="Food",
+                        date=date(2024, 1, 5)),
+            ]
+        )
+        db_session.commit()
+
+        by_month = ReportRepository(db_session).get_range_aggregates(
+            user.id, date(2024, 1, 1), date(2024, 4, 1)
+        )
+
+        assert list(by_month) == ["2024-01", "2024-03"]
+        assert by_month["2024-01"].total_income == Decimal("1000.00")
+        assert by_month["2024-01"].expenses_by_category == {"Food": Decimal("42.50")}
+        assert by_month["2024-03"].total_income == Decimal("1000.00")
+        assert by_month["2024-03"].expenses_by_category == {"Bus": Decimal("60.00")}
+
+
+class TestMonthlyRollupIntegration:
+    def _rollup(self, db_session, user_id, month):
+        db_session.expire_all()
+        return MonthlyRollupRepository(db_session).get(user_id, month)
+
+    def test_creates_accumulate_into_one_row(self, db_session):
+        user = UserRepository(db_session).create(_new_user("rollup_create"))
+        expense_repo = ExpenseRepository(db_session)
+        income_repo = IncomeRepository(db_session)
+
+        income_repo.create(
+            Income(user_id=user.id, amount=Decimal("1000.00"), source="Salary",
+                   date=date(2024, 3, 1))
+        )
+        expense_repo.create(
+            Expense(user_id=user.id, amount=Decimal("20.10"), category="Food",
+                    date=date(2024, 3, 2))
+        )
+        expense_repo.create(
+            Expense(user_id=user.id, amount=Decimal("0.20"), category="Food",
+                    date=date(2024, 3, 3))
+        )
+        expense_repo.create(
+            Expense(user_id=user.id, amount=Decimal("5.00"), category="Bus",
+                    date=date(2024, 3, 4))
+        )
+
+        rollup = self._rollup(db_session, user.id, "2024-03")
+        assert rollup.total_income == Decimal("1000.00")
+        assert rollup.total_expenses == Decimal("25.30")
+        assert rollup.expenses_by_category == {"Food": "20.30", "Bus": "5.00"}
+
+    def test_update_moves_amount_between_months_and_categories(self, db_session):
+        user = UserRepository(db_session).create(_new_user("rollup_update"))
+        expense_repo = ExpenseRepository(db_session)
+        expense = expense_repo.create(
+            Expense(user_id=user.id, amount=Decimal("40.00"), category="Food",
+                    date=date(2024, 3, 31))
+        )
+
+        expense.amount = Decimal("45.00")
+        expense.category = "Dining"
+        expense.date = date(2024, 4, 1)
+        expense_repo.update(expense)
+
+        march = self._rollup(db_session, user.id, "2024-03")
+        april = self._rollup(db_session, user.id, "2024-04")
+        assert march.total_expenses == Decimal("0.00")
+        assert march.expenses_by_category == {}
+        assert april.total_expenses == Decimal("45.00")
+        assert april.expenses_by_category == {"Dining": "45.00"}
+
+    def test_delete_subtracts(self, db_session):
+        user = UserRepository(db_session).create(_new_user("rollup_delete"))
+        income_repo = IncomeRepository(db_session)
+        kept = income_repo.create(
+            Income(user_id=user.id, amount=Decimal("10.00"), source="A",
+                   date=date(2024, 5, 1))
+        )
+        removed = income_repo.create(
+            Income(user_id=user.id, amount=Decimal("7.50"), source="B",
+                   date=date(2024, 5, 2))
+        )
+
+        assert income_repo.delete(removed.id) is True
+
+        rollup = self._rollup(db_session, user.id, "2024-05")
+        assert rollup.total_income == kept.amount
+
+    def test_rebuild_matches_incremental_rollups(self, db_session):
+        user = UserRepository(db_session).create(_new_user("rollup_rebuild"))
+        ExpenseRepository(db_session).create(
+            Expense(user_id=user.id, amount=Decimal("12.34"), category="Food",
+                    date=date(2024, 6, 9))
+        )
+        IncomeRepository(db_session).create(
+            Income(user_id=user.id, amount=Decimal("99.00"), source="Gift",
+                   date=date(2024, 7, 1))
+        )
+        # Simulate drift, then repair it from the source tables.
+        db_session.execute(
+            text("UPDATE monthly_rollups SET total_expenses = 0, "
+                 "expenses_by_category = '{}'::jsonb WHERE user_id = :u"),
+            {"u": str(user.id)},
+        )
+
+        written = MonthlyRollupRepository(db_session).rebuild(user.id)
+
+        assert written == 2
+        june = self._rollup(db_session, user.id, "2024-06")
+        july = self._rollup(db_session, user.id, "2024-07")
+        assert june.total_expenses == Decimal("12.34")
+        assert june.expenses_by_category == {"Food": "12.34"}
+        assert july.total_income == Decimal("99.00")
+        assert july.total_expenses == Decimal("0")
+
+
+class TestDataVersionIntegration:
+    def test_every_write_bumps_the_owner_version(self, db_session):
+        user_repo = UserRepository(db_session)
+        versions = DataVersionRepository(db_session)
+        expense_repo = ExpenseRepository(db_session)
+        income_repo = IncomeRepository(db_session)
+        budget_repo = BudgetRepository(db_session)
+        user = user_repo.create(_new_user("data_version"))
+        other = user_repo.create(_new_user("data_version_other"))
+        seen = [versions.get(user.id)]
+
+        def assert_bumped():
+            current = versions.get(user.id)
+            assert current > seen[-1]
+            seen.append(current)
+
+        expense = expense_repo.create(
+            Expense(user_id=user.id, amount=Decimal("10.00"), category="Food",
+                    date=date(2024, 3, 1))
+        )
+        assert_bumped()
+        expense.amount = Decimal("12.00")
+        expense_repo.update(expense)
+        assert_bumped()
+        expense_repo.delete(expense.id)
+        assert_bumped()
+        expense_repo.bulk_create(
+            [{"user_id": user.id, "amount": Decimal("1.00"), "category": "Food",
+              "date": date(2024, 3, day), "note": None} for day in (1, 2)]
+        )
+        assert_bumped()
+
+        income = income_repo.create(
+            Income(user_id=user.id, amount=Decimal("100.00"), source="Salary",
+                   date=date(2024, 3, 1))
+        )
+        assert_bumped()
+        income_repo.delete(income.id)
+        assert_bumped()
+
+        budget = budget_repo.create(
+            Budget(user_id=user.id, month="2024-03", amount=500)
+        )
+        assert_bumped()
+        budget.amount = 600
+        budget_repo.update(budget)
+        assert_bumped()
+        budget_repo.delete(budget.id)
+        assert_bumped()
+
+        assert versions.get(other.id) == 0
+        assert versions.get(uuid4()) == 0
+
+
+class TestLoginAttemptRepositoryIntegration:
+    def test_login_state_joins_user_and_attempt_row(self, db_session):
+        user = UserRepository(db_session).create(_new_user("login_state"))
+        repo = LoginAttemptRepository(db_session)
+
+        state = repo.get_login_state(user.email)
+        assert state.user.id == user.id
+        assert state.has_attempts is False
+        assert state.is_locked() is False
+
+        repo.record_failure("ghost@int.com", window_minutes=15, max_attempts=5)
+        ghost = repo.get_login_state("ghost@int.com")
+        assert ghost.user is None
+        assert ghost.has_attempts is True
+
+    def test_record_failure_locks_in_the_same_statement(self, db_session):
+        repo = LoginAttemptRepository(db_session)
+        email = f"upsert_{uuid4().hex[:8]}@int.com"
+
+        for expected in range(1, 3):
+            row = repo.record_failure(email, window_minutes=15, max_attempts=3)
+            assert row.attempt_count == expected
+            assert row.locked_until is None
+
+        row = repo.record_failure(email, window_minutes=15, max_attempts=3)
+        assert row.attempt_count == 3
+        assert row.locked_until is not None
+        assert repo.get_login_state(email).is_locked() is True
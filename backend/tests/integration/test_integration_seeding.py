@@ -0,0 +1,60 @@
+"""
+Integration tests for app/seeding.py: COPY into real PostgreSQL and the
+rollup rebuild. Seeded rows are committed, so each test removes its users.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.seeding import SeedSpec, delete_seeded_users, generate_users, seed_database
+from tests.integration.conftest import _engine
+
+DOMAIN = "seed-it.example.com"
+SPEC = SeedSpec(users=12, months=4, end_date=date(2024, 6, 20), seed=3,
+                expenses_per_month=5, email_domain=DOMAIN)
+
+
+@pytest.fixture
+def seeded():
+    result = seed_database(_engine, SPEC, batch_users=5)
+    yield result
+    delete_seeded_users(_engine, DOMAIN)
+
+
+def _scalar(sql, **params):
+    with _engine.connect() as conn:
+        return conn.execute(text(sql), {"pattern": f"%@{DOMAIN}", **params}).scalar()
+
+
+class TestSeedDatabase:
+    def test_counts_match_generated_data(self, seeded):
+        users = list(generate_users(SPEC))
+        assert seeded.users == 12
+        assert seeded.expenses == sum(len(u.expenses) for u in users)
+        assert _scalar("SELECT count(*) FROM users WHERE email LIKE :pattern") == 12
+        assert _scalar(
+            "SELECT count(*) FROM expenses e JOIN users u ON u.id = e.user_id"
+            " WHERE u.email LIKE :pattern"
+        ) == seeded.expenses
+        assert _scalar(
+            "SELECT count(*) FROM budgets b JOIN users u ON u.id = b.user_id"
+            " WHERE u.email LIKE :pattern"
+        ) == seeded.budgets
+
+    def test_rollups_match_source_rows(self, seeded):
+        expense_total = _scalar(
+            "SELECT sum(e.amount) FROM expenses e JOIN users u ON u.id = e.user_id"
+            " WHERE u.email LIKE :pattern"
+        )
+        rollup_total = _scalar(
+            "SELECT sum(r.total_expenses) FROM monthly_rollups r"
+            " JOIN users u ON u.id = r.user_id WHERE u.email LIKE :pattern"
+        )
+        assert rollup_total == expense_total
+
+    def test_replace_removes_previous_seed(self, seeded):
+        assert delete_seeded_users(_engine, DOMAIN) == 12
+        assert _scalar("SELECT count(*) FROM users WHERE email LIKE :pattern") == 0
+        assert seed_database(_engine, SPEC, rebuild_rollups=False).users == 12
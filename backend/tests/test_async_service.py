@@ -0,0 +1,96 @@
+"""
+Async service facade tests.
+
+Covers:
+  A. AsyncService runs each call through AsyncSession.run_sync
+  B. resolve() accepts both plain values and awaitables
+  C. DATABASE_URL is rewritten for the asyncpg driver
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from app.models.base import async_database_url
+from app.services.async_service import AsyncService, resolve
+
+
+class _FakeAsyncSession:
+    """Stands in for AsyncSession: run_sync hands over a sync session."""
+
+    def __init__(self):
+        self.sync_session = Mock(name="sync_session")
+        self.run_sync_calls = 0
+
+    async def run_sync(self, fn, *args, **kwargs):
+        self.run_sync_calls += 1
+        return fn(self.sync_session, *args, **kwargs)
+
+
+class _EchoService:
+    def __init__(self, db):
+        self.db = db
+
+    def echo(self, value, suffix=""):
+        return (self.db, f"{value}{suffix}")
+
+
+@pytest.mark.asyncio
+async def test_method_call_runs_inside_run_sync():
+    session = _FakeAsyncSession()
+    service = AsyncService(session, _EchoService)
+
+    db, value = await service.echo("a", suffix="b")
+
+    assert db is session.sync_session
+    assert value == "ab"
+    assert session.run_sync_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_service_errors_propagate():
+    class _Failing:
+        def __init__(self, db):
+            pass
+
+        def boom(self):
+            raise ValueError("BUD-001:Budget not found")
+
+    with pytest.raises(ValueError, match="BUD-001"):
+        await AsyncService(_FakeAsyncSession(), _Failing).boom()
+
+
+def test_private_attributes_are_not_proxied():
+    with pytest.raises(AttributeError):
+        AsyncService(_FakeAsyncSession(), _EchoService)._missing
+
+
+@pytest.mark.asyncio
+async def test_resolve_passes_plain_values_through():
+    assert await resolve(42) == 42
+
+
+@pytest.mark.asyncio
+async def test_resolve_awaits_coroutines():
+    async def _value():
+        return "done"
+
+    assert await resolve(_value()) == "done"
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "postgresql://u:p@db:5432/budget_db",
+            "postgresql+asyncpg://u:p@db:5432/budget_db",
+        ),
+        (
+            "postgresql+psycopg2://u:p@db/budget_db",
+            "postgresql+asyncpg://u:p@db/budget_db",
+        ),
+        ("sqlite:///local.db", "sqlite:///local.db"),
+    ],
+)
+def test_async_database_url(url, expected):
+    assert async_database_url(url) == expected
@@ -3,7 +3,7 @@
 import importlib
 import os
 from itertools import count
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -65,11 +65,13 @@ def auth_rate_limited_client():
 
     app = main_module.app
     mock_auth_service = Mock()
-    mock_auth_service.register_user.side_effect = ValueError(
-        f"{ErrorCodes.USER_EXISTS}:Already exists"
+    mock_auth_service.register_user_async = AsyncMock(
+        side_effect=ValueError(f"{ErrorCodes.USER_EXISTS}:Already exists")
     )
-    mock_auth_service.login_user.side_effect = ValueError(
-        f"{ErrorCodes.AUTH_INVALID_CREDENTIALS}:Invalid email or password"
+    mock_auth_service.login_user_async = AsyncMock(
+        side_effect=ValueError(
+            f"{ErrorCodes.AUTH_INVALID_CREDENTIALS}:Invalid email or password"
+        )
     )
     app.dependency_overrides[get_auth_service] = lambda: mock_auth_service
 
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock, patch
 from uuid import uuid4
 from app.services.auth_service import AuthService
+from app.repositories.login_attempt_repository import LoginState
 from app.models.user import User
 from app.schemas.error_schemas import ErrorCodes
 
@@ -13,12 +14,7 @@ class TestAuthService:
         """Set up test fixtures."""
         self.mock_repo = Mock()
         self.mock_lockout_repo = Mock()
-        self.mock_lockout_repo.is_locked.return_value = False
-        # record_failure must return an object with attempt_count so the
-        # '>=' comparison in _record_and_maybe_lock doesn't crash.
-        _mock_attempt = Mock()
-        _mock_attempt.attempt_count = 1
-        self.mock_lockout_repo.record_failure.return_value = _mock_attempt
+        self.mock_lockout_repo.get_login_state.return_value = LoginState()
         self.service = AuthService(self.mock_repo, self.mock_lockout_repo)
 
     def test_register_user_success(self):
@@ -65,11 +61,13 @@ class TestAuthService:
 
     def test_login_user_success(self):
         user_id = uuid4()
-        self.mock_repo.get_by_email.return_value = User(
-            id=user_id,
-            email="test@example.com",
-            hashed_password="does-not-matter",
-            full_name="Kaitha Reddy",
+        self.mock_lockout_repo.get_login_state.return_value = LoginState(
+            user=User(
+                id=user_id,
+                email="test@example.com",
+                hashed_password="does-not-matter",
+                full_name="Kaitha Reddy",
+            )
         )
 
         with (
@@ -84,14 +82,21 @@ class TestAuthService:
             )
 
         assert token == "fake.jwt.token"
-        self.mock_repo.get_by_email.assert_called_once_with("test@example.com")
+        self.mock_lockout_repo.get_login_state.assert_called_once_with(
+            "test@example.com"
+        )
+        self.mock_repo.get_by_email.assert_not_called()
+        # No earlier failures, so there is no lockout row to delete.
+        self.mock_lockout_repo.clear.assert_not_called()
 
     def test_login_user_invalid_password(self):
-        self.mock_repo.get_by_email.return_value = User(
-            id=uuid4(),
-            email="test@example.com",
-            hashed_password="hashed",
-            full_name="Kaitha Reddy",
+        self.mock_lockout_repo.get_login_state.return_value = LoginState(
+            user=User(
+                id=uuid4(),
+                email="test@example.com",
+                hashed_password="hashed",
+                full_name="Kaitha Reddy",
+            )
         )
 
         with patch("app.services.auth_service.verify_password", return_value=False):
@@ -103,7 +108,7 @@ class TestAuthService:
     def test_login_user_invalid_email(self):
         """Test login with non-existent email."""
         # Arrange
-        self.mock_repo.get_by_email.return_value = None
+        self.mock_lockout_repo.get_login_state.return_value = LoginState(user=None)
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
@@ -112,6 +117,7 @@ class TestAuthService:
             )
 
         assert ErrorCodes.AUTH_INVALID_CREDENTIALS in str(exc_info.value)
+        self.mock_lockout_repo.record_failure.assert_called_once()
 
     def test_get_user_by_id(self):
         """Test getting user by ID."""
@@ -1,9 +1,12 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from uuid import uuid4
+from datetime import date, datetime, timezone
 from decimal import Decimal
+from app.cache import InMemoryLRUCache, ReportCache
 from app.services.budget_service import BudgetService
 from app.models.budget import Budget
+from app.repositories.budget_repository import BudgetSpend
 from app.schemas.error_schemas import ErrorCodes
 
 
@@ -278,3 +281,103 @@ class TestBudgetService:
 
         assert ErrorCodes.BUD_INVALID_AMOUNT in str(exc_info.value)
         self.mock_repo.create.assert_called_once()
+
+
+class TestBudgetStatus:
+    """Unit tests for BudgetService.get_budget_status."""
+
+    def setup_method(self):
+        self.mock_repo = Mock()
+        self.cache = ReportCache(InMemoryLRUCache(), ttl_seconds=60)
+        self.service = BudgetService(self.mock_repo, self.cache)
+        self.user_id = uuid4()
+        self.budget_id = uuid4()
+        self.mock_repo.get_spend.return_value = BudgetSpend(
+            self.budget_id, Decimal("3100.00"), Decimal("1000.00")
+        )
+
+    def _status(self, month="2024-03", today=date(2024, 3, 10)):
+        now = datetime(today.year, today.month, today.day, 12, tzinfo=timezone.utc)
+        with patch.object(BudgetService, "utc_now", return_value=now):
+            return self.service.get_budget_status(self.user_id, month)
+
+    def test_mid_month_burn_rate_and_projection(self):
+        status = self._status()
+
+        assert status["budget_id"] == self.budget_id
+        assert status["remaining"] == Decimal("2100.00")
+        assert status["days_elapsed"] == 10
+        assert status["days_in_month"] == 31
+        assert status["daily_burn_rate"] == Decimal("100.00")
+        assert status["projected_spend"] == Decimal("3100.00")
+        assert status["as_of"] == date(2024, 3, 10)
+
+    def test_past_month_projects_actual_spend(self):
+        status = self._status(today=date(2024, 5, 2))
+
+        assert status["days_elapsed"] == 31
+        assert status["daily_burn_rate"] == Decimal("32.26")
+        assert status["projected_spend"] == Decimal("1000.00")
+
+    def test_future_month_has_no_burn(self):
+        status = self._status(today=date(2024, 2, 20))
+
+        assert status["days_elapsed"] == 0
+        assert status["daily_burn_rate"] == Decimal("0.00")
+        assert status["projected_spend"] == Decimal("1000.00")
+
+    def test_overspent_budget_has_negative_remaining(self):
+        self.mock_repo.get_spend.return_value = BudgetSpend(
+            self.budget_id, Decimal("500.00"), Decimal("620.10")
+        )
+
+        assert self._status()["remaining"] == Decimal("-120.10")
+
+    def test_missing_budget_raises_not_found(self):
+        self.mock_repo.get_spend.return_value = None
+
+        with pytest.raises(ValueError) as exc_info:
+            self._status()
+
+        assert ErrorCodes.BUD_NOT_FOUND in str(exc_info.value)
+
+    def test_invalid_month_rejected_before_query(self):
+        with pytest.raises(ValueError) as exc_info:
+            self._status(month="2024-13")
+
+        assert ErrorCodes.BUD_INVALID_MONTH in str(exc_info.value)
+        self.mock_repo.get_spend.assert_not_called()
+
+    def test_spend_is_cached_but_dates_are_recomputed(self):
+        self._status(today=date(2024, 3, 10))
+        status = self._status(today=date(2024, 3, 20))
+
+        self.mock_repo.get_spend.assert_called_once()
+        assert status["days_elapsed"] == 20
+        assert status["daily_burn_rate"] == Decimal("50.00")
+
+    def test_budget_update_invalidates_cached_spend(self):
+        self._status()
+        self.mock_repo.get_by_id.return_value = Budget(
+            id=self.budget_id, user_id=self.user_id, month="2024-03",
+            amount=Decimal("3100.00"),
+        )
+        self.mock_repo.update.side_effect = lambda budget: budget
+        self.service.update_budget_amount(
+            self.budget_id, self.user_id, Decimal("4000.00")
+        )
+
+        self._status()
+
+        assert self.mock_repo.get_spend.call_count == 2
+
+    def test_spend_cached_before_a_data_version_bump_is_refetched(self):
+        versions = Mock()
+        versions.get.return_value = 1
+        self.service = BudgetService(self.mock_repo, self.cache, versions)
+        self._status()
+
+        versions.get.return_value = 2
+        self._status()
+
+        assert self.mock_repo.get_spend.call_count == 2
@@ -0,0 +1,199 @@
+"""
+Bulk import endpoint tests (/expenses/bulk, /incomes/bulk).
+
+Covers:
+  A. JSON array, NDJSON and CSV bodies reach the service as typed rows
+  B. Schema-invalid rows are reported per row and never reach the service
+  C. Body-level problems (format, size) use the standard error envelope
+"""
+
+import json
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from app.schemas.error_schemas import ErrorCodes
+from tests.conftest import assert_error_shape
+
+
+def _service_rows(svc_method):
+    return svc_method.call_args.kwargs["rows"]
+
+
+class TestExpenseBulkImport:
+    def test_json_array(self, auth_client):
+        client, svc = auth_client["client"], auth_client["expense_service"]
+        svc.add_expenses_bulk.return_value = {"imported": 2, "errors": []}
+
+        resp = client.post(
+            "/api/v1/expenses/bulk",
+            json=[
+                {"amount": "10.00", "category": "Food", "date": "2024-03-10"},
+                {"amount": "5.50", "category": "Bus", "date": "2024-03-11",
+                 "note": "Commute"},
+            ],
+        )
+
+        assert resp.status_code == 200
+        assert resp.json() == {"imported": 2, "failed": 0, "errors": []}
+        rows = _service_rows(svc.add_expenses_bulk)
+        assert rows[1] == (
+            2,
+            {
+                "amount": Decimal("5.50"),
+                "category": "Bus",
+                "expense_date": date(2024, 3, 11),
+                "note": "Commute",
+            },
+        )
+
+    def test_ndjson_with_malformed_and_invalid_lines(self, auth_client):
+        client, svc = auth_client["client"], auth_client["expense_service"]
+        svc.add_expenses_bulk.return_value = {
+            "imported": 1,
+            "errors": [{"row": 4, "code": "EXP-002", "message": "bad amount"}],
+        }
+        body = "\n".join([
+            json.dumps({"amount": "10.00", "category": "Food", "date": "2024-03-10"}),
+            "{not json",
+            "",
+            json.dumps({"amount": "3.00", "date": "2024-03-10"}),
+            json.dumps({"amount": "0", "category": "Food", "date": "2024-03-12"}),
+        ])
+
+        resp = client.post(
+            "/api/v1/expenses/bulk",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert resp.status_code == 200
+        result = resp.json()
+        assert result["imported"] == 1
+        assert result["failed"] == 3
+        assert [(e["row"], e["errorCode"]) for e in result["errors"]] == [
+            (2, ErrorCodes.VAL_INVALID_FORMAT),
+            (3, ErrorCodes.VAL_INVALID_INPUT),
+            (4, "EXP-002"),
+        ]
+        assert "category" in result["errors"][1]["message"]
+        assert [row for row, _ in _service_rows(svc.add_expenses_bulk)] == [1, 4]
+
+    def test_csv_blank_note_is_treated_as_missing(self, auth_client):
+        client, svc = auth_client["client"], auth_client["expense_service"]
+        svc.add_expenses_bulk.return_value = {"imported": 2, "errors": []}
+        body = (
+            "amount,category,date,note\n"
+            "12.00,Food,2024-03-01,\n"
+            '7.25,Fun,2024-03-02,"cinema, popcorn"\n'
+        )
+
+        resp = client.post(
+            "/api/v1/expenses/bulk",
+            content=body,
+            headers={"Content-Type": "text/csv; charset=utf-8"},
+        )
+
+        assert resp.status_code == 200
+        rows = _service_rows(svc.add_expenses_bulk)
+        assert rows[0][1]["note"] is None
+        assert rows[1][1]["note"] == "cinema, popcorn"
+
+    def test_unsupported_content_type_returns_400(self, auth_client):
+        resp = auth_client["client"].post(
+            "/api/v1/expenses/bulk",
+            content="amount=1",
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+        assert resp.status_code == 400
+        assert_error_shape(resp.json(), 400, ErrorCodes.VAL_INVALID_FORMAT)
+
+    def test_json_object_instead_of_array_returns_400(self, auth_client):
+        resp = auth_client["client"].post("/api/v1/expenses/bulk", json={"rows": []})
+
+        assert resp.status_code == 400
+        assert_error_shape(resp.json(), 400, ErrorCodes.VAL_INVALID_FORMAT)
+
+    def test_too_many_rows_returns_400(self, auth_client):
+        client, svc = auth_client["client"], auth_client["expense_service"]
+        row = {"amount": "1.00", "category": "Food", "date": "2024-03-10"}
+
+        with patch("app.controllers.expense_controller.settings") as settings:
+            settings.BULK_IMPORT_MAX_ROWS = 2
+            settings.BULK_IMPORT_MAX_BYTES = 1024
+            resp = client.post("/api/v1/expenses/bulk", json=[row] * 3)
+
+        assert resp.status_code == 400
+        assert_error_shape(resp.json(), 400, ErrorCodes.VAL_INVALID_RANGE)
+        svc.add_expenses_bulk.assert_not_called()
+
+    def test_body_over_byte_limit_returns_400(self, auth_client):
+        client, svc = auth_client["client"], auth_client["expense_service"]
+        row = {"amount": "1.00", "category": "Food", "date": "2024-03-10"}
+
+        with patch("app.controllers.expense_controller.settings") as settings:
+            settings.BULK_IMPORT_MAX_ROWS = 1000
+            settings.BULK_IMPORT_MAX_BYTES = 100
+            resp = client.post("/api/v1/expenses/bulk", json=[row] * 3)
+
+        assert resp.status_code == 400
+        assert_error_shape(resp.json(), 400, ErrorCodes.VAL_INVALID_RANGE)
+        assert "bytes" in resp.json()["message"]
+        svc.add_expenses_bulk.assert_not_called()
+
+    def test_csv_quoted_field_may_span_lines(self, auth_client):
+        client, svc = auth_client["client"], auth_client["expense_service"]
+        svc.add_expenses_bulk.return_value = {"imported": 2, "errors": []}
+        body = (
+            "amount,category,date,note\r\n"
+            '3.00,Food,2024-03-01,"first line\nsecond line"\r\n'
+            "\r\n"
+            "4.00,Fun,2024-03-02\r\n"
+        )
+
+        resp = client.post(
+            "/api/v1/expenses/bulk",
+            content=body,
+            headers={"Content-Type": "text/csv"},
+        )
+
+        assert resp.status_code == 200
+        rows = _service_rows(svc.add_expenses_bulk)
+        assert [row for row, _ in rows] == [1, 2]
+        assert rows[0][1]["note"] == "first line\nsecond line"
+        assert rows[1][1]["note"] is None
+
+    def test_requires_authentication(self, unauth_client):
+        resp = unauth_client["client"].post("/api/v1/expenses/bulk", json=[])
+
+        assert resp.status_code == 401
+
+
+class TestIncomeBulkImport:
+    def test_json_array(self, auth_client):
+        client, svc = auth_client["client"], auth_client["income_service"]
+        svc.add_incomes_bulk.return_value = {"imported": 1, "errors": []}
+
+        resp = client.post(
+            "/api/v1/incomes/bulk",
+            json=[
+                {"amount": "3000.00", "source": "Salary", "date": "2024-03-01"},
+                {"amount": "-1", "source": "Refund", "date": "2024-03-02"},
+            ],
+        )
+
+        assert resp.status_code == 200
+        result = resp.json()
+        assert result["imported"] == 1
+        assert result["errors"][0]["row"] == 2
+        assert _service_rows(svc.add_incomes_bulk) == [
+            (
+                1,
+                {
+                    "amount": Decimal("3000.00"),
+                    "source": "Salary",
+                    "income_date": date(2024, 3, 1),
+                },
+            )
+        ]
@@ -0,0 +1,67 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from app.services.dashboard_service import DashboardService
+
+
+class TestDashboardService:
+    """Unit tests for DashboardService."""
+
+    def setup_method(self):
+        self.budget_service = Mock()
+        self.report_service = Mock()
+        self.expense_service = Mock()
+        self.service = DashboardService(
+            self.budget_service, self.report_service, self.expense_service
+        )
+        self.user_id = uuid4()
+        self.now = datetime(2024, 2, 10, 12, tzinfo=timezone.utc)
+        self.expense_service.list_expenses.return_value = {
+            "items": ["e1", "e2"],
+            "next_cursor": "more",
+        }
+        self.report_service.get_monthly_summary.return_value = {
+            "month": "2024-02",
+            "expenses_by_category": {"Food": Decimal("10.00")},
+        }
+
+    def _dashboard(self, recent_limit=10):
+        with patch.object(DashboardService, "utc_now", return_value=self.now):
+            return self.service.get_dashboard(self.user_id, recent_limit)
+
+    def test_composes_current_month_parts(self):
+        self.budget_service.find_budget_status.return_value = {
+            "spent": Decimal("10.00")
+        }
+
+        dashboard = self._dashboard()
+
+        assert dashboard["month"] == "2024-02"
+        assert dashboard["budget"] == {"spent": Decimal("10.00")}
+        summary = dashboard["summary"]
+        assert summary["expenses_by_category"] == {"Food": Decimal("10.00")}
+        assert dashboard["recent_expenses"] == ["e1", "e2"]
+        assert dashboard["generated_at"] == self.now
+        self.budget_service.find_budget_status.assert_called_once_with(
+            self.user_id, "2024-02"
+        )
+        self.report_service.get_monthly_summary.assert_called_once_with(
+            self.user_id, "2024-02"
+        )
+
+    def test_recent_expenses_limited_to_month(self):
+        self._dashboard(recent_limit=3)
+
+        self.expense_service.list_expenses.assert_called_once_with(
+            user_id=self.user_id,
+            limit=3,
+            start_date=date(2024, 2, 1),
+            end_date=date(2024, 2, 29),
+        )
+
+    def test_missing_budget_is_none(self):
+        self.budget_service.find_budget_status.return_value = None
+
+        assert self._dashboard()["budget"] is None
@@ -28,6 +28,8 @@ from starlette.requests import Request
 from app.main import app
 from app.dependencies import get_current_user
 import app.dependencies as dependencies
+from app.cache import InMemoryLRUCache, PrincipalCache
+from app.services.auth_service import AuthService
 from app.schemas.error_schemas import ErrorCodes
 from app.middleware.error_handler import (
     general_exception_handler,
@@ -665,3 +667,78 @@ class TestFailureScenarios:
         client = unauth_client["client"]
         resp = client.get("/")
         assert resp.status_code == 200
+
+
+# ===========================================================================
+# DEPENDENCY: get_current_user PRINCIPAL CACHE
+# ===========================================================================
+
+
+class CountingAuthService:
+    """Stub AuthService that counts user lookups."""
+
+    def __init__(self, user):
+        self.user = user
+        self.calls = 0
+
+    def get_user_by_id(self, _user_id):
+        self.calls += 1
+        return self.user
+
+
+def _principal_cache(ttl_seconds=60):
+    return PrincipalCache(InMemoryLRUCache(max_entries=8), ttl_seconds=ttl_seconds)
+
+
+def test_get_current_user_skips_lookup_for_cached_principal(monkeypatch):
+    user_id = uuid4()
+    monkeypatch.setattr(
+        dependencies,
+        "decode_access_token",
+        lambda _: {"sub": str(user_id), "email": "tester@example.com"},
+    )
+    monkeypatch.setattr(dependencies, "principal_cache", _principal_cache())
+    auth_service = CountingAuthService(
+        SimpleUser(id=user_id, email="tester@example.com")
+    )
+
+    for _ in range(3):
+        token_data = dependencies.get_current_user(
+            token="valid-looking", auth_service=auth_service
+        )
+
+    assert token_data.user_id == user_id
+    assert auth_service.calls == 1
+
+
+def test_get_current_user_does_not_cache_missing_user(monkeypatch):
+    user_id = uuid4()
+    monkeypatch.setattr(
+        dependencies,
+        "decode_access_token",
+        lambda _: {"sub": str(user_id), "email": "tester@example.com"},
+    )
+    cache = _principal_cache()
+    monkeypatch.setattr(dependencies, "principal_cache", cache)
+    auth_service = CountingAuthService(None)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            dependencies.get_current_user(
+                token="valid-looking", auth_service=auth_service
+            )
+
+    assert auth_service.calls == 2
+    assert not cache.contains(user_id)
+
+
+def test_delete_user_evicts_cached_principal():
+    user_id = uuid4()
+    cache = _principal_cache()
+    cache.remember(user_id)
+    user_repo = Mock()
+    user_repo.delete.return_value = True
+    service = AuthService(user_repo, Mock(), principal_cache=cache)
+
+    assert service.delete_user(user_id) is True
+    assert not cache.contains(user_id)
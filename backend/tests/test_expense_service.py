@@ -6,6 +6,7 @@ from datetime import date
 from app.services.expense_service import ExpenseService
 from app.models.expense import Expense
 from app.schemas.error_schemas import ErrorCodes
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 class TestExpenseService:
@@ -146,3 +147,132 @@ class TestExpenseService:
                 expense_date=date(2024, 3, 10),
             )
         assert ErrorCodes.EXP_INVALID_CATEGORY in str(exc_info.value)
+
+    def test_add_expense_invalidates_cached_report_for_its_month(self):
+        cache = Mock()
+        service = ExpenseService(self.mock_repo, report_cache=cache)
+        self.mock_repo.create.side_effect = lambda expense: expense
+
+        service.add_expense(
+            user_id=self.user_id,
+            amount=Decimal("10.00"),
+            category="Food",
+            expense_date=date(2024, 3, 10),
+        )
+
+        cache.invalidate_date.assert_called_once_with(self.user_id, date(2024, 3, 10))
+
+    def test_failed_validation_does_not_invalidate(self):
+        cache = Mock()
+        service = ExpenseService(self.mock_repo, report_cache=cache)
+
+        with pytest.raises(ValueError):
+            service.add_expense(
+                user_id=self.user_id,
+                amount=Decimal("0"),
+                category="Food",
+                expense_date=date(2024, 3, 10),
+            )
+
+        cache.invalidate_date.assert_not_called()
+
+    def test_add_expenses_bulk_inserts_valid_rows_and_reports_the_rest(self):
+        cache = Mock()
+        service = ExpenseService(self.mock_repo, report_cache=cache)
+        self.mock_repo.bulk_create.side_effect = len
+
+        result = service.add_expenses_bulk(
+            user_id=self.user_id,
+            rows=[
+                (1, {"amount": Decimal("10.00"), "category": " Food ",
+                     "expense_date": date(2024, 3, 10), "note": None}),
+                (2, {"amount": Decimal("0"), "category": "Food",
+                     "expense_date": date(2024, 3, 11), "note": None}),
+                (3, {"amount": Decimal("5.00"), "category": "Travel",
+                     "expense_date": date(2024, 4, 2), "note": "Bus"}),
+            ],
+        )
+
+        inserted = self.mock_repo.bulk_create.call_args.args[0]
+        assert [row["category"] for row in inserted] == ["Food", "Travel"]
+        assert result["imported"] == 2
+        assert result["errors"] == [
+            {
+                "row": 2,
+                "code": ErrorCodes.EXP_INVALID_AMOUNT,
+                "message": "Expense amount must be greater than 0",
+            }
+        ]
+        invalidated = {c.args for c in cache.invalidate_date.call_args_list}
+        assert invalidated == {
+            (self.user_id, date(2024, 3, 1)),
+            (self.user_id, date(2024, 4, 1)),
+        }
+
+
+class TestExpenseListing:
+    """Unit tests for ExpenseService.list_expenses (keyset pagination)."""
+
+    def setup_method(self):
+        self.mock_repo = Mock()
+        self.service = ExpenseService(self.mock_repo)
+        self.user_id = uuid4()
+
+    def _rows(self, n):
+        return [
+            Expense(id=uuid4(), user_id=self.user_id, amount=Decimal("1.00"),
+                    category="Food", date=date(2024, 3, 20 - i))
+            for i in range(n)
+        ]
+
+    def test_full_page_returns_cursor_for_last_item(self):
+        rows = self._rows(3)
+        self.mock_repo.list_page.return_value = rows
+
+        page = self.service.list_expenses(user_id=self.user_id, limit=2)
+
+        assert page["items"] == rows[:2]
+        assert decode_cursor(page["next_cursor"]) == (rows[1].date, rows[1].id)
+        assert self.mock_repo.list_page.call_args.kwargs["limit"] == 3
+
+    def test_last_page_has_no_cursor(self):
+        self.mock_repo.list_page.return_value = self._rows(2)
+
+        page = self.service.list_expenses(user_id=self.user_id, limit=2)
+
+        assert len(page["items"]) == 2
+        assert page["next_cursor"] is None
+
+    def test_cursor_is_decoded_into_repository_keyset(self):
+        expense_id = uuid4()
+        self.mock_repo.list_page.return_value = []
+
+        self.service.list_expenses(
+            user_id=self.user_id,
+            limit=10,
+            cursor=encode_cursor(date(2024, 3, 5), expense_id),
+        )
+
+        assert self.mock_repo.list_page.call_args.kwargs["after"] == (
+            date(2024, 3, 5),
+            expense_id,
+        )
+
+    def test_malformed_cursor_raises_val_format(self):
+        with pytest.raises(ValueError) as exc_info:
+            self.service.list_expenses(user_id=self.user_id, limit=10, cursor="%%%")
+        assert ErrorCodes.VAL_INVALID_FORMAT in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"limit": 0},
+            {"limit": 10, "start_date": date(2024, 4, 1), "end_date": date(2024, 3, 1)},
+            {"limit": 10, "min_amount": Decimal("5"), "max_amount": Decimal("1")},
+        ],
+    )
+    def test_invalid_ranges_raise_val_range(self, kwargs):
+        with pytest.raises(ValueError) as exc_info:
+            self.service.list_expenses(user_id=self.user_id, **kwargs)
+        assert ErrorCodes.VAL_INVALID_RANGE in str(exc_info.value)
+        self.mock_repo.list_page.assert_not_called()
@@ -0,0 +1,146 @@
+"""
+Transaction export tests (GET /api/v1/exports/transactions).
+
+Covers:
+  A. CSV / NDJSON formatting and chunking in ExportService
+  B. Argument validation happens before streaming starts
+  C. HTTP wiring: streaming response, media type, download filename
+"""
+
+from collections import namedtuple
+from contextlib import nullcontext
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+import pytest
+
+from app.dependencies import get_export_service
+from app.main import app
+from app.schemas.error_schemas import ErrorCodes
+from app.services.export_service import ExportService
+from tests.conftest import FIXED_USER_ID, assert_error_shape
+
+Txn = namedtuple("Txn", ExportService.CSV_COLUMNS)
+
+ROWS = [
+    Txn(
+        "income", UUID(int=1), date(2024, 1, 1), Decimal("3000.00"),
+        None, "Salary", None,
+    ),
+    Txn(
+        "expense", UUID(int=2), date(2024, 1, 2), Decimal("12.50"),
+        "Food", None, "Lunch",
+    ),
+    Txn("expense", UUID(int=3), date(2024, 1, 3), Decimal("4.00"), "Bus", None, None),
+]
+
+
+def _service(rows, batch_size=1000):
+    service = ExportService(lambda: nullcontext(Mock()), batch_size=batch_size)
+    repo = Mock()
+    repo.iter_transactions.return_value = iter(rows)
+    return service, patch(
+        "app.services.export_service.ExportRepository", return_value=repo
+    )
+
+
+class TestExportService:
+    def test_csv_has_header_and_blank_cells_for_missing_values(self):
+        service, repo_patch = _service(ROWS)
+        with repo_patch:
+            body = "".join(service.export_transactions(FIXED_USER_ID, "csv"))
+
+        lines = body.splitlines()
+        assert lines[0] == "type,id,date,amount,category,source,note"
+        assert lines[1] == f"income,{UUID(int=1)},2024-01-01,3000.00,,Salary,"
+        assert len(lines) == 4
+
+    def test_ndjson_omits_fields_that_do_not_apply(self):
+        service, repo_patch = _service(ROWS[:2])
+        with repo_patch:
+            lines = "".join(
+                service.export_transactions(FIXED_USER_ID, "ndjson")
+            ).splitlines()
+
+        assert lines[0] == (
+            '{"type": "income", "id": "00000000-0000-0000-0000-000000000001", '
+            '"date": "2024-01-01", "amount": "3000.00", "source": "Salary"}'
+        )
+        assert '"category": "Food"' in lines[1]
+        assert "source" not in lines[1]
+
+    def test_output_is_chunked_per_batch(self):
+        service, repo_patch = _service(ROWS, batch_size=2)
+        with repo_patch:
+            chunks = list(service.export_transactions(FIXED_USER_ID, "csv"))
+
+        # header, rows 1-2, row 3
+        assert len(chunks) == 3
+        assert chunks[0].startswith("type,")
+
+    def test_empty_ndjson_export_yields_nothing(self):
+        service, repo_patch = _service([])
+        with repo_patch:
+            assert list(service.export_transactions(FIXED_USER_ID, "ndjson")) == []
+
+    def test_invalid_arguments_raise_before_opening_a_session(self):
+        factory = Mock()
+        service = ExportService(factory)
+
+        with pytest.raises(ValueError, match=ErrorCodes.VAL_INVALID_FORMAT):
+            service.export_transactions(FIXED_USER_ID, "xlsx")
+        with pytest.raises(ValueError, match=ErrorCodes.VAL_INVALID_RANGE):
+            service.export_transactions(
+                FIXED_USER_ID, "csv", date(2024, 2, 1), date(2024, 1, 1)
+            )
+        factory.assert_not_called()
+
+
+class TestExportController:
+    def test_streams_csv_download(self, auth_client):
+        service = Mock()
+        service.export_transactions.return_value = iter(["type,id\n", "expense,1\n"])
+        app.dependency_overrides[get_export_service] = lambda: service
+
+        resp = auth_client["client"].get(
+            "/api/v1/exports/transactions",
+            params={"from": "2024-01-01", "to": "2024-12-31"},
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/csv")
+        assert 'filename="transactions.csv"' in resp.headers["content-disposition"]
+        assert resp.text == "type,id\nexpense,1\n"
+        kwargs = service.export_transactions.call_args.kwargs
+        assert kwargs["export_format"] == "csv"
+        assert kwargs["start_date"] == date(2024, 1, 1)
+        assert kwargs["end_date"] == date(2024, 12, 31)
+
+    def test_ndjson_media_type(self, auth_client):
+        service = Mock()
+        service.export_transactions.return_value = iter([])
+        app.dependency_overrides[get_export_service] = lambda: service
+
+        resp = auth_client["client"].get(
+            "/api/v1/exports/transactions", params={"format": "ndjson"}
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    def test_invalid_format_returns_json_error(self, auth_client):
+        app.dependency_overrides[get_export_service] = lambda: ExportService(Mock())
+
+        resp = auth_client["client"].get(
+            "/api/v1/exports/transactions", params={"format": "pdf"}
+        )
+
+        assert resp.status_code == 400
+        assert_error_shape(resp.json(), 400, ErrorCodes.VAL_INVALID_FORMAT)
+
+    def test_requires_authentication(self, unauth_client):
+        resp = unauth_client["client"].get("/api/v1/exports/transactions")
+
+        assert resp.status_code == 401
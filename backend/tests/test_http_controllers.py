@@ -15,10 +15,12 @@ Merged from: test_controllers.py + unique tests from test_api_controllers.py
 """
 
 import pytest
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from uuid import uuid4
 
 from app.main import app
+from app.config import get_settings
 from app.schemas.error_schemas import ErrorCodes
 from tests.conftest import (
     make_user,
@@ -73,7 +75,7 @@ class TestAuthController:
     def test_register_success(self, unauth_client):
         client = unauth_client["client"]
         svc = unauth_client["auth_service"]
-        svc.register_user.return_value = make_user()
+        svc.register_user_async.return_value = make_user()
 
         resp = client.post(
             "/api/v1/auth/register",
@@ -93,7 +95,7 @@ class TestAuthController:
     def test_register_duplicate_email_returns_409(self, unauth_client):
         client = unauth_client["client"]
         svc = unauth_client["auth_service"]
-        svc.register_user.side_effect = ValueError(
+        svc.register_user_async.side_effect = ValueError(
             f"{ErrorCodes.USER_EXISTS}: User already exists"
         )
 
@@ -160,7 +162,7 @@ class TestAuthController:
     def test_login_success(self, unauth_client):
         client = unauth_client["client"]
         svc = unauth_client["auth_service"]
-        svc.login_user.return_value = "jwt.access.token"
+        svc.login_user_async.return_value = "jwt.access.token"
 
         resp = client.post(
             "/api/v1/auth/login",
@@ -175,7 +177,7 @@ class TestAuthController:
     def test_login_invalid_credentials_returns_401(self, unauth_client):
         client = unauth_client["client"]
         svc = unauth_client["auth_service"]
-        svc.login_user.side_effect = ValueError(
+        svc.login_user_async.side_effect = ValueError(
             f"{ErrorCodes.AUTH_INVALID_CREDENTIALS}: Invalid email or password"
         )
 
@@ -349,6 +351,119 @@ class TestExpenseController:
         assert resp.status_code == 200
         assert resp.json() == []
 
+    def test_current_month_expenses_304_until_data_version_changes(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["expense_service"]
+        svc.get_current_month_expenses.return_value = [make_expense()]
+        etag = client.get("/api/v1/expenses/current-month").headers["ETag"]
+
+        resp = client.get(
+            "/api/v1/expenses/current-month", headers={"If-None-Match": etag}
+        )
+
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["ETag"] == etag
+        svc.get_current_month_expenses.assert_called_once()
+
+        auth_client["data_version_service"].get_data_version.return_value = 2
+        resp = client.get(
+            "/api/v1/expenses/current-month", headers={"If-None-Match": etag}
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
+    # --- GET /expenses (filtered, paginated) ---
+
+    def test_list_expenses_passes_filters_and_returns_cursor(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["expense_service"]
+        svc.list_expenses.return_value = {
+            "items": [make_expense()],
+            "next_cursor": "abc",
+        }
+
+        resp = client.get(
+            "/api/v1/expenses",
+            params={
+                "from": "2024-03-01",
+                "to": "2024-03-31",
+                "category": "Groceries",
+                "min_amount": "10",
+                "limit": 1,
+            },
+        )
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["nextCursor"] == "abc"
+        assert body["items"][0]["expenseId"] == str(FIXED_EXPENSE_ID)
+        kwargs = svc.list_expenses.call_args.kwargs
+        assert kwargs["start_date"].isoformat() == "2024-03-01"
+        assert kwargs["end_date"].isoformat() == "2024-03-31"
+        assert kwargs["category"] == "Groceries"
+        assert kwargs["min_amount"] == Decimal("10")
+        assert kwargs["limit"] == 1
+
+    # --- FAST_JSON_ENABLED ---
+
+    def test_fast_json_listings_match_default_bodies(self, auth_client, monkeypatch):
+        client = auth_client["client"]
+        svc = auth_client["expense_service"]
+        svc.get_current_month_expenses.return_value = [
+            make_expense(),
+            make_expense(expense_id=uuid4(), amount=Decimal("0.50"), note="Bus"),
+        ]
+        svc.list_expenses.return_value = {
+            "items": [make_expense()],
+            "next_cursor": None,
+        }
+
+        default = [
+            client.get("/api/v1/expenses/current-month"),
+            client.get("/api/v1/expenses"),
+        ]
+        monkeypatch.setattr(get_settings(), "FAST_JSON_ENABLED", True)
+        fast = [
+            client.get("/api/v1/expenses/current-month"),
+            client.get("/api/v1/expenses"),
+        ]
+
+        for slow_resp, fast_resp in zip(default, fast):
+            assert fast_resp.status_code == 200
+            assert fast_resp.content == slow_resp.content
+        assert fast[0].headers["ETag"] == default[0].headers["ETag"]
+        assert fast[0].headers["Cache-Control"] == "private, no-cache"
+
+    def test_list_expenses_clamps_page_size(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["expense_service"]
+        svc.list_expenses.return_value = {"items": [], "next_cursor": None}
+
+        resp = client.get("/api/v1/expenses", params={"limit": 100000})
+
+        assert resp.status_code == 200
+        assert resp.json() == {"items": [], "nextCursor": None}
+        assert svc.list_expenses.call_args.kwargs["limit"] == 200
+
+    def test_list_expenses_invalid_date_returns_400(self, auth_client):
+        resp = auth_client["client"].get("/api/v1/expenses", params={"from": "March"})
+
+        assert resp.status_code == 400
+        assert_validation_error(resp.json())
+
+    def test_list_expenses_bad_cursor_returns_400(self, auth_client):
+        svc = auth_client["expense_service"]
+        svc.list_expenses.side_effect = ValueError(
+            f"{ErrorCodes.VAL_INVALID_FORMAT}:Invalid pagination cursor"
+        )
+
+        resp = auth_client["client"].get("/api/v1/expenses", params={"cursor": "x"})
+
+        assert resp.status_code == 400
+        assert_error_shape(resp.json(), 400, ErrorCodes.VAL_INVALID_FORMAT)
+
 
 # ===========================================================================
 # BUDGET CONTROLLER
@@ -462,6 +577,70 @@ class TestBudgetController:
 
         assert resp.status_code == 404
         assert_error_shape(resp.json(), 404, ErrorCodes.BUD_NOT_FOUND)
+        assert "ETag" not in resp.headers
+
+    def test_current_month_budget_matching_etag_returns_304(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["budget_service"]
+        svc.get_current_month_budget.return_value = make_budget()
+        etag = client.get("/api/v1/budgets/current-month").headers["ETag"]
+
+        resp = client.get(
+            "/api/v1/budgets/current-month",
+            headers={"If-None-Match": f'"other", {etag}'},
+        )
+
+        assert resp.status_code == 304
+        svc.get_current_month_budget.assert_called_once()
+
+    # --- GET /budgets/{month}/status ---
+
+    def test_get_budget_status_success(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["budget_service"]
+        svc.get_budget_status.return_value = {
+            "budget_id": FIXED_BUDGET_ID,
+            "month": "2024-03",
+            "amount": Decimal("3100.00"),
+            "spent": Decimal("1000.00"),
+            "remaining": Decimal("2100.00"),
+            "daily_burn_rate": Decimal("100.00"),
+            "projected_spend": Decimal("3100.00"),
+            "days_elapsed": 10,
+            "days_in_month": 31,
+            "as_of": date(2024, 3, 10),
+        }
+
+        resp = client.get("/api/v1/budgets/2024-03/status")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["budgetId"] == str(FIXED_BUDGET_ID)
+        assert body["totalAmount"] == "3100.00"
+        assert body["remaining"] == "2100.00"
+        assert body["dailyBurnRate"] == "100.00"
+        assert body["projectedSpend"] == "3100.00"
+        assert body["asOf"] == "2024-03-10"
+        svc.get_budget_status.assert_called_once_with(
+            user_id=FIXED_USER_ID, month="2024-03"
+        )
+
+    def test_get_budget_status_not_found_returns_404(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["budget_service"]
+        svc.get_budget_status.side_effect = ValueError(
+            f"{ErrorCodes.BUD_NOT_FOUND}: Budget not found"
+        )
+
+        resp = client.get("/api/v1/budgets/2024-03/status")
+
+        assert resp.status_code == 404
+        assert_error_shape(resp.json(), 404, ErrorCodes.BUD_NOT_FOUND)
+
+    def test_get_budget_status_malformed_month_returns_400(self, auth_client):
+        client = auth_client["client"]
+        resp = client.get("/api/v1/budgets/March/status")
+        assert resp.status_code == 400
 
     # --- GET /budgets/{budgetId} ---
 
@@ -661,6 +840,25 @@ class TestReportController:
         assert "totalExpenses" in body
         assert "net" in body
         assert "byCategory" in body
+        assert resp.headers["Cache-Control"] == "private, no-cache"
+
+    def test_monthly_summary_etag_is_per_month(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["report_service"]
+        svc.get_monthly_summary.return_value = self._make_summary()
+        svc.utc_now.return_value = "2024-03-31T00:00:00Z"
+        etag = client.get("/api/v1/reports/summary?month=2024-03").headers["ETag"]
+
+        same = client.get(
+            "/api/v1/reports/summary?month=2024-03", headers={"If-None-Match": etag}
+        )
+        other = client.get(
+            "/api/v1/reports/summary?month=2024-04", headers={"If-None-Match": etag}
+        )
+
+        assert same.status_code == 304
+        assert other.status_code == 200
+        assert svc.get_monthly_summary.call_count == 2
 
     def test_get_monthly_summary_missing_month_returns_400(self, auth_client):
         client = auth_client["client"]
@@ -689,3 +887,165 @@ class TestReportController:
 
         assert resp.status_code == 400
         assert_error_shape(resp.json(), 400, ErrorCodes.RPT_INVALID_MONTH)
+
+    def test_get_range_summary_success(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["report_service"]
+        month = self._make_summary()
+        svc.get_range_summary.return_value = {
+            "start_month": "2024-03",
+            "end_month": "2024-03",
+            "total_income": month["total_income"],
+            "total_expenses": month["total_expenses"],
+            "net_balance": month["net_balance"],
+            "expenses_by_category": month["expenses_by_category"],
+            "months": [month],
+        }
+        svc.utc_now.return_value = "2024-03-31T00:00:00Z"
+
+        resp = client.get("/api/v1/reports/range?from=2024-03&to=2024-03")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["from"] == "2024-03"
+        assert body["to"] == "2024-03"
+        assert "totalIncome" in body and "byCategory" in body
+        assert body["months"][0]["month"] == "2024-03"
+        assert "generatedAt" in body["months"][0]
+        svc.get_range_summary.assert_called_once()
+        assert svc.get_range_summary.call_args.kwargs["start_month"] == "2024-03"
+
+    def test_get_range_summary_missing_bound_returns_400(self, auth_client):
+        client = auth_client["client"]
+        resp = client.get("/api/v1/reports/range?from=2024-01")
+        assert resp.status_code == 400
+
+    def test_get_range_summary_invalid_format_returns_400(self, auth_client):
+        client = auth_client["client"]
+        resp = client.get("/api/v1/reports/range?from=2024-01&to=Dec-2024")
+        assert resp.status_code == 400
+
+    def test_get_range_summary_service_error_returns_400(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["report_service"]
+        svc.get_range_summary.side_effect = ValueError(
+            f"{ErrorCodes.VAL_INVALID_RANGE}:'from' must not be after 'to'"
+        )
+
+        resp = client.get("/api/v1/reports/range?from=2024-05&to=2024-01")
+
+        assert resp.status_code == 400
+        assert_error_shape(resp.json(), 400, ErrorCodes.VAL_INVALID_RANGE)
+
+
+# ===========================================================================
+# DASHBOARD CONTROLLER
+# ===========================================================================
+
+
+class TestDashboardController:
+    """Tests for /api/v1/dashboard, including conditional GETs."""
+
+    def _make_dashboard(self, budget=True):
+        return {
+            "month": "2024-03",
+            "budget": {
+                "budget_id": FIXED_BUDGET_ID,
+                "month": "2024-03",
+                "amount": Decimal("3100.00"),
+                "spent": Decimal("150.00"),
+                "remaining": Decimal("2950.00"),
+                "daily_burn_rate": Decimal("15.00"),
+                "projected_spend": Decimal("465.00"),
+                "days_elapsed": 10,
+                "days_in_month": 31,
+                "as_of": date(2024, 3, 10),
+            } if budget else None,
+            "summary": {
+                "month": "2024-03",
+                "total_income": Decimal("3500.00"),
+                "total_expenses": Decimal("150.00"),
+                "net_balance": Decimal("3350.00"),
+                "expenses_by_category": {"Groceries": Decimal("150.00")},
+            },
+            "recent_expenses": [make_expense()],
+            "generated_at": datetime(2024, 3, 10, 12, tzinfo=timezone.utc),
+        }
+
+    def test_get_dashboard_success(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["dashboard_service"]
+        svc.get_dashboard.return_value = self._make_dashboard()
+
+        resp = client.get("/api/v1/dashboard")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["budget"]["remaining"] == "2950.00"
+        assert body["summary"]["byCategory"] == {"Groceries": "150.00"}
+        assert body["recentExpenses"][0]["expenseId"] == str(FIXED_EXPENSE_ID)
+        assert resp.headers["ETag"].startswith('W/"')
+        assert resp.headers["Cache-Control"] == "private, no-cache"
+        svc.get_dashboard.assert_called_once_with(
+            user_id=FIXED_USER_ID, recent_limit=10
+        )
+
+    def test_get_dashboard_without_budget(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["dashboard_service"]
+        svc.get_dashboard.return_value = self._make_dashboard(budget=False)
+
+        resp = client.get("/api/v1/dashboard")
+
+        assert resp.status_code == 200
+        assert resp.json()["budget"] is None
+
+    def test_recent_is_capped_at_page_size_max(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["dashboard_service"]
+        svc.get_dashboard.return_value = self._make_dashboard()
+
+        client.get("/api/v1/dashboard?recent=100000")
+
+        assert svc.get_dashboard.call_args.kwargs["recent_limit"] == 200
+
+    def test_matching_if_none_match_returns_304_without_service_call(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["dashboard_service"]
+        svc.get_dashboard.return_value = self._make_dashboard()
+        etag = client.get("/api/v1/dashboard").headers["ETag"]
+
+        resp = client.get("/api/v1/dashboard", headers={"If-None-Match": etag})
+
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["ETag"] == etag
+        svc.get_dashboard.assert_called_once()
+
+    def test_write_invalidation_changes_etag(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["dashboard_service"]
+        svc.get_dashboard.return_value = self._make_dashboard()
+        etag = client.get("/api/v1/dashboard").headers["ETag"]
+
+        auth_client["data_version_service"].get_data_version.return_value = 2
+        resp = client.get("/api/v1/dashboard", headers={"If-None-Match": etag})
+
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
+    def test_etag_depends_on_recent_limit(self, auth_client):
+        client = auth_client["client"]
+        svc = auth_client["dashboard_service"]
+        svc.get_dashboard.return_value = self._make_dashboard()
+        etag = client.get("/api/v1/dashboard").headers["ETag"]
+
+        resp = client.get(
+            "/api/v1/dashboard?recent=5", headers={"If-None-Match": etag}
+        )
+
+        assert resp.status_code == 200
+
+    def test_get_dashboard_requires_auth(self, unauth_client):
+        resp = unauth_client["client"].get("/api/v1/dashboard")
+        assert resp.status_code == 401
@@ -112,3 +112,39 @@ class TestIncomeService:
                 income_date=date(2024, 3, 15),
             )
         assert ErrorCodes.INC_INVALID_SOURCE in str(exc_info.value)
+
+    def test_add_income_invalidates_cached_report_for_its_month(self):
+        cache = Mock()
+        service = IncomeService(self.mock_repo, report_cache=cache)
+        self.mock_repo.create.side_effect = lambda income: income
+
+        service.add_income(
+            user_id=self.user_id,
+            amount=Decimal("10.00"),
+            source="Gift",
+            income_date=date(2024, 12, 31),
+        )
+
+        cache.invalidate_date.assert_called_once_with(
+            self.user_id, date(2024, 12, 31)
+        )
+
+    def test_add_incomes_bulk_inserts_valid_rows_and_reports_the_rest(self):
+        cache = Mock()
+        service = IncomeService(self.mock_repo, report_cache=cache)
+        self.mock_repo.bulk_create.side_effect = len
+
+        result = service.add_incomes_bulk(
+            user_id=self.user_id,
+            rows=[
+                (1, {"amount": Decimal("100.00"), "source": "Salary",
+                     "income_date": date(2024, 3, 1)}),
+                (2, {"amount": Decimal("50.00"), "source": "  ",
+                     "income_date": date(2024, 3, 2)}),
+            ],
+        )
+
+        assert result["imported"] == 1
+        assert result["errors"][0]["row"] == 2
+        assert result["errors"][0]["code"] == ErrorCodes.INC_INVALID_SOURCE
+        cache.invalidate_date.assert_called_once_with(self.user_id, date(2024, 3, 1))
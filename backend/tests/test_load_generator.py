@@ -0,0 +1,55 @@
+"""Unit tests for the load generator's latency histogram."""
+
+import pytest
+
+from scripts.perf.load_generator import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    def test_bucket_error_stays_below_the_documented_bound(self):
+        hist = LatencyHistogram()
+        bound = 1 / 2**hist.SUB_BUCKET_BITS
+
+        for value in list(range(1, 5000)) + [2**20 - 1, 2**20, 123_456_789]:
+            bucket = hist._bucket(value)
+            assert bucket <= value
+            assert (value - bucket) / value < bound
+
+    def test_small_values_are_exact(self):
+        hist = LatencyHistogram()
+        limit = 2 ** (hist.SUB_BUCKET_BITS + 1)
+
+        assert [hist._bucket(v) for v in range(limit)] == list(range(limit))
+
+    def test_each_octave_has_two_to_the_sub_bucket_bits_buckets(self):
+        hist = LatencyHistogram()
+        octave = range(2**16, 2**17)
+
+        assert len({hist._bucket(v) for v in octave}) == 2**hist.SUB_BUCKET_BITS
+
+    def test_percentiles(self):
+        hist = LatencyHistogram()
+        for ms in range(1, 1001):
+            hist.record(ms / 1000)
+
+        summary = hist.summary()
+        assert summary["min"] == 1.0 and summary["max"] == 1000.0
+        assert summary["mean"] == pytest.approx(500.5)
+        for p, expected in ((50, 500.0), (90, 900.0), (99, 990.0)):
+            assert hist.percentile(p) == pytest.approx(expected, rel=1 / 128)
+            assert hist.percentile(p) <= expected
+
+    def test_merge_matches_recording_into_one(self):
+        combined, left, right = (
+            LatencyHistogram(),
+            LatencyHistogram(),
+            LatencyHistogram(),
+        )
+        for i, seconds in enumerate(x / 997 for x in range(1, 500)):
+            combined.record(seconds)
+            (left if i % 2 else right).record(seconds)
+
+        left.merge(right)
+
+        assert left.to_dict() == combined.to_dict()
+        assert left.summary() == combined.summary()
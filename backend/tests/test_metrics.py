@@ -0,0 +1,148 @@
+"""Unit tests for the /metrics registry and SQLAlchemy instrumentation."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.db_metrics import (
+    POOL_CHECKOUT_SECONDS,
+    SLOW_STATEMENTS,
+    STATEMENT_SECONDS,
+    InstrumentedQueuePool,
+    fingerprint,
+    instrument_engine,
+)
+from app.metrics import MetricsRegistry, OVERFLOW_LABEL, _Metric
+
+
+class TestRegistry:
+    def test_histogram_renders_cumulative_buckets(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram(
+            "latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)
+        )
+
+        hist.observe(0.05, "/a")
+        hist.observe(0.5, "/a")
+        hist.observe(2.0, "/a")
+
+        body = registry.render()
+        assert '# TYPE latency_seconds histogram' in body
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in body
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in body
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in body
+        assert 'latency_seconds_count{route="/a"} 3' in body
+        assert 'latency_seconds_sum{route="/a"} 2.55' in body
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("queries_total", "Queries.", ("sql",))
+        counter.inc(1, 'WHERE a = "b"\n')
+
+        assert 'queries_total{sql="WHERE a = \\"b\\"\\n"} 1' in registry.render()
+
+    def test_series_beyond_cap_fold_into_other(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("c_total", "C.", ("key",), max_series=2)
+
+        for key in ("a", "b", "c", "d"):
+            counter.inc(1, key)
+
+        assert counter.value("a") == 1
+        assert counter.value(OVERFLOW_LABEL) == 2
+
+    def test_gauge_reads_callback_at_render(self):
+        registry = MetricsRegistry()
+        values = iter([3, 7])
+        registry.gauge("in_use", "In use.").set_function(lambda: next(values))
+
+        assert "in_use 3" in registry.render()
+        assert "in_use 7" in registry.render()
+
+    def test_metric_without_render_cannot_be_created(self):
+        class Untyped(_Metric):
+            pass
+
+        with pytest.raises(TypeError):
+            Untyped("untyped", "No samples.")
+
+
+class TestFingerprint:
+    def test_bind_parameters_and_literals_collapse(self):
+        statement = (
+            "SELECT id FROM expenses\n  WHERE user_id = %(user_id_1)s "
+            "AND date >= '2024-01-01' LIMIT 51"
+        )
+
+        assert fingerprint(statement) == (
+            "SELECT id FROM expenses WHERE user_id = ? AND date >= ? LIMIT ?"
+        )
+
+    def test_in_lists_and_multirow_values_collapse(self):
+        assert fingerprint("SELECT 1 FROM t WHERE id IN ($1, $2, $3)") == (
+            "SELECT ? FROM t WHERE id IN (...)"
+        )
+        assert fingerprint("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)") == (
+            "INSERT INTO t (a, b) VALUES (...)"
+        )
+
+    def test_casts_are_not_parameters(self):
+        assert fingerprint("SELECT amount::text FROM t") == "SELECT amount::text FROM t"
+
+
+class TestEngineInstrumentation:
+    @pytest.fixture
+    def engine(self):
+        engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool)
+        instrument_engine(engine, "test")
+        yield engine
+        engine.dispose()
+
+    def test_statement_latency_and_checkout_are_recorded(self, engine):
+        checkouts = POOL_CHECKOUT_SECONDS.count("sync")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert STATEMENT_SECONDS.count("test", "SELECT ?") >= 1
+        assert POOL_CHECKOUT_SECONDS.count("sync") == checkouts + 1
+
+    def test_slow_statements_are_logged(self, engine, caplog):
+        slow_before = SLOW_STATEMENTS.value("test")
+
+        with patch("app.db_metrics.settings.SLOW_QUERY_THRESHOLD_MS", 0.000001), \
+                caplog.at_level(logging.WARNING, logger="app.db_metrics"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 2"))
+
+        assert SLOW_STATEMENTS.value("test") == slow_before + 1
+        assert "Slow query" in caplog.text
+        assert "SELECT ?" in caplog.text
+
+
+class TestMetricsEndpoint:
+    def test_hidden_without_token(self, unauth_client):
+        with patch("app.main.settings.METRICS_TOKEN", ""):
+            resp = unauth_client["client"].get("/metrics")
+
+        assert resp.status_code == 404
+
+    def test_wrong_token_is_rejected(self, unauth_client):
+        with patch("app.main.settings.METRICS_TOKEN", "scrape-secret"):
+            resp = unauth_client["client"].get(
+                "/metrics", headers={"Authorization": "Bearer nope"}
+            )
+
+        assert resp.status_code == 401
+
+    def test_serves_prometheus_text(self, unauth_client):
+        with patch("app.main.settings.METRICS_TOKEN", "scrape-secret"):
+            resp = unauth_client["client"].get(
+                "/metrics", headers={"Authorization": "Bearer scrape-secret"}
+            )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE db_pool_connections gauge" in resp.text
@@ -0,0 +1,242 @@
+"""
+Password hashing pool tests.
+
+Covers:
+  A. Work runs off the event loop thread and returns its result
+  B. Back-pressure — calls beyond workers + queue depth fail fast
+  C. The executor is recreated after shutdown (lifespan restarts)
+  D. Login/register map saturation to 503 SYS-004 with Retry-After
+  E. A cancelled caller keeps its slot until the thread finishes
+  F. AuthService sends only bcrypt to the pool
+  G. Async logins wait on bcrypt without holding threadpool threads
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import anyio.to_thread
+import pytest
+from starlette.concurrency import run_in_threadpool
+
+from app.schemas.error_schemas import ErrorCodes
+from app.services.auth_service import AuthService
+from app.utils.security import PasswordHashingPool, PasswordPoolSaturated
+from tests.conftest import assert_error_shape
+
+
+@pytest.mark.asyncio
+async def test_run_executes_on_worker_thread():
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+    try:
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+    finally:
+        pool.shutdown()
+
+    assert thread_name.startswith("password-hash")
+    assert pool.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_rejects_immediately():
+    pool = PasswordHashingPool(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        busy = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordPoolSaturated):
+            await pool.run(lambda: None)
+
+        release.set()
+        await asyncio.gather(*busy)
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert pool.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_exceptions_propagate_and_release_slot():
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+
+    def _boom():
+        raise ValueError("AUTH-004:Invalid email or password")
+
+    try:
+        with pytest.raises(ValueError):
+            await pool.run(_boom)
+        assert await pool.run(lambda: "ok") == "ok"
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_usable_after_shutdown():
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+    assert await pool.run(lambda: 1) == 1
+    pool.shutdown()
+    assert await pool.run(lambda: 2) == 2
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_slot_until_thread_finishes():
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+    started, release = threading.Event(), threading.Event()
+
+    def _hash():
+        started.set()
+        release.wait()
+
+    try:
+        task = asyncio.create_task(pool.run(_hash))
+        await asyncio.to_thread(started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert pool.in_flight == 1
+        with pytest.raises(PasswordPoolSaturated):
+            pool.submit(lambda: None)
+
+        release.set()
+        await asyncio.to_thread(lambda: pool.call(lambda: None))
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert pool.in_flight == 0
+
+
+def test_call_blocks_for_result_from_a_worker_thread():
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+    try:
+        assert pool.call(lambda x: x * 2, 21) == 42
+    finally:
+        pool.shutdown()
+
+    assert pool.in_flight == 0
+
+
+class TestAuthServiceUsesPool:
+    def _service(self, pool):
+        user_repo, lockout_repo = Mock(), Mock()
+        user_repo.get_by_email.return_value = None
+        user_repo.create.side_effect = lambda user: user
+        return AuthService(user_repo, lockout_repo, password_pool=pool)
+
+    def test_only_the_hash_runs_on_the_pool(self):
+        pool = PasswordHashingPool(max_workers=1, max_queue=0)
+        threads = {}
+
+        def _hash(password):
+            threads["hash"] = threading.current_thread().name
+            return "hashed"
+
+        def _lookup(email):
+            threads["query"] = threading.current_thread().name
+            return None
+
+        service = self._service(pool)
+        service.user_repository.get_by_email.side_effect = _lookup
+        try:
+            with patch("app.services.auth_service.hash_password", _hash):
+                user = service.register_user("a@example.com", "password123", "A")
+        finally:
+            pool.shutdown()
+
+        assert user.hashed_password == "hashed"
+        assert threads["hash"].startswith("password-hash")
+        assert threads["query"] == threading.current_thread().name
+
+    def test_saturated_pool_raises_after_the_lookup(self):
+        service = self._service(PasswordHashingPool(max_workers=0, max_queue=0))
+
+        with pytest.raises(PasswordPoolSaturated):
+            service.register_user("a@example.com", "password123", "A")
+
+        service.user_repository.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_login_flood_leaves_the_threadpool_free():
+    pool = PasswordHashingPool(max_workers=2, max_queue=8)
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    total_tokens, limiter.total_tokens = limiter.total_tokens, 1
+    release = threading.Event()
+    lockout_repo = Mock()
+    lockout_repo.get_login_state.return_value = SimpleNamespace(
+        is_locked=lambda: False,
+        user=SimpleNamespace(id=1, email="a@example.com", hashed_password="h"),
+        has_attempts=False,
+    )
+    service = AuthService(Mock(), lockout_repo, password_pool=pool)
+
+    def _verify(password, hashed):
+        release.wait()
+        return True
+
+    try:
+        with patch("app.services.auth_service.verify_password", _verify), patch(
+            "app.services.auth_service.create_access_token", return_value="tok"
+        ):
+            logins = [
+                asyncio.create_task(
+                    service.login_user_async("a@example.com", "password123")
+                )
+                for _ in range(10)
+            ]
+            while pool.in_flight < 10:
+                await asyncio.sleep(0.001)
+
+            # Every login is waiting on bcrypt, none on a threadpool thread,
+            # so a sync endpoint still gets the only one.
+            assert limiter.borrowed_tokens == 0
+            assert await run_in_threadpool(lambda: "health") == "health"
+
+            release.set()
+            assert await asyncio.gather(*logins) == ["tok"] * 10
+    finally:
+        release.set()
+        limiter.total_tokens = total_tokens
+        pool.shutdown()
+
+
+class TestSaturationResponses:
+    """Saturated pool surfaces as a fast 503 on the auth endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def saturated(self, unauth_client):
+        busy = PasswordPoolSaturated("Password hashing pool is saturated")
+        unauth_client["auth_service"].login_user_async.side_effect = busy
+        unauth_client["auth_service"].register_user_async.side_effect = busy
+
+    def test_login_returns_503(self, unauth_client):
+        client = unauth_client["client"]
+
+        resp = client.post(
+            "/api/v1/auth/login",
+            json={"email": "busy@example.com", "password": "password123"},
+        )
+
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"] == "1"
+        assert_error_shape(resp.json(), 503, ErrorCodes.SYS_BUSY)
+
+    def test_register_returns_503(self, unauth_client):
+        client = unauth_client["client"]
+
+        resp = client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "busy@example.com",
+                "password": "password123",
+                "full_name": "Busy",
+            },
+        )
+
+        assert resp.status_code == 503
+        assert_error_shape(resp.json(), 503, ErrorCodes.SYS_BUSY)
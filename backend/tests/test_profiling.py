@@ -0,0 +1,154 @@
+"""Unit tests for sampled request profiling and the admin profile endpoints."""
+
+import marshal
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.dependencies import settings as dependency_settings
+from app.profiling import (
+    ProfileStore,
+    ProfilingMiddleware,
+    StackSampler,
+    profile_store,
+)
+from app.schemas.error_schemas import ErrorCodes
+from tests.conftest import assert_error_shape
+
+
+def _busy_work():
+    return sum(i * i for i in range(20000))
+
+
+def _profiled_app(store, **options):
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, store=store, **options)
+
+    @app.get("/work/{item_id}")
+    def work(item_id: int):
+        return {"total": _busy_work()}
+
+    @app.get("/slow")
+    async def slow():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            _busy_work()
+        return {"ok": True}
+
+    return app
+
+
+class TestProfilingMiddleware:
+    def test_every_request_sampled_at_rate_one(self):
+        store = ProfileStore()
+        with TestClient(_profiled_app(store, sample_rate=1.0)) as client:
+            client.get("/work/1")
+            client.get("/work/2")
+
+        assert store.summary() == {"/work/{item_id}": 2}
+
+    def test_rate_zero_never_samples(self):
+        store = ProfileStore()
+        with TestClient(_profiled_app(store, sample_rate=0.0)) as client:
+            client.get("/work/1")
+
+        assert store.summary() == {}
+
+    def test_cprofile_mode_yields_pstats_and_edges(self):
+        store = ProfileStore()
+        with TestClient(_profiled_app(store, sample_rate=1.0)) as client:
+            client.get("/slow")
+
+        report = store.pstats_text("/slow", sort="tottime", limit=20)
+        assert "function calls" in report
+        assert "_busy_work" in report
+        assert isinstance(marshal.loads(store.pstats_dump("/slow")), dict)
+        assert "_busy_work" in store.collapsed("/slow")
+
+    def test_sampler_mode_collects_full_stacks(self):
+        store = ProfileStore()
+        app = _profiled_app(
+            store, sample_rate=1.0, mode="sampler", sampler_interval=0.001
+        )
+        with TestClient(app) as client:
+            client.get("/slow")
+
+        # The sampler thread stores its stacks as it exits.
+        deadline = time.monotonic() + 2
+        while store.get("/slow") is None and time.monotonic() < deadline:
+            time.sleep(0.001)
+        collapsed = store.collapsed("/slow")
+        assert "tests.test_profiling:slow" in collapsed
+        assert store.pstats_text("/slow") is None
+
+    def test_sampler_hands_its_stacks_to_the_stop_callback(self):
+        sampler = StackSampler(threading.get_ident(), interval=0.001)
+        sampler.start()
+        received = threading.Event()
+
+        sampler.stop(lambda stacks: received.set())
+
+        assert received.wait(2)
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            ProfilingMiddleware(FastAPI(), sample_rate=1.0, mode="perf")
+
+
+class TestAdminProfileEndpoints:
+    @pytest.fixture(autouse=True)
+    def _profile(self):
+        profile_store.clear()
+        store_app = _profiled_app(profile_store, sample_rate=1.0)
+        with TestClient(store_app) as client:
+            client.get("/slow")
+        yield
+        profile_store.clear()
+
+    def test_non_admin_forbidden(self, auth_client, monkeypatch):
+        monkeypatch.setattr(dependency_settings, "ADMIN_EMAILS", [])
+
+        resp = auth_client["client"].get("/api/v1/admin/profiles")
+
+        assert resp.status_code == 403
+        assert_error_shape(resp.json(), 403, ErrorCodes.AUTH_UNAUTHORIZED)
+
+    def test_admin_reads_summary_and_reports(self, auth_client, monkeypatch):
+        monkeypatch.setattr(dependency_settings, "ADMIN_EMAILS", ["Test@Example.com"])
+        client = auth_client["client"]
+
+        assert client.get("/api/v1/admin/profiles").json() == {"routes": {"/slow": 1}}
+
+        text = client.get("/api/v1/admin/profiles/pstats", params={"route": "/slow"})
+        assert text.status_code == 200
+        assert "_busy_work" in text.text
+
+        dump = client.get(
+            "/api/v1/admin/profiles/pstats", params={"route": "/slow", "binary": True}
+        )
+        assert isinstance(marshal.loads(dump.content), dict)
+
+        stacks = client.get(
+            "/api/v1/admin/profiles/collapsed", params={"route": "/slow"}
+        )
+        assert "_busy_work" in stacks.text
+
+    def test_unknown_route_is_404(self, auth_client, monkeypatch):
+        monkeypatch.setattr(dependency_settings, "ADMIN_EMAILS", ["test@example.com"])
+
+        resp = auth_client["client"].get(
+            "/api/v1/admin/profiles/pstats", params={"route": "/nope"}
+        )
+
+        assert resp.status_code == 404
+
+    def test_clear(self, auth_client, monkeypatch):
+        monkeypatch.setattr(dependency_settings, "ADMIN_EMAILS", ["test@example.com"])
+
+        resp = auth_client["client"].delete("/api/v1/admin/profiles")
+
+        assert resp.status_code == 204
+        assert profile_store.summary() == {}
@@ -0,0 +1,81 @@
+"""
+Unit tests for the pluggable rate-limit storage (RATE_LIMIT_STORAGE_URL).
+
+The fake:// backend stands in for a shared Redis: several storages created
+from the same URL behave like separate workers talking to one server.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+
+from app.rate_limit_storage import FakeSharedStorage, PostgresStorage
+
+
+class TestFakeSharedStorage:
+    def setup_method(self):
+        FakeSharedStorage("fake://unit").reset()
+
+    def test_scheme_is_registered(self):
+        assert isinstance(storage_from_string("fake://unit"), FakeSharedStorage)
+        assert isinstance(storage_from_string("postgresql://"), PostgresStorage)
+
+    def test_workers_share_one_limit(self):
+        """Two 'workers' together get LOGIN_RATE_LIMIT, not twice it."""
+        login_limit = parse("5/minute")
+        worker_a = FixedWindowRateLimiter(storage_from_string("fake://unit"))
+        worker_b = FixedWindowRateLimiter(storage_from_string("fake://unit"))
+
+        allowed = [
+            (worker_a if i % 2 else worker_b).hit(login_limit, "login", "10.0.0.1")
+            for i in range(8)
+        ]
+
+        assert allowed == [True] * 5 + [False] * 3
+
+    def test_servers_are_isolated_by_name(self):
+        one = FakeSharedStorage("fake://unit")
+        other = FakeSharedStorage("fake://unit-other")
+
+        one.incr("k", expiry=60)
+
+        assert one.get("k") == 1
+        assert other.get("k") == 0
+
+    def test_window_expiry_restarts_count(self):
+        storage = FakeSharedStorage("fake://unit")
+        now = time.time()
+
+        with patch("app.rate_limit_storage.time.time", return_value=now):
+            assert storage.incr("k", expiry=60) == 1
+            assert storage.incr("k", expiry=60) == 2
+        with patch("app.rate_limit_storage.time.time", return_value=now + 61):
+            assert storage.get("k") == 0
+            assert storage.incr("k", expiry=60) == 1
+
+    def test_increments_are_atomic(self):
+        storage = FakeSharedStorage("fake://unit")
+
+        def _hammer():
+            for _ in range(200):
+                storage.incr("k", expiry=60)
+
+        threads = [threading.Thread(target=_hammer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert storage.get("k") == 1600
+
+    def test_clear_and_expiry(self):
+        storage = FakeSharedStorage("fake://unit")
+        storage.incr("k", expiry=30)
+
+        assert storage.get_expiry("k") > time.time()
+        storage.clear("k")
+        assert storage.get("k") == 0
@@ -0,0 +1,198 @@
+"""
+Report cache unit tests.
+
+Covers the in-process LRU backend (bounds, TTL, counters), the Redis
+backend against an in-memory fake client, and ReportCache round-tripping
+of summary dicts including Decimal values and budget spend entries.
+"""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.cache import (
+    InMemoryLRUCache,
+    RedisCache,
+    ReportCache,
+    build_cache_backend,
+)
+from app.repositories.budget_repository import BudgetSpend
+
+
+class FakeRedis:
+    """Tiny stand-in exposing the subset of the redis-py API we use."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode()
+
+    def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [k for k in list(self.data) if k.startswith(prefix)]
+
+
+def _summary():
+    return {
+        "month": "2024-03",
+        "total_income": Decimal("3500.00"),
+        "total_expenses": Decimal("450.10"),
+        "net_balance": Decimal("3049.90"),
+        "expenses_by_category": {"Food": Decimal("450.10")},
+    }
+
+
+class TestInMemoryLRUCache:
+    def test_hit_and_miss_counters(self):
+        cache = InMemoryLRUCache(max_entries=4)
+        cache.set("a", "1", ttl_seconds=60)
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.sets == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = InMemoryLRUCache(max_entries=2)
+        cache.set("a", "1", 60)
+        cache.set("b", "2", 60)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", "3", 60)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.stats.evictions == 1
+
+    def test_expired_entry_is_a_miss(self):
+        cache = InMemoryLRUCache()
+        with patch("app.cache.time.monotonic", return_value=100.0):
+            cache.set("a", "1", ttl_seconds=5)
+        with patch("app.cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") is None
+
+        assert cache.stats.evictions == 1
+        assert len(cache) == 0
+
+    def test_delete_counts_invalidation_only_when_present(self):
+        cache = InMemoryLRUCache()
+        cache.set("a", "1", 60)
+        cache.delete("a")
+        cache.delete("a")
+
+        assert cache.stats.invalidations == 1
+
+
+class TestRedisCache:
+    def test_roundtrip_is_prefixed(self):
+        client = FakeRedis()
+        cache = RedisCache(client, prefix="t:")
+        cache.set("k", "v", 30)
+
+        assert "t:k" in client.data
+        assert cache.get("k") == "v"
+        assert cache.get("missing") is None
+        assert cache.stats.as_dict()["hits"] == 1
+
+    def test_clear_only_removes_own_keys(self):
+        client = FakeRedis()
+        client.data["other"] = b"keep"
+        cache = RedisCache(client, prefix="t:")
+        cache.set("k", "v", 30)
+
+        cache.clear()
+
+        assert client.data == {"other": b"keep"}
+
+
+class TestBuildCacheBackend:
+    def test_memory_url(self):
+        backend = build_cache_backend("memory://", max_entries=7)
+        assert isinstance(backend, InMemoryLRUCache)
+        assert backend.max_entries == 7
+
+    def test_unknown_scheme_rejected(self):
+        with pytest.raises(ValueError):
+            build_cache_backend("memcached://localhost", max_entries=1)
+
+
+class TestReportCache:
+    def setup_method(self):
+        self.cache = ReportCache(InMemoryLRUCache(), ttl_seconds=60)
+        self.user_id = uuid4()
+
+    def test_summary_roundtrip_preserves_decimals(self):
+        self.cache.set_summary(self.user_id, "2024-03", _summary())
+
+        cached = self.cache.get_summary(self.user_id, "2024-03")
+
+        assert cached == _summary()
+        assert isinstance(cached["net_balance"], Decimal)
+
+    def test_keys_are_scoped_per_user_and_month(self):
+        self.cache.set_summary(self.user_id, "2024-03", _summary())
+
+        assert self.cache.get_summary(uuid4(), "2024-03") is None
+        assert self.cache.get_summary(self.user_id, "2024-04") is None
+
+    def test_invalidate_date_drops_containing_month(self):
+        self.cache.set_summary(self.user_id, "2024-03", _summary())
+
+        self.cache.invalidate_date(self.user_id, date(2024, 3, 31))
+
+        assert self.cache.get_summary(self.user_id, "2024-03") is None
+        assert self.cache.stats()["invalidations"] == 1
+
+    def test_budget_spend_roundtrip(self):
+        spend = BudgetSpend(uuid4(), Decimal("3100.00"), Decimal("1000.25"))
+        self.cache.set_budget_spend(self.user_id, "2024-03", spend)
+
+        assert self.cache.get_budget_spend(self.user_id, "2024-03") == spend
+        assert self.cache.get_summary(self.user_id, "2024-03") is None
+
+    def test_expense_invalidation_drops_budget_spend_too(self):
+        spend = BudgetSpend(uuid4(), Decimal("3100.00"), Decimal("1000.25"))
+        self.cache.set_summary(self.user_id, "2024-03", _summary())
+        self.cache.set_budget_spend(self.user_id, "2024-03", spend)
+
+        self.cache.invalidate_date(self.user_id, date(2024, 3, 5))
+
+        assert self.cache.get_budget_spend(self.user_id, "2024-03") is None
+        assert self.cache.get_summary(self.user_id, "2024-03") is None
+
+    def test_invalidate_budget_keeps_summary(self):
+        spend = BudgetSpend(uuid4(), Decimal("3100.00"), Decimal("0"))
+        self.cache.set_summary(self.user_id, "2024-03", _summary())
+        self.cache.set_budget_spend(self.user_id, "2024-03", spend)
+
+        self.cache.invalidate_budget(self.user_id, "2024-03")
+
+        assert self.cache.get_budget_spend(self.user_id, "2024-03") is None
+        assert self.cache.get_summary(self.user_id, "2024-03") == _summary()
+
+    def test_entry_from_older_data_version_is_a_miss(self):
+        self.cache.set_summary(self.user_id, "2024-03", _summary(), data_version=1)
+
+        assert self.cache.get_summary(self.user_id, "2024-03", data_version=2) is None
+        assert self.cache.get_summary(self.user_id, "2024-03", data_version=1) == (
+            _summary()
+        )
+        assert self.cache.stats()["stale"] == 1
+
+    def test_budget_spend_from_older_data_version_is_a_miss(self):
+        spend = BudgetSpend(uuid4(), Decimal("3100.00"), Decimal("1000.25"))
+        self.cache.set_budget_spend(self.user_id, "2024-03", spend, data_version=4)
+
+        assert self.cache.get_budget_spend(self.user_id, "2024-03", 5) is None
+        assert self.cache.get_budget_spend(self.user_id, "2024-03", 4) == spend
@@ -1,11 +1,19 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from uuid import uuid4
 from decimal import Decimal
 from datetime import datetime, date, timezone
-from app.services.report_service import ReportService
+from app import dependencies
+from app.services.report_service import (
+    AggregatedReportGenerator,
+    ReportService,
+    RollupReportGenerator,
+)
 from app.models.income import Income
 from app.models.expense import Expense
+from app.models.monthly_rollup import MonthlyRollup
+from app.repositories.report_repository import SummaryAggregates
+from app.cache import InMemoryLRUCache, ReportCache
 from app.schemas.error_schemas import ErrorCodes
 
 
@@ -200,3 +208,340 @@ class TestReportService:
         assert summary["expenses_by_category"]["Food"] == Decimal("325.00")
         assert summary["expenses_by_category"]["Transport"] == Decimal("50.00")
         assert len(summary["expenses_by_category"]) == 2
+
+
+class TestReportServiceAggregated:
+    """Unit tests for the SQL-aggregate report path."""
+
+    def setup_method(self):
+        self.mock_income_repo = Mock()
+        self.mock_expense_repo = Mock()
+        self.mock_report_repo = Mock()
+        self.service = ReportService(
+            self.mock_income_repo, self.mock_expense_repo, self.mock_report_repo
+        )
+        self.user_id = uuid4()
+
+    def test_summary_uses_aggregates_not_rows(self):
+        self.mock_report_repo.get_summary_aggregates.return_value = SummaryAggregates(
+            total_income=Decimal("3500.00"),
+            expenses_by_category={
+                "Groceries": Decimal("350.00"),
+                "Utilities": Decimal("100.00"),
+            },
+        )
+
+        summary = self.service.get_monthly_summary(self.user_id, "2024-03")
+
+        assert summary["month"] == "2024-03"
+        assert summary["total_income"] == Decimal("3500.00")
+        assert summary["total_expenses"] == Decimal("450.00")
+        assert summary["net_balance"] == Decimal("3050.00")
+        assert summary["expenses_by_category"] == {
+            "Groceries": Decimal("350.00"),
+            "Utilities": Decimal("100.00"),
+        }
+        self.mock_income_repo.get_by_user_and_date_range.assert_not_called()
+        self.mock_expense_repo.get_by_user_and_date_range.assert_not_called()
+
+    def test_summary_passes_month_bounds(self):
+        self.mock_report_repo.get_summary_aggregates.return_value = SummaryAggregates()
+
+        self.service.get_monthly_summary(self.user_id, "2024-12")
+
+        args, _ = self.mock_report_repo.get_summary_aggregates.call_args
+        assert args == (
+            self.user_id,
+            datetime(2024, 12, 1, tzinfo=timezone.utc),
+            datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+
+    def test_summary_with_no_data(self):
+        self.mock_report_repo.get_summary_aggregates.return_value = SummaryAggregates()
+
+        summary = self.service.get_monthly_summary(self.user_id, "2024-03")
+
+        assert summary["total_income"] == Decimal("0")
+        assert summary["total_expenses"] == Decimal("0")
+        assert summary["net_balance"] == Decimal("0")
+        assert summary["expenses_by_category"] == {}
+
+    def test_invalid_month_rejected_before_query(self):
+        with pytest.raises(ValueError) as exc_info:
+            self.service.get_monthly_summary(self.user_id, "2024-13")
+
+        assert ErrorCodes.RPT_INVALID_MONTH in str(exc_info.value)
+        self.mock_report_repo.get_summary_aggregates.assert_not_called()
+
+
+class TestReportServiceRollups:
+    """Unit tests for the monthly_rollups report path."""
+
+    def setup_method(self):
+        self.mock_report_repo = Mock()
+        self.mock_rollup_repo = Mock()
+        self.service = ReportService(
+            Mock(), Mock(), self.mock_report_repo, self.mock_rollup_repo
+        )
+        self.user_id = uuid4()
+
+    def test_summary_reads_single_rollup_row(self):
+        self.mock_rollup_repo.get.return_value = MonthlyRollup(
+            user_id=self.user_id,
+            month="2024-03",
+            total_income=Decimal("3500.00"),
+            total_expenses=Decimal("450.00"),
+            expenses_by_category={"Groceries": "350.00", "Utilities": "100.00"},
+        )
+
+        summary = self.service.get_monthly_summary(self.user_id, "2024-03")
+
+        self.mock_rollup_repo.get.assert_called_once_with(self.user_id, "2024-03")
+        self.mock_report_repo.get_summary_aggregates.assert_not_called()
+        assert summary["total_income"] == Decimal("3500.00")
+        assert summary["total_expenses"] == Decimal("450.00")
+        assert summary["net_balance"] == Decimal("3050.00")
+        assert summary["expenses_by_category"] == {
+            "Groceries": Decimal("350.00"),
+            "Utilities": Decimal("100.00"),
+        }
+
+    def test_missing_rollup_row_means_empty_month(self):
+        self.mock_rollup_repo.get.return_value = None
+
+        summary = self.service.get_monthly_summary(self.user_id, "2024-03")
+
+        assert summary["total_income"] == Decimal("0")
+        assert summary["total_expenses"] == Decimal("0")
+        assert summary["expenses_by_category"] == {}
+
+
+class TestReportServiceCache:
+    """ReportService consults the report cache before generating."""
+
+    def setup_method(self):
+        self.mock_report_repo = Mock()
+        self.cache = ReportCache(InMemoryLRUCache(), ttl_seconds=60)
+        self.service = ReportService(
+            Mock(), Mock(), self.mock_report_repo, report_cache=self.cache
+        )
+        self.user_id = uuid4()
+        self.mock_report_repo.get_summary_aggregates.return_value = SummaryAggregates(
+            total_income=Decimal("100.00"),
+            expenses_by_category={"Food": Decimal("40.00")},
+        )
+
+    def test_second_call_is_served_from_cache(self):
+        first = self.service.get_monthly_summary(self.user_id, "2024-03")
+        second = self.service.get_monthly_summary(self.user_id, "2024-03")
+
+        assert first == second
+        assert self.mock_report_repo.get_summary_aggregates.call_count == 1
+        assert self.cache.stats()["hits"] == 1
+
+    def test_invalidation_forces_regeneration(self):
+        self.service.get_monthly_summary(self.user_id, "2024-03")
+        self.cache.invalidate(self.user_id, "2024-03")
+        self.service.get_monthly_summary(self.user_id, "2024-03")
+
+        assert self.mock_report_repo.get_summary_aggregates.call_count == 2
+
+    def test_fill_racing_a_write_is_not_served_after_it(self):
+        versions = Mock()
+        versions.get.return_value = 1
+        service = ReportService(
+            Mock(),
+            Mock(),
+            self.mock_report_repo,
+            report_cache=self.cache,
+            data_version_repository=versions,
+        )
+
+        def write_commits_mid_fill(*args):
+            # The write bumps the version and invalidates before this read
+            # stores its (now stale) result.
+            versions.get.return_value = 2
+            self.cache.invalidate(self.user_id, "2024-03")
+            return SummaryAggregates(
+                total_income=Decimal("100.00"),
+                expenses_by_category={"Food": Decimal("40.00")},
+            )
+
+        self.mock_report_repo.get_summary_aggregates.side_effect = (
+            write_commits_mid_fill
+        )
+        service.get_monthly_summary(self.user_id, "2024-03")
+
+        self.mock_report_repo.get_summary_aggregates.side_effect = None
+        self.mock_report_repo.get_summary_aggregates.return_value = SummaryAggregates(
+            total_income=Decimal("100.00"),
+            expenses_by_category={"Food": Decimal("55.00")},
+        )
+        fresh = service.get_monthly_summary(self.user_id, "2024-03")
+
+        assert fresh["total_expenses"] == Decimal("55.00")
+        assert self.mock_report_repo.get_summary_aggregates.call_count == 2
+        assert self.cache.stats()["stale"] == 1
+
+
+class TestReportServiceRange:
+    """ReportService.get_range_summary over a span of months."""
+
+    def setup_method(self):
+        self.mock_income_repo = Mock()
+        self.mock_expense_repo = Mock()
+        self.mock_report_repo = Mock()
+        self.service = ReportService(
+            self.mock_income_repo,
+            self.mock_expense_repo,
+            self.mock_report_repo,
+            max_range_months=12,
+        )
+        self.user_id = uuid4()
+
+    def test_range_uses_one_grouped_query(self):
+        self.mock_report_repo.get_range_aggregates.return_value = {
+            "2024-01": SummaryAggregates(
+                total_income=Decimal("1000.00"),
+                expenses_by_category={"Food": Decimal("200.00")},
+            ),
+            "2024-03": SummaryAggregates(
+                expenses_by_category={
+                    "Food": Decimal("50.00"),
+                    "Rent": Decimal("700.00"),
+                },
+            ),
+        }
+
+        summary = self.service.get_range_summary(self.user_id, "2024-01", "2024-03")
+
+        self.mock_report_repo.get_range_aggregates.assert_called_once_with(
+            self.user_id,
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 4, 1, tzinfo=timezone.utc),
+        )
+        self.mock_report_repo.get_summary_aggregates.assert_not_called()
+        assert [m["month"] for m in summary["months"]] == [
+            "2024-01",
+            "2024-02",
+            "2024-03",
+        ]
+        assert summary["months"][1]["total_income"] == Decimal("0")
+        assert summary["months"][1]["expenses_by_category"] == {}
+        assert summary["months"][2]["net_balance"] == Decimal("-750.00")
+        assert summary["total_income"] == Decimal("1000.00")
+        assert summary["total_expenses"] == Decimal("950.00")
+        assert summary["net_balance"] == Decimal("50.00")
+        assert summary["expenses_by_category"] == {
+            "Food": Decimal("250.00"),
+            "Rent": Decimal("700.00"),
+        }
+
+    def test_range_crosses_year_boundary(self):
+        self.mock_report_repo.get_range_aggregates.return_value = {}
+
+        summary = self.service.get_range_summary(self.user_id, "2024-11", "2025-02")
+
+        assert [m["month"] for m in summary["months"]] == [
+            "2024-11",
+            "2024-12",
+            "2025-01",
+            "2025-02",
+        ]
+
+    def test_single_month_range(self):
+        self.mock_report_repo.get_range_aggregates.return_value = {}
+
+        summary = self.service.get_range_summary(self.user_id, "2024-05", "2024-05")
+
+        assert len(summary["months"]) == 1
+        assert summary["start_month"] == summary["end_month"] == "2024-05"
+
+    def test_rollup_path_reads_rollup_range(self):
+        rollup_repo = Mock()
+        rollup_repo.get_range.return_value = [
+            MonthlyRollup(
+                user_id=self.user_id,
+                month="2024-02",
+                total_income=Decimal("500.00"),
+                total_expenses=Decimal("120.00"),
+                expenses_by_category={"Food": "120.00"},
+            )
+        ]
+        service = ReportService(Mock(), Mock(), self.mock_report_repo, rollup_repo)
+
+        summary = service.get_range_summary(self.user_id, "2024-01", "2024-02")
+
+        rollup_repo.get_range.assert_called_once_with(
+            self.user_id, "2024-01", "2024-02"
+        )
+        rollup_repo.get.assert_not_called()
+        self.mock_report_repo.get_range_aggregates.assert_not_called()
+        assert summary["months"][0]["total_income"] == Decimal("0")
+        assert summary["months"][1]["expenses_by_category"] == {
+            "Food": Decimal("120.00")
+        }
+        assert summary["net_balance"] == Decimal("380.00")
+
+    def test_invalid_month_rejected(self):
+        with pytest.raises(ValueError) as exc_info:
+            self.service.get_range_summary(self.user_id, "2024-01", "2024-13")
+
+        assert ErrorCodes.RPT_INVALID_MONTH in str(exc_info.value)
+        self.mock_report_repo.get_range_aggregates.assert_not_called()
+
+    def test_reversed_range_rejected(self):
+        with pytest.raises(ValueError) as exc_info:
+            self.service.get_range_summary(self.user_id, "2024-03", "2024-01")
+
+        assert ErrorCodes.VAL_INVALID_RANGE in str(exc_info.value)
+
+    def test_span_longer_than_limit_rejected(self):
+        with pytest.raises(ValueError) as exc_info:
+            self.service.get_range_summary(self.user_id, "2024-01", "2025-01")
+
+        assert ErrorCodes.VAL_INVALID_RANGE in str(exc_info.value)
+        self.mock_report_repo.get_range_aggregates.assert_not_called()
+
+    def test_huge_span_rejected_before_listing_months(self):
+        with patch("app.services.report_service.months_between") as listing:
+            with pytest.raises(ValueError) as exc_info:
+                self.service.get_range_summary(self.user_id, "1900-01", "2100-12")
+
+        assert ErrorCodes.VAL_INVALID_RANGE in str(exc_info.value)
+        listing.assert_not_called()
+
+
+class TestWiredReportService:
+    """The service get_report_service builds never sums rows in Python."""
+
+    @pytest.mark.parametrize(
+        "rollups, generator",
+        [(True, RollupReportGenerator), (False, AggregatedReportGenerator)],
+    )
+    def test_wired_generator(self, monkeypatch, rollups, generator):
+        monkeypatch.setattr(dependencies.settings, "REPORT_ROLLUPS_ENABLED", rollups)
+
+        service = dependencies.get_report_service(db=Mock(), async_db=None, cache=None)
+
+        assert type(service._generator()) is generator
+
+    def test_wired_summary_does_not_load_rows(self, monkeypatch):
+        monkeypatch.setattr(dependencies.settings, "REPORT_ROLLUPS_ENABLED", False)
+        service = dependencies.get_report_service(db=Mock(), async_db=None, cache=None)
+        aggregates = SummaryAggregates(
+            total_income=Decimal("100.00"),
+            expenses_by_category={"Food": Decimal("40.00")},
+        )
+
+        with patch.object(
+            service.report_repository,
+            "get_summary_aggregates",
+            return_value=aggregates,
+        ), patch.object(
+            service.expense_repository, "get_by_user_and_date_range"
+        ) as rows:
+            summary = service.get_monthly_summary(uuid4(), "2024-03")
+
+        assert summary["net_balance"] == Decimal("60.00")
+        rows.assert_not_called()
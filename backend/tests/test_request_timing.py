@@ -0,0 +1,130 @@
+"""Unit tests for RequestTimingMiddleware, phase accounting and Server-Timing."""
+
+import re
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.metrics import RequestTimings, current_timings, record_phase, timed_phase
+from app.middleware.timing import (
+    REQUEST_PHASE_SECONDS,
+    REQUEST_SECONDS,
+    RequestTimingMiddleware,
+    TimedJSONResponse,
+    server_timing_header,
+)
+from app.utils.security import (
+    PasswordHashingPool,
+    create_access_token,
+    decode_access_token,
+    hash_password,
+)
+
+
+@pytest.fixture
+def timed_app():
+    app = FastAPI(default_response_class=TimedJSONResponse)
+    app.add_middleware(RequestTimingMiddleware, server_timing=True)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        record_phase("db", 0.004)
+        return {"id": item_id}
+
+    return app
+
+
+def test_latency_recorded_per_route_template(timed_app):
+    before = REQUEST_SECONDS.count("GET", "/items/{item_id}", "200")
+
+    with TestClient(timed_app) as client:
+        client.get("/items/1")
+        client.get("/items/2")
+
+    assert REQUEST_SECONDS.count("GET", "/items/{item_id}", "200") == before + 2
+
+
+def test_unmatched_paths_share_one_series(timed_app):
+    before = REQUEST_SECONDS.count("GET", "unmatched", "404")
+
+    with TestClient(timed_app) as client:
+        client.get("/does-not-exist")
+
+    assert REQUEST_SECONDS.count("GET", "unmatched", "404") == before + 1
+
+
+def test_server_timing_header_lists_phases(timed_app):
+    before = REQUEST_PHASE_SECONDS.count("/items/{item_id}", "serialize")
+
+    with TestClient(timed_app) as client:
+        resp = client.get("/items/7")
+
+    header = resp.headers["server-timing"]
+    assert "db;dur=4.0" in header
+    assert re.search(r"serialize;dur=\d+\.\d", header)
+    assert re.search(r"total;dur=\d+\.\d", header)
+    assert REQUEST_PHASE_SECONDS.count("/items/{item_id}", "serialize") == before + 1
+
+
+def test_server_timing_header_is_opt_in():
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware, server_timing=False)
+    app.get("/ping")(lambda: {"ok": True})
+
+    with TestClient(app) as client:
+        assert "server-timing" not in client.get("/ping").headers
+
+
+def test_phases_outside_a_request_are_ignored():
+    with timed_phase("db"):
+        pass
+
+    assert current_timings.get() is None
+
+
+def test_jwt_verification_counts_as_auth():
+    timings = RequestTimings()
+    token = current_timings.set(timings)
+    try:
+        decode_access_token(create_access_token(uuid4(), "timing@example.com"))
+    finally:
+        current_timings.reset(token)
+
+    assert timings.phases["auth"] > 0
+
+
+def test_server_timing_remainder_is_app_time():
+    timings = RequestTimings()
+    timings.add("db", 0.010)
+
+    assert server_timing_header(timings, 0.025) == (
+        "db;dur=10.0, app;dur=15.0, total;dur=25.0"
+    )
+
+
+@pytest.mark.asyncio
+async def test_password_pool_times_only_bcrypt_as_auth():
+    """DB work around the hash on the pool is not counted as auth."""
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+    timings = RequestTimings()
+    token = current_timings.set(timings)
+
+    def register():
+        with timed_phase("db"):
+            time.sleep(0.2)
+        return hash_password("password123")
+
+    try:
+        with patch("app.utils.security.pwd_context") as context:
+            context.hash.side_effect = lambda password: time.sleep(0.02)
+            await pool.run(register)
+    finally:
+        current_timings.reset(token)
+        pool.shutdown()
+
+    assert timings.phases["db"] >= 0.2
+    assert 0.02 <= timings.phases["auth"] < 0.2
@@ -0,0 +1,135 @@
+"""
+Fast JSON response unit tests.
+
+ResponseSerializer + orjson must produce exactly the bytes pydantic's
+by-alias JSON dump produces for the same data (aliases, Decimal, UUID,
+date/datetime formats, nested pages), and the response class selection
+must refuse FAST_JSON_ENABLED without orjson.
+"""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+from uuid import uuid4
+
+import pytest
+from fastapi import Response
+from pydantic import TypeAdapter
+
+pytest.importorskip("orjson")
+
+from app import responses  # noqa: E402
+from app.middleware.timing import TimedJSONResponse  # noqa: E402
+from app.responses import (  # noqa: E402
+    FastJSONResponse,
+    ResponseSerializer,
+    dumps,
+    json_response_class,
+    trusted_response,
+)
+from app.schemas.expense_schemas import (  # noqa: E402
+    ExpensePageResponse,
+    ExpenseResponse,
+)
+from app.schemas.report_schemas import MonthlySummaryResponse  # noqa: E402
+
+
+def _expense(**overrides):
+    values = dict(
+        id=uuid4(),
+        user_id=uuid4(),
+        amount=Decimal("150.00"),
+        category="Café",
+        date=date(2024, 3, 10),
+        note=None,
+        created_at=datetime(2024, 3, 10, 12, 30, 5, 123456, tzinfo=timezone.utc),
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _pydantic_json(annotation, content) -> bytes:
+    adapter = TypeAdapter(annotation)
+    return adapter.dump_json(
+        adapter.validate_python(content, from_attributes=True), by_alias=True
+    )
+
+
+class TestResponseSerializer:
+    def test_expense_list_matches_pydantic_output(self):
+        rows = [
+            _expense(),
+            _expense(note="Weekly shop", amount=Decimal("0.10")),
+            _expense(created_at=None),
+            _expense(created_at=datetime(2024, 3, 1, 8, 0)),
+        ]
+
+        fast = dumps(ResponseSerializer(List[ExpenseResponse])(rows))
+
+        assert fast == _pydantic_json(List[ExpenseResponse], rows)
+        assert b'"expenseId"' in fast and b'"amount":"0.10"' in fast
+
+    def test_page_dict_with_nested_items(self):
+        page = {"items": [_expense(), _expense()], "next_cursor": "abc"}
+
+        content = ResponseSerializer(ExpensePageResponse)(page)
+
+        assert list(content) == ["items", "nextCursor"]
+        assert dumps(content) == _pydantic_json(ExpensePageResponse, page)
+        empty = {"items": [], "next_cursor": None}
+        assert dumps(ResponseSerializer(ExpensePageResponse)(empty)) == (
+            b'{"items":[],"nextCursor":null}'
+        )
+
+    def test_summary_aliases_and_decimal_mapping(self):
+        summary = {
+            "month": "2024-03",
+            "total_income": Decimal("3500.00"),
+            "total_expenses": Decimal("150.00"),
+            "net_balance": Decimal("3350.00"),
+            "expenses_by_category": {"Groceries": Decimal("150.00")},
+            "generated_at": datetime(2024, 3, 31, tzinfo=timezone.utc),
+        }
+
+        fast = dumps(ResponseSerializer(MonthlySummaryResponse)(summary))
+
+        assert fast == _pydantic_json(MonthlySummaryResponse, summary)
+
+    def test_uuid_subclass_is_encoded_as_string(self):
+        class DriverUUID(type(uuid4())):
+            pass
+
+        value = DriverUUID(str(uuid4()))
+
+        assert dumps({"id": value}) == f'{{"id":"{value}"}}'.encode()
+
+    def test_unknown_types_still_fail(self):
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+
+class TestFastResponses:
+    def test_trusted_response_keeps_endpoint_headers(self):
+        endpoint_response = Response()
+        endpoint_response.headers["ETag"] = 'W/"abc"'
+
+        resp = trusted_response(
+            ResponseSerializer(List[ExpenseResponse]), [_expense()], endpoint_response
+        )
+
+        assert isinstance(resp, FastJSONResponse)
+        assert resp.headers["ETag"] == 'W/"abc"'
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.body.startswith(b'[{"expenseId"')
+
+    def test_response_class_selection(self):
+        assert json_response_class(False) is TimedJSONResponse
+        assert json_response_class(True) is FastJSONResponse
+
+    def test_fast_mode_without_orjson_fails_at_startup(self):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(responses, "orjson", None)
+            assert json_response_class(False) is TimedJSONResponse
+            with pytest.raises(RuntimeError, match="orjson"):
+                json_response_class(True)
@@ -23,6 +23,7 @@ from tests.conftest import (
     FIXED_USER_ID,
     assert_error_shape,
 )
+from app.repositories.login_attempt_repository import LoginState
 from app.schemas.error_schemas import ErrorCodes
 from app.config import get_settings
 
@@ -89,16 +90,16 @@ class TestLoginLockout:
         from app.services.auth_service import AuthService
         self.mock_repo = Mock()
         self.mock_lockout_repo = Mock()
-        self.mock_lockout_repo.is_locked.return_value = False
-        # record_failure must return an object with attempt_count
-        _mock_attempt = Mock()
-        _mock_attempt.attempt_count = 1
-        self.mock_lockout_repo.record_failure.return_value = _mock_attempt
+        self.mock_lockout_repo.get_login_state.return_value = LoginState()
         self.service = AuthService(self.mock_repo, self.mock_lockout_repo)
         self.email = "lockout@example.com"
 
+    def _state(self, **kwargs):
+        kwargs.setdefault("user", make_user(email=self.email))
+        self.mock_lockout_repo.get_login_state.return_value = LoginState(**kwargs)
+
     def _make_failing_login(self):
-        self.mock_repo.get_by_email.return_value = make_user(email=self.email)
+        self._state()
         with patch("app.services.auth_service.verify_password", return_value=False):
             with pytest.raises(ValueError):
                 self.service.login_user(self.email, "wrongpassword")
@@ -106,35 +107,58 @@ class TestLoginLockout:
     def test_single_failure_does_not_lock(self):
         """One bad attempt should not trigger lockout."""
         self._make_failing_login()
-        self.mock_repo.get_by_email.return_value = make_user(email=self.email)
+        self._state(has_attempts=True)
         with patch("app.services.auth_service.verify_password", return_value=False):
             with pytest.raises(ValueError) as exc:
                 self.service.login_user(self.email, "wrongpassword")
         assert "Too many" not in str(exc.value)
 
     def test_lockout_triggers_after_max_attempts(self):
-        """If repo says locked, service raises before hitting DB."""
-        self.mock_lockout_repo.is_locked.return_value = True
-        with pytest.raises(ValueError) as exc:
-            self.service.login_user(self.email, "anypassword")
+        """If the row is locked, service raises before any credential work."""
+        self._state(
+            has_attempts=True,
+            locked_until=datetime.now(timezone.utc) + timedelta(minutes=5),
+        )
+        with patch("app.services.auth_service.verify_password") as verify:
+            with pytest.raises(ValueError) as exc:
+                self.service.login_user(self.email, "anypassword")
         assert "Too many" in str(exc.value)
         assert ErrorCodes.AUTH_INVALID_CREDENTIALS in str(exc.value)
-        self.mock_repo.get_by_email.assert_not_called()
+        verify.assert_not_called()
+        self.mock_lockout_repo.record_failure.assert_not_called()
+
+    def test_failure_passes_threshold_to_single_upsert(self):
+        """Counting and locking happen in one record_failure call."""
+        settings = get_settings()
+        self._make_failing_login()
+        self.mock_lockout_repo.record_failure.assert_called_once_with(
+            self.email,
+            settings.LOGIN_LOCKOUT_WINDOW_MINUTES,
+            settings.LOGIN_LOCKOUT_MAX_ATTEMPTS,
+        )
 
     def test_successful_login_clears_failure_counter(self):
-        """Successful login calls lockout_repo.clear."""
-        self.mock_repo.get_by_email.return_value = make_user(email=self.email)
+        """Successful login after failures calls lockout_repo.clear."""
+        self._state(has_attempts=True)
         with patch("app.services.auth_service.verify_password", return_value=True):
             with patch("app.services.auth_service.create_access_token", return_value="tok"):
                 self.service.login_user(self.email, "correctpassword")
         self.mock_lockout_repo.clear.assert_called_once_with(self.email)
 
+    def test_successful_login_without_failures_skips_delete(self):
+        """No attempt row means nothing to clear."""
+        self._state(has_attempts=False)
+        with patch("app.services.auth_service.verify_password", return_value=True):
+            with patch("app.services.auth_service.create_access_token", return_value="tok"):
+                self.service.login_user(self.email, "correctpassword")
+        self.mock_lockout_repo.clear.assert_not_called()
+
     def test_lockout_window_expires(self):
-        """Non-threshold DB failure count should not trigger lockout."""
-        self.mock_repo.get_by_email.return_value = make_user(email=self.email)
-        mock_row = Mock()
-        mock_row.attempt_count = 1
-        self.mock_lockout_repo.record_failure.return_value = mock_row
+        """A locked_until in the past no longer blocks login."""
+        self._state(
+            has_attempts=True,
+            locked_until=datetime.now(timezone.utc) - timedelta(seconds=1),
+        )
         with patch("app.services.auth_service.verify_password", return_value=False):
             with pytest.raises(ValueError) as exc:
                 self.service.login_user(self.email, "wrongpassword")
@@ -142,23 +166,22 @@ class TestLoginLockout:
 
     def test_nonexistent_user_still_records_failure(self):
         """Email not found still records a failure attempt."""
-        self.mock_repo.get_by_email.return_value = None
-        mock_row = Mock()
-        mock_row.attempt_count = 1
-        self.mock_lockout_repo.record_failure.return_value = mock_row
+        self._state(user=None)
         with pytest.raises(ValueError):
             self.service.login_user(self.email, "password")
         self.mock_lockout_repo.record_failure.assert_called_once()
 
     def test_lockout_is_per_email_not_global(self):
-        """is_locked is called with the specific email."""
+        """get_login_state is called with the specific email."""
         other_email = "other@example.com"
-        self.mock_repo.get_by_email.return_value = make_user(email=other_email)
+        self._state(user=make_user(email=other_email))
         with patch("app.services.auth_service.verify_password", return_value=True):
-            with patch("app.services.auth_service.create_access_token", return_value="tok"):
+            with patch(
+                "app.services.auth_service.create_access_token", return_value="tok"
+            ):
                 token = self.service.login_user(other_email, "correctpassword")
         assert token == "tok"
-        self.mock_lockout_repo.is_locked.assert_called_with(other_email)
+        self.mock_lockout_repo.get_login_state.assert_called_with(other_email)
 
 
 # ===========================================================================
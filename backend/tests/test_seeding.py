@@ -0,0 +1,100 @@
+"""Unit tests for the synthetic data generator and its COPY writer."""
+
+import csv
+import io
+import statistics
+from datetime import date
+from unittest.mock import MagicMock
+
+from app.seeding import CategorySpec, SeedSpec, copy_rows, generate_user, generate_users
+
+END = date(2024, 3, 15)
+
+
+def _spec(**overrides):
+    values = dict(users=50, months=6, end_date=END, seed=1, expenses_per_month=10)
+    values.update(overrides)
+    return SeedSpec(**values)
+
+
+class TestGenerateUsers:
+    def test_same_seed_same_data(self):
+        first = list(generate_users(_spec()))
+        second = list(generate_users(_spec()))
+        assert [(u.id, u.email, u.expenses, u.incomes, u.budgets) for u in first] == [
+            (u.id, u.email, u.expenses, u.incomes, u.budgets) for u in second
+        ]
+
+    def test_different_seed_differs(self):
+        assert (
+            generate_user(_spec(seed=1), 0).expenses
+            != generate_user(_spec(seed=2), 0).expenses
+        )
+
+    def test_user_independent_of_user_count(self):
+        assert (
+            generate_user(_spec(users=5), 3).expenses
+            == list(generate_users(_spec(users=50)))[3].expenses
+        )
+
+    def test_dates_within_history_and_not_after_end(self):
+        for user in generate_users(_spec()):
+            for row in user.expenses + user.incomes:
+                assert date(2023, 10, 1) <= row[4] <= END
+
+    def test_budgets_unique_per_month(self):
+        for user in generate_users(_spec()):
+            months = [budget[2] for budget in user.budgets]
+            assert len(months) == len(set(months))
+
+    def test_categories_and_amounts(self):
+        spec = _spec(
+            categories=(CategorySpec("Food", 1, 10.0), CategorySpec("Rent", 1, 1000.0))
+        )
+        rows = [row for user in generate_users(spec) for row in user.expenses]
+        assert {row[3] for row in rows} == {"Food", "Rent"}
+        food = statistics.median(float(row[2]) for row in rows if row[3] == "Food")
+        rent = statistics.median(float(row[2]) for row in rows if row[3] == "Rent")
+        assert food < 20 < 500 < rent
+        assert all(float(row[2]) >= 0.01 for row in rows)
+
+    def test_activity_is_heavy_tailed(self):
+        counts = [
+            len(u.expenses)
+            for u in generate_users(_spec(users=300, heavy_tail_alpha=1.2))
+        ]
+        assert max(counts) > 5 * statistics.median(counts)
+
+    def test_activity_is_capped(self):
+        users = list(
+            generate_users(_spec(users=300, heavy_tail_alpha=0.5, max_activity=3))
+        )
+        assert max(u.activity for u in users) <= 3
+
+
+class TestCopyRows:
+    def test_writes_csv_with_null_marker(self):
+        cursor = MagicMock()
+        captured = {}
+        cursor.copy_expert.side_effect = lambda sql, buf: captured.update(
+            sql=sql, body=buf.read()
+        )
+
+        count = copy_rows(
+            cursor, "expenses", ("id", "note"), [(1, None), (2, 'say "hi", ok')]
+        )
+
+        assert count == 2
+        assert (
+            captured["sql"]
+            == "COPY expenses (id, note) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+        assert list(csv.reader(io.StringIO(captured["body"]))) == [
+            ["1", "\\N"],
+            ["2", 'say "hi", ok'],
+        ]
+
+    def test_empty_rows_skip_copy(self):
+        cursor = MagicMock()
+        assert copy_rows(cursor, "expenses", ("id",), []) == 0
+        cursor.copy_expert.assert_not_called()
@@ -0,0 +1,155 @@
+"""Unit tests for the production launcher's worker and connection budgeting."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from app.config import Settings
+from app.server import (
+    ConnectionBudgetExceeded,
+    ServerPlan,
+    UnsafeWorkerConfig,
+    check_connection_budget,
+    check_multi_worker_settings,
+    connections_per_worker,
+    disable_worker_local_cache,
+    main,
+    resolve_workers,
+)
+
+
+def _settings(**overrides):
+    values = dict(
+        DB_POOL_SIZE=10,
+        DB_MAX_OVERFLOW=20,
+        WEB_CONCURRENCY=None,
+        REPORT_CACHE_ENABLED=False,
+        RATE_LIMIT_STORAGE_URL="postgresql://",
+        METRICS_TOKEN="",
+        RUN_DB_INIT=False,
+    )
+    values.update(overrides)
+    return Settings(**values)
+
+
+class TestResolveWorkers:
+    def test_override_wins(self):
+        assert resolve_workers(_settings(WEB_CONCURRENCY=3), override=6) == 6
+
+    def test_web_concurrency_setting(self):
+        assert resolve_workers(_settings(WEB_CONCURRENCY=3)) == 3
+
+    def test_defaults_to_cpu_count(self):
+        with patch("app.server.os.cpu_count", return_value=8):
+            assert resolve_workers(_settings()) == 8
+
+
+class TestConnectionsPerWorker:
+    def test_sync_pool_only(self):
+        settings = _settings(RATE_LIMIT_STORAGE_URL="memory://")
+        assert connections_per_worker(settings) == 30
+
+    def test_async_engine_adds_second_pool(self):
+        assert connections_per_worker(_settings(DATABASE_ASYNC_ENABLED=True)) == 60
+
+    def test_dedicated_rate_limit_database_counts(self):
+        settings = _settings(RATE_LIMIT_STORAGE_URL="postgresql://limits@db/limits")
+        assert connections_per_worker(settings) == 34
+
+    def test_shared_rate_limit_engine_is_free(self):
+        settings = _settings(RATE_LIMIT_STORAGE_URL="postgresql://")
+        assert connections_per_worker(settings) == 30
+
+
+class TestConnectionBudget:
+    def test_plan_within_budget(self):
+        check_connection_budget(ServerPlan(3, 30), max_connections=100, reserved=10)
+
+    def test_plan_over_budget_suggests_per_worker_cap(self):
+        with pytest.raises(ConnectionBudgetExceeded, match="at or below 22 per worker"):
+            check_connection_budget(ServerPlan(4, 30), max_connections=100, reserved=10)
+
+    def test_main_refuses_to_start_over_budget(self):
+        with patch("app.server.get_settings", return_value=_settings()), patch(
+            "app.server.fetch_max_connections", return_value=100
+        ), patch("uvicorn.run") as run:
+            assert main(["--workers", "8"]) == 1
+        run.assert_not_called()
+
+    def test_main_starts_workers(self):
+        with patch("app.server.get_settings", return_value=_settings()), patch(
+            "app.server.fetch_max_connections", return_value=200
+        ), patch("uvicorn.run") as run:
+            assert main(["--workers", "4"]) == 0
+        assert run.call_args.kwargs["workers"] == 4
+
+
+class TestMultiWorkerSettings:
+    def test_memory_rate_limits_are_refused_with_several_workers(self):
+        settings = _settings(
+            RATE_LIMIT_ENABLED=True, RATE_LIMIT_STORAGE_URL="memory://"
+        )
+        check_multi_worker_settings(settings, 1)
+        with pytest.raises(UnsafeWorkerConfig, match="RATE_LIMIT_STORAGE_URL"):
+            check_multi_worker_settings(settings, 2)
+        disabled = _settings(
+            RATE_LIMIT_ENABLED=False, RATE_LIMIT_STORAGE_URL="memory://"
+        )
+        check_multi_worker_settings(disabled, 2)
+
+    def test_memory_cache_is_disabled_with_several_workers(self, monkeypatch):
+        monkeypatch.setenv("REPORT_CACHE_ENABLED", "true")
+        settings = _settings(REPORT_CACHE_ENABLED=True, REPORT_CACHE_URL="memory://")
+        assert disable_worker_local_cache(settings, 1) is False
+        assert os.environ["REPORT_CACHE_ENABLED"] == "true"
+        assert disable_worker_local_cache(settings, 2) is True
+        assert os.environ["REPORT_CACHE_ENABLED"] == "false"
+
+    def test_shared_or_disabled_cache_is_kept(self, monkeypatch):
+        monkeypatch.setenv("REPORT_CACHE_ENABLED", "true")
+        redis = _settings(
+            REPORT_CACHE_ENABLED=True, REPORT_CACHE_URL="redis://r:6379/0"
+        )
+        assert disable_worker_local_cache(redis, 4) is False
+        assert disable_worker_local_cache(_settings(), 4) is False
+        assert os.environ["REPORT_CACHE_ENABLED"] == "true"
+
+    def test_metrics_endpoint_is_refused_with_several_workers(self):
+        settings = _settings(METRICS_ENABLED=True, METRICS_TOKEN="scrape-secret")
+        check_multi_worker_settings(settings, 1)
+        with pytest.raises(UnsafeWorkerConfig, match="METRICS_TOKEN"):
+            check_multi_worker_settings(settings, 2)
+        check_multi_worker_settings(_settings(METRICS_TOKEN=""), 2)
+
+    def test_main_refuses_memory_rate_limits_before_starting(self):
+        settings = _settings(
+            RATE_LIMIT_ENABLED=True, RATE_LIMIT_STORAGE_URL="memory://"
+        )
+        with patch("app.server.get_settings", return_value=settings), patch(
+            "uvicorn.run"
+        ) as run:
+            assert main(["--workers", "2"]) == 1
+        run.assert_not_called()
+
+    def test_main_starts_without_memory_cache(self, monkeypatch):
+        monkeypatch.setenv("REPORT_CACHE_ENABLED", "true")
+        settings = _settings(REPORT_CACHE_ENABLED=True, REPORT_CACHE_URL="memory://")
+        with patch("app.server.get_settings", return_value=settings), patch(
+            "app.server.fetch_max_connections", return_value=200
+        ), patch("uvicorn.run") as run:
+            assert main(["--workers", "2"]) == 0
+        assert os.environ["REPORT_CACHE_ENABLED"] == "false"
+        run.assert_called_once()
+
+    def test_main_runs_db_init_once_and_disables_it_for_workers(self, monkeypatch):
+        monkeypatch.setenv("RUN_DB_INIT", "true")
+        with patch(
+            "app.server.get_settings", return_value=_settings(RUN_DB_INIT=True)
+        ), patch("app.server.fetch_max_connections", return_value=200), patch(
+            "app.models.init_db"
+        ) as init_db, patch("uvicorn.run") as run:
+            assert main(["--workers", "4"]) == 0
+            assert os.environ["RUN_DB_INIT"] == "false"
+        init_db.assert_called_once()
+        run.assert_called_once()
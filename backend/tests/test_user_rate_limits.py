@@ -0,0 +1,191 @@
+"""
+Unit tests for per-user rate-limit keys and weighted route costs.
+
+Requests are built from raw ASGI scopes so the key function, the shared
+request.state token cache and the USER_RATE_LIMIT budget can be exercised
+without reloading the application.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from slowapi.errors import RateLimitExceeded
+from starlette.requests import Request
+
+from app import dependencies
+from app import rate_limiter
+from app.utils.security import create_access_token
+
+
+def _request(
+    path="/api/v1/budgets/current-month", token=None, state=None, route_path=None
+):
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": headers,
+        "client": ("203.0.113.7", 50000),
+        "state": state if state is not None else {},
+    }
+    if route_path is not None:
+        scope["route"] = SimpleNamespace(path=route_path)
+    return Request(scope)
+
+
+def _token(user_id):
+    return create_access_token(user_id, "limits@example.com")
+
+
+class TestRateLimitKey:
+    def test_authenticated_request_keyed_by_subject(self):
+        user_id = uuid4()
+
+        request = _request(token=_token(user_id))
+
+        assert rate_limiter.rate_limit_key(request) == f"user:{user_id}"
+
+    def test_anonymous_request_keyed_by_ip(self):
+        assert rate_limiter.rate_limit_key(_request()) == "203.0.113.7"
+
+    def test_invalid_token_falls_back_to_ip(self):
+        assert rate_limiter.rate_limit_key(_request(token="forged")) == "203.0.113.7"
+
+    def test_token_decoded_once_per_request(self):
+        state = {}
+        token = _token(uuid4())
+
+        with patch(
+            "app.rate_limiter.decode_access_token",
+            wraps=rate_limiter.decode_access_token,
+        ) as decode:
+            rate_limiter.rate_limit_key(_request(token=token, state=state))
+            rate_limiter.rate_limit_key(_request(token=token, state=state))
+
+        decode.assert_called_once_with(token)
+
+    def test_get_current_user_reuses_limiter_payload(self, monkeypatch):
+        user_id = uuid4()
+        state = {}
+        token = _token(user_id)
+        rate_limiter.rate_limit_key(_request(token=token, state=state))
+        decode = Mock()
+        monkeypatch.setattr(dependencies, "decode_access_token", decode)
+        monkeypatch.setattr(dependencies, "principal_cache", None)
+        auth_service = Mock()
+
+        token_data = dependencies.get_current_user(
+            token=token,
+            auth_service=auth_service,
+            request=_request(token=token, state=state),
+        )
+
+        assert token_data.user_id == user_id
+        decode.assert_not_called()
+
+
+class TestRouteCost:
+    def test_configured_route_uses_its_weight(self):
+        request = _request(
+            "/api/v1/reports/summary", route_path="/api/v1/reports/summary"
+        )
+
+        costs = rate_limiter.settings.RATE_LIMIT_ROUTE_COSTS
+        assert rate_limiter.route_cost(request) == costs["/reports/summary"]
+
+    def test_unlisted_api_route_costs_one(self):
+        request = _request(route_path="/api/v1/budgets/current-month")
+
+        assert rate_limiter.route_cost(request) == 1
+
+    def test_routes_outside_api_are_free(self):
+        assert rate_limiter.route_cost(_request("/health", route_path="/health")) == 0
+
+
+class TestUserBudget:
+    @pytest.fixture(autouse=True)
+    def _small_budget(self, monkeypatch):
+        monkeypatch.setattr(
+            rate_limiter, "_user_budget", rate_limiter.parse("10/minute")
+        )
+        monkeypatch.setattr(
+            rate_limiter.settings,
+            "RATE_LIMIT_ROUTE_COSTS",
+            {"/reports/summary": 5},
+        )
+        rate_limiter.limiter.reset()
+        yield
+        rate_limiter.limiter.reset()
+
+    def test_expensive_route_spends_budget_faster(self):
+        token = _token(uuid4())
+        summary = _request(
+            "/api/v1/reports/summary", token=token, route_path="/api/v1/reports/summary"
+        )
+        budgets = _request(token=token, route_path="/api/v1/budgets/current-month")
+
+        rate_limiter.enforce_user_budget(summary)
+        rate_limiter.enforce_user_budget(summary)
+
+        with pytest.raises(RateLimitExceeded):
+            rate_limiter.enforce_user_budget(budgets)
+
+    def test_budgets_are_per_user_not_per_ip(self):
+        route = "/api/v1/budgets/current-month"
+        first = _request(token=_token(uuid4()), route_path=route)
+        second = _request(token=_token(uuid4()), route_path=route)
+
+        for _ in range(10):
+            rate_limiter.enforce_user_budget(first)
+
+        with pytest.raises(RateLimitExceeded):
+            rate_limiter.enforce_user_budget(first)
+        rate_limiter.enforce_user_budget(second)
+
+
+class TestUserBudgetStorageErrors:
+    @pytest.fixture
+    def broken_storage(self, monkeypatch):
+        failing = Mock()
+        failing.hit.side_effect = ConnectionError("store down")
+        fallback = Mock()
+        fallback.hit.return_value = True
+        monkeypatch.setattr(rate_limiter.limiter, "_limiter", failing)
+        monkeypatch.setattr(rate_limiter.limiter, "_fallback_limiter", fallback)
+        monkeypatch.setattr(rate_limiter.limiter, "_storage_dead", False)
+        return failing, fallback
+
+    def _summary(self):
+        return _request(
+            "/api/v1/reports/summary",
+            token=_token(uuid4()),
+            route_path="/api/v1/reports/summary",
+        )
+
+    def test_falls_back_to_memory_when_store_fails(self, monkeypatch, broken_storage):
+        failing, fallback = broken_storage
+        monkeypatch.setattr(rate_limiter.limiter, "_in_memory_fallback_enabled", True)
+
+        rate_limiter.enforce_user_budget(self._summary())
+
+        assert rate_limiter.limiter._storage_dead is True
+        failing.hit.assert_called_once()
+        fallback.hit.assert_called_once()
+
+    def test_swallow_errors_lets_the_request_through(self, monkeypatch, broken_storage):
+        monkeypatch.setattr(rate_limiter.limiter, "_in_memory_fallback_enabled", False)
+        monkeypatch.setattr(rate_limiter.limiter, "_swallow_errors", True)
+
+        rate_limiter.enforce_user_budget(self._summary())
+
+    def test_error_is_raised_without_fallback_or_swallowing(
+        self, monkeypatch, broken_storage
+    ):
+        monkeypatch.setattr(rate_limiter.limiter, "_in_memory_fallback_enabled", False)
+        monkeypatch.setattr(rate_limiter.limiter, "_swallow_errors", False)
+
+        with pytest.raises(ConnectionError):
+            rate_limiter.enforce_user_budget(self._summary())